@@ -4,12 +4,14 @@
 from __future__ import annotations
 
 import os
+import subprocess
 import typing as t
 from collections.abc import Iterator
 from contextlib import contextmanager, nullcontext, suppress
 from functools import partial
 from pathlib import Path
-from shutil import copytree
+from shutil import copyfile, copytree
+from sys import executable as _python_executable
 from sys import implementation as _system_implementation
 from sys import stderr as _standard_error_stream
 from tempfile import TemporaryDirectory
@@ -48,6 +50,8 @@ from ._cython_configuration import (
     make_cythonize_cli_args_from_config as _make_cythonize_cli_args_from_config,
 )
 from ._cython_configuration import patched_env as _patched_cython_env
+from ._pgo import cythonize_with_pgo as _cythonize_with_pgo
+from ._pgo import is_supported as _is_pgo_supported
 from ._transformers import sanitize_rst_roles
 
 __all__ = (  # noqa: WPS410
@@ -86,6 +90,24 @@ BUILD_INPLACE_ENV_VAR = 'PROPCACHE_BUILD_INPLACE'
 PURE_PYTHON_ENV_VAR = 'PROPCACHE_NO_EXTENSIONS'
 """Environment variable name toggle used to opt out of making C-exts."""
 
+MYPYC_CONFIG_SETTING = 'with-mypyc'
+"""Config setting name toggle to also compile the mypyc backend."""
+
+MYPYC_ENV_VAR = 'PROPCACHE_BUILD_MYPYC'
+"""Environment variable name toggle to also compile the mypyc backend."""
+
+MYPYC_SOURCE_MODULE_PATH = Path('src') / 'propcache' / '_helpers_py.py'
+"""The typed pure-Python module that gets compiled with mypyc."""
+
+MYPYC_TARGET_MODULE_PATH = Path('src') / 'propcache' / '_helpers_mypyc.py'
+"""The temporary copy of the module mypyc builds the extension from."""
+
+PGO_CONFIG_SETTING = 'with-pgo'
+"""Config setting name toggle for profile-guided and LTO optimized C-exts."""
+
+PGO_ENV_VAR = 'PROPCACHE_BUILD_PGO'
+"""Environment variable name toggle for profile-guided and LTO C-exts."""
+
 IS_CPYTHON = _system_implementation.name == "cpython"
 """A flag meaning that the current interpreter implementation is CPython."""
 
@@ -154,6 +176,48 @@ def _build_inplace(
     )
 
 
+def _build_mypyc(
+        config_settings: _ConfigDict | None = None,
+        *,
+        default: bool = False,
+) -> bool:
+    return _get_setting_value(
+        config_settings,
+        MYPYC_CONFIG_SETTING,
+        MYPYC_ENV_VAR,
+        default=default,
+    )
+
+
+def _build_with_pgo(
+        config_settings: _ConfigDict | None = None,
+        *,
+        default: bool = False,
+) -> bool:
+    return _get_setting_value(
+        config_settings,
+        PGO_CONFIG_SETTING,
+        PGO_ENV_VAR,
+        default=default,
+    )
+
+
+def _compile_mypyc_extension() -> None:
+    """Compile the typed pure-Python helpers with mypyc.
+
+    The pure-Python module must stay importable as is, so mypyc is run
+    on a copy under a distinct module name that is removed afterwards,
+    leaving only the compiled ``_helpers_mypyc`` extension behind.
+    """
+    copyfile(MYPYC_SOURCE_MODULE_PATH, MYPYC_TARGET_MODULE_PATH)
+    try:
+        subprocess.check_call(
+            (_python_executable, '-m', 'mypyc', str(MYPYC_TARGET_MODULE_PATH)),
+        )
+    finally:
+        MYPYC_TARGET_MODULE_PATH.unlink()
+
+
 @contextmanager
 def patched_distutils_cmd_install() -> Iterator[None]:
     """Make `install_lib` of `install` cmd always use `platlib`.
@@ -273,6 +337,8 @@ def maybe_prebuild_c_extensions(
         default=line_trace_cython_when_unset,
     )
     is_pure_python_build = _make_pure_python(config_settings)
+    mypyc_build_requested = _build_mypyc(config_settings)
+    pgo_build_requested = _build_with_pgo(config_settings)
 
     if is_pure_python_build:
         print("*********************", file=_standard_error_stream)
@@ -289,6 +355,26 @@ def maybe_prebuild_c_extensions(
                 stacklevel=999,
             )
 
+        if pgo_build_requested:
+            _warn_that(
+                f'The `{PGO_CONFIG_SETTING !s}` setting requesting '
+                'profile-guided optimization is set, but building C-extensions '
+                'is not. This option will not have any effect for in the '
+                'pure-python build mode.',
+                RuntimeWarning,
+                stacklevel=999,
+            )
+
+        if mypyc_build_requested:
+            _warn_that(
+                f'The `{MYPYC_CONFIG_SETTING !s}` setting requesting '
+                'the mypyc backend is set, but building C-extensions is not. '
+                'This option will not have any effect for in the pure-python '
+                'build mode.',
+                RuntimeWarning,
+                stacklevel=999,
+            )
+
         yield
         return
 
@@ -308,6 +394,24 @@ def maybe_prebuild_c_extensions(
             stacklevel=999,
         )
 
+    if pgo_build_requested and cython_line_tracing_requested:
+        _warn_that(
+            f'The `{PGO_CONFIG_SETTING !s}` setting is ignored because '
+            'Cython line tracing is enabled, which would skew the profile.',
+            RuntimeWarning,
+            stacklevel=999,
+        )
+        pgo_build_requested = False
+
+    if pgo_build_requested and not _is_pgo_supported():
+        _warn_that(
+            f'The `{PGO_CONFIG_SETTING !s}` setting is ignored because '
+            'profile-guided optimization is only wired up for GCC and Clang.',
+            RuntimeWarning,
+            stacklevel=999,
+        )
+        pgo_build_requested = False
+
     original_src_dir = Path.cwd().resolve()
     build_dir_ctx = (
         nullcontext() if build_inplace
@@ -323,7 +427,12 @@ def maybe_prebuild_c_extensions(
                 original_source_directory=original_src_dir,
                 temporary_build_directory=tmp_build_dir,
         ):
-            _cythonize_cli_cmd(cythonize_args)  # type: ignore[no-untyped-call]
+            if pgo_build_requested:
+                _cythonize_with_pgo(_cythonize_cli_cmd, cythonize_args)
+            else:
+                _cythonize_cli_cmd(cythonize_args)  # type: ignore[no-untyped-call]
+            if mypyc_build_requested:
+                _compile_mypyc_extension()
         with patched_distutils_cmd_install():
             with patched_dist_has_ext_modules():
                 yield
@@ -414,6 +523,8 @@ def get_requires_for_build_wheel(
         c_ext_build_deps = []
     else:
         c_ext_build_deps = ['Cython >= 3.2.0']
+        if _build_mypyc(config_settings):
+            c_ext_build_deps.append('mypy >= 1.20.0')
 
     return _setuptools_get_requires_for_build_wheel(
         config_settings=config_settings,
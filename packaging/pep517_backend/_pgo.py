@@ -0,0 +1,244 @@
+# fmt: off
+"""Profile-guided and link-time optimized builds of the C-extensions."""
+
+from __future__ import annotations
+
+import os
+import shlex
+import subprocess
+import sys
+import sysconfig
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from shutil import which
+
+TRAINING_SCRIPT_PATH = Path(__file__).with_name('_pgo_training.py')
+"""The script exercising the freshly instrumented C-extensions."""
+
+_PROFILE_DATA_FILE_NAME = 'propcache.profdata'
+
+_INSTRUMENTATION_SYMBOL_PREFIXES = (b'__gcov_', b'__llvm_profile_')
+"""Symbols only instrumented GCC and Clang builds link in."""
+
+
+def is_supported() -> bool:
+    """Check whether the compiler toolchain understands the PGO flags."""
+    return sys.platform != 'win32'
+
+
+def _compiler() -> str:
+    return os.getenv('CC') or sysconfig.get_config_var('CC') or ''
+
+
+def _is_clang() -> bool:
+    return sys.platform == 'darwin' or 'clang' in _compiler()
+
+
+def _gcc_version() -> tuple[int, ...]:
+    """Return the version of GCC, or an empty tuple if it is unknown."""
+    compiler_cmd = shlex.split(_compiler()) or ['cc']
+    try:
+        version_txt = subprocess.check_output(
+            (*compiler_cmd, '-dumpfullversion', '-dumpversion'),
+            text=True,
+        )
+        return tuple(map(int, version_txt.strip().split('.')))
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return ()
+
+
+def _instrumentation_flags(profile_dir: Path) -> list[str]:
+    return [f'-fprofile-generate={profile_dir!s}']
+
+
+def _optimization_flags(profile_dir: Path) -> list[str]:
+    if _is_clang():
+        profile_path = profile_dir / _PROFILE_DATA_FILE_NAME
+        return [f'-fprofile-use={profile_path!s}', '-flto']
+    flags = [f'-fprofile-use={profile_dir!s}', '-fprofile-correction', '-flto']
+    if _gcc_version() >= (9,):
+        # Fail rather than silently build without the profile.
+        flags.append('-Werror=missing-profile')
+    return flags
+
+
+def _check_profile_collected(profile_dir: Path) -> None:
+    if not any(profile_dir.rglob('*.gcda')) and not any(profile_dir.glob('*.profraw')):
+        raise RuntimeError(
+            'The training workload did not produce any profile data '
+            f'in {profile_dir!s}.',
+        )
+
+
+def _source_paths(cythonize_args: list[str]) -> list[Path]:
+    """Return the sources matching the globs following ``--``."""
+    source_globs = cythonize_args[cythonize_args.index('--') + 1:]
+    return [
+        source_path
+        for source_glob in source_globs
+        for source_path in sorted(Path.cwd().glob(source_glob))
+    ]
+
+
+def _built_extension_paths(cythonize_args: list[str]) -> list[Path]:
+    """Return where ``cythonize`` puts the modules built from the sources.
+
+    Each module is copied next to its source from a ``build/lib.*``
+    directory created next to the top-level package, which ``distutils``
+    checks to decide whether to compile it again.
+    """
+    ext_suffix = sysconfig.get_config_var('EXT_SUFFIX')
+    extension_paths = []
+    for source_path in _source_paths(cythonize_args):
+        extension_path = source_path.with_suffix(ext_suffix)
+        extension_paths.append(extension_path)
+        base_dir = source_path.parent
+        while (base_dir / '__init__.py').is_file():
+            base_dir = base_dir.parent
+        extension_paths.extend(base_dir.glob(
+            f'build/lib*/{extension_path.relative_to(base_dir).as_posix()}',
+        ))
+    return extension_paths
+
+
+def _remove_built_extensions(extension_paths: Iterable[Path]) -> None:
+    for extension_path in extension_paths:
+        extension_path.unlink(missing_ok=True)
+
+
+def _check_not_instrumented(extension_paths: Iterable[Path]) -> None:
+    for extension_path in extension_paths:
+        if not extension_path.is_file():
+            raise RuntimeError(f'{extension_path!s} was not built.')
+        extension_bytes = extension_path.read_bytes()
+        if any(
+                symbol_prefix in extension_bytes
+                for symbol_prefix in _INSTRUMENTATION_SYMBOL_PREFIXES
+        ):
+            raise RuntimeError(
+                f'{extension_path!s} is still instrumented for profiling.',
+            )
+
+
+def _merge_clang_profiles(profile_dir: Path) -> None:
+    """Merge the raw profiles clang emits into one it can consume."""
+    llvm_profdata_cmd: tuple[str, ...] = (
+        ('xcrun', 'llvm-profdata') if which('llvm-profdata') is None
+        else ('llvm-profdata',)
+    )
+    subprocess.check_call((
+        *llvm_profdata_cmd,
+        'merge',
+        f'-output={profile_dir / _PROFILE_DATA_FILE_NAME !s}',
+        *map(str, profile_dir.glob('*.profraw')),
+    ))
+
+
+@contextmanager
+def _extra_compiler_flags(flags: list[str]) -> Iterator[None]:
+    orig_env = os.environ.copy()
+    for env_var_name in ('CFLAGS', 'LDFLAGS'):
+        os.environ[env_var_name] = ' '.join(
+            (os.getenv(env_var_name, ''), *flags),
+        ).strip()
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(orig_env)
+
+
+@contextmanager
+def _pinned_cythonize_build_temp(
+        build_temp_dir: Path,
+        source_paths: Iterable[Path],
+) -> Iterator[None]:
+    """Make ``cythonize`` compile objects in a known location.
+
+    ``cythonize`` picks a random temporary build directory on every call,
+    while GCC names the profile data files after the object file paths and
+    mixes them into the identifiers of the static functions in the
+    profile. Both builds must therefore put the objects at the same paths.
+    ``cythonize`` removes the directory after each build, and ``distutils``
+    does not create the directories it remembers creating again, so the
+    ones the objects go to, under the absolute source paths, are created
+    here.
+    """
+    orig_mkdtemp = tempfile.mkdtemp
+    object_dirs = [
+        build_temp_dir / source_path.parent.relative_to(source_path.anchor)
+        for source_path in source_paths
+    ]
+
+    def _mkdtemp(*args: object, **kwargs: object) -> str:
+        build_temp_dir.mkdir(parents=True, exist_ok=True)
+        for object_dir in object_dirs:
+            object_dir.mkdir(parents=True, exist_ok=True)
+        return str(build_temp_dir)
+
+    tempfile.mkdtemp = _mkdtemp  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        tempfile.mkdtemp = orig_mkdtemp
+
+
+def _run_training_workload(source_dir: Path) -> None:
+    training_env = os.environ.copy()
+    training_env['PYTHONPATH'] = os.pathsep.join(
+        (str(source_dir / 'src'), training_env.get('PYTHONPATH', '')),
+    ).rstrip(os.pathsep)
+    subprocess.check_call(
+        (sys.executable, str(TRAINING_SCRIPT_PATH)),
+        env=training_env,
+    )
+
+
+def cythonize_with_pgo(
+        cythonize_cli_cmd: Callable[[list[str]], None],
+        cythonize_args: list[str],
+) -> None:
+    """Build the C-extensions twice, training them in between.
+
+    The first build is instrumented. The cache hit and miss workloads are
+    then run against it, and the collected profile drives the final build,
+    which also enables link-time optimization. The instrumented modules
+    are removed in between so that ``distutils`` cannot consider them up
+    to date, and the build fails if the final modules are instrumented.
+
+    :param cythonize_cli_cmd: The ``cythonize`` CLI entry point.
+    :param cythonize_args: CLI arguments for the ``cythonize`` calls.
+    """
+    # Both builds must compile, even when the C sources did not change.
+    forced_cythonize_args = ['--force', *cythonize_args]
+    source_dir = Path.cwd()
+
+    source_paths = _source_paths(cythonize_args)
+
+    with tempfile.TemporaryDirectory(prefix='.tmp-propcache-pgo-') as tmp_dir:
+        profile_dir = Path(tmp_dir) / 'profile'
+        build_temp_dir = Path(tmp_dir) / 'build'
+
+        with (
+                _pinned_cythonize_build_temp(build_temp_dir, source_paths),
+                _extra_compiler_flags(_instrumentation_flags(profile_dir)),
+        ):
+            cythonize_cli_cmd(forced_cythonize_args)
+
+        _run_training_workload(source_dir)
+        _check_profile_collected(profile_dir)
+        if _is_clang():
+            _merge_clang_profiles(profile_dir)
+
+        # The instrumented modules are newer than the C sources when
+        # ``cythonize`` leaves those untouched.
+        _remove_built_extensions(_built_extension_paths(cythonize_args))
+
+        with (
+                _pinned_cythonize_build_temp(build_temp_dir, source_paths),
+                _extra_compiler_flags(_optimization_flags(profile_dir)),
+        ):
+            cythonize_cli_cmd(forced_cythonize_args)
+        _check_not_instrumented(_built_extension_paths(cythonize_args))
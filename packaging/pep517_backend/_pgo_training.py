@@ -0,0 +1,50 @@
+"""Training workload for profile-guided builds of the C-extensions.
+
+It mirrors the cache hit and miss benchmarks in ``tests/test_benchmarks.py``
+so the collected profile reflects the paths that matter at runtime.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from propcache._helpers_py import cached_property, under_cached_property
+else:
+    from propcache._helpers_c import cached_property, under_cached_property
+
+ITERATIONS = 100_000
+
+
+class UnderCached:
+    def __init__(self) -> None:
+        self._cache: dict[str, int] = {}
+
+    @under_cached_property
+    def prop(self) -> int:
+        return 42
+
+
+class Cached:
+    @cached_property
+    def prop(self) -> int:
+        return 42
+
+
+def run_training_workload() -> None:
+    """Exercise the cache miss and hit paths of both descriptors."""
+    under_cached = UnderCached()
+    under_cache = under_cached._cache
+    cached = Cached()
+    cache = cached.__dict__
+
+    for _ in range(ITERATIONS):
+        under_cache.pop("prop", None)
+        under_cached.prop
+        under_cached.prop
+
+        cache.pop("prop", None)
+        cached.prop
+        cached.prop
+
+
+if __name__ == "__main__":
+    run_training_workload()
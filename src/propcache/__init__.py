@@ -2,7 +2,34 @@
 
 from typing import TYPE_CHECKING
 
-_PUBLIC_API = ("cached_property", "under_cached_property")
+_PUBLIC_API = (
+    "BoundedCache",
+    "CacheFreePickleMixin",
+    "CacheSnapshot",
+    "FrozenCache",
+    "cache_free_state",
+    "cached_getter",
+    "cached_properties",
+    "cached_property",
+    "context_cached_property",
+    "deferred_cached_property",
+    "deferred_under_cached_property",
+    "freeze",
+    "inline_cached_properties",
+    "is_not_none",
+    "mirrored_under_cached_property",
+    "new_context_cache",
+    "persistent_cached_property",
+    "prefork_warm",
+    "propagate_cache",
+    "side_cached_property",
+    "start_deferred",
+    "thread_cached_property",
+    "under_cached_property",
+    "warm",
+    "weak_cached_property",
+    "weak_under_cached_property",
+)
 
 __version__ = "0.5.2"
 __all__ = ()
@@ -10,8 +37,42 @@ __all__ = ()
 # Imports have moved to `propcache.api` in 0.2.0+.
 # This module is now a facade for the API.
 if TYPE_CHECKING:
+    from .api import BoundedCache as BoundedCache  # noqa: F401
+    from .api import CacheFreePickleMixin as CacheFreePickleMixin  # noqa: F401
+    from .api import CacheSnapshot as CacheSnapshot  # noqa: F401
+    from .api import FrozenCache as FrozenCache  # noqa: F401
+    from .api import cache_free_state as cache_free_state  # noqa: F401
+    from .api import cached_getter as cached_getter  # noqa: F401
+    from .api import cached_properties as cached_properties  # noqa: F401
     from .api import cached_property as cached_property  # noqa: F401
+    from .api import context_cached_property as context_cached_property  # noqa: F401
+    from .api import (  # noqa: F401
+        deferred_cached_property as deferred_cached_property,
+    )
+    from .api import (  # noqa: F401
+        deferred_under_cached_property as deferred_under_cached_property,
+    )
+    from .api import freeze as freeze  # noqa: F401
+    from .api import inline_cached_properties as inline_cached_properties  # noqa: F401
+    from .api import is_not_none as is_not_none  # noqa: F401
+    from .api import (  # noqa: F401
+        mirrored_under_cached_property as mirrored_under_cached_property,
+    )
+    from .api import new_context_cache as new_context_cache  # noqa: F401
+    from .api import (  # noqa: F401
+        persistent_cached_property as persistent_cached_property,
+    )
+    from .api import prefork_warm as prefork_warm  # noqa: F401
+    from .api import propagate_cache as propagate_cache  # noqa: F401
+    from .api import side_cached_property as side_cached_property  # noqa: F401
+    from .api import start_deferred as start_deferred  # noqa: F401
+    from .api import thread_cached_property as thread_cached_property  # noqa: F401
     from .api import under_cached_property as under_cached_property  # noqa: F401
+    from .api import warm as warm  # noqa: F401
+    from .api import weak_cached_property as weak_cached_property  # noqa: F401
+    from .api import (  # noqa: F401
+        weak_under_cached_property as weak_under_cached_property,
+    )
 
 
 def _import_facade(attr: str) -> object:
@@ -0,0 +1,114 @@
+"""A size-bounded ``_cache`` dictionary."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar, overload
+
+__all__ = ("BoundedCache",)
+
+_T = TypeVar("_T")
+_NOT_FOUND = object()
+# Hits are on the attribute access path, so skip the ``super()`` and
+# method lookups there.
+_dict_getitem = dict.__getitem__
+_move_to_end = OrderedDict.move_to_end
+
+
+class BoundedCache(OrderedDict[str, Any]):
+    """A ``_cache`` dictionary evicting the least recently used entries.
+
+    The budget is a number of entries, ``maxsize``, a total ``maxweight``
+    of the values as measured by the ``weight`` function, or both.
+    Whenever storing a value exceeds the budget, the least recently used
+    entries are evicted until it fits again.  A value weighing more than
+    the whole budget is therefore not kept at all.
+
+    Cache hits move the entry to the end of the eviction order, which the
+    descriptors only do for caches that are not plain ``dict`` objects,
+    so instances using a regular ``dict`` do not pay for it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        maxweight: float | None = None,
+        weight: Callable[[Any], float] | None = None,
+    ) -> None:
+        if (maxweight is None) != (weight is None):
+            raise TypeError("maxweight and weight must be passed together")
+        super().__init__()
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weight = weight
+        self._weights: dict[str, float] = {}
+        self._total_weight: float = 0
+
+    def __getitem__(self, key: str) -> Any:
+        value = _dict_getitem(self, key)
+        _move_to_end(self, key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self:
+            del self[key]
+        super().__setitem__(key, value)
+        if self.weight is not None:
+            weight = self.weight(value)
+            self._weights[key] = weight
+            self._total_weight += weight
+        self._evict()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._total_weight -= self._weights.pop(key, 0)
+
+    @overload
+    def pop(self, key: str) -> Any: ...
+
+    @overload
+    def pop(self, key: str, default: _T) -> Any | _T: ...
+
+    def pop(self, key: str, default: object = _NOT_FOUND) -> Any:
+        if key not in self:
+            if default is _NOT_FOUND:
+                raise KeyError(key)
+            return default
+        value = _dict_getitem(self, key)
+        del self[key]
+        return value
+
+    def popitem(self, last: bool = True) -> tuple[str, Any]:
+        key, value = super().popitem(last)
+        self._total_weight -= self._weights.pop(key, 0)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._weights.clear()
+        self._total_weight = 0
+
+    def copy(self) -> BoundedCache:
+        new = self.__class__(self.maxsize, self.maxweight, self.weight)
+        for key, value in self.items():
+            new[key] = value
+        return new
+
+    def __reduce__(self) -> Any:
+        return (
+            self.__class__,
+            (self.maxsize, self.maxweight, self.weight),
+            None,
+            None,
+            iter(self.items()),
+        )
+
+    def _evict(self) -> None:
+        maxsize = self.maxsize
+        maxweight = self.maxweight
+        while self and (
+            (maxsize is not None and len(self) > maxsize)
+            or (maxweight is not None and self._total_weight > maxweight)
+        ):
+            self.popitem(last=False)
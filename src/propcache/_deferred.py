@@ -0,0 +1,153 @@
+"""Cached values computed in the background from the creation of instances."""
+
+from __future__ import annotations
+
+import functools
+import weakref
+from collections.abc import Callable, MutableMapping
+from concurrent.futures import Executor, Future
+from typing import Any, Generic, TypeVar, cast
+
+from ._helpers import cached_properties, cached_property, under_cached_property
+
+__all__ = (
+    "deferred_cached_property",
+    "deferred_under_cached_property",
+    "start_deferred",
+)
+
+_T = TypeVar("_T")
+_FUTURE_SUFFIX = ".future"
+
+
+class _Pending:
+    """A value being computed by an executor, until its first read."""
+
+    __slots__ = ("future",)
+
+    def __init__(self, future: Future[Any] | None) -> None:
+        self.future = future
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Futures cannot be pickled, so copies compute the value themselves,
+        # as with instances passed to the workers of a process pool.
+        return (_Pending, (None,))
+
+
+class _Deferred(Generic[_T]):
+    """The method of a deferred property, reading the pending value first."""
+
+    def __init__(
+        self, func: Callable[[Any], _T], executor: Executor, in_cache: bool
+    ) -> None:
+        self.func = func
+        self.executor = executor
+        self.in_cache = in_cache
+        self.key = func.__name__ + _FUTURE_SUFFIX
+        functools.update_wrapper(self, func)
+
+    def store(self, inst: Any) -> MutableMapping[str, Any]:
+        if self.in_cache:
+            return inst._cache  # type: ignore[no-any-return]
+        return inst.__dict__  # type: ignore[no-any-return]
+
+    def __call__(self, inst: Any) -> _T:
+        store = self.store(inst)
+        pending = store.get(self.key)
+        if pending is None:
+            return self.func(inst)
+        try:
+            if pending.future is None:
+                return self.func(inst)
+            return pending.future.result()  # type: ignore[no-any-return]
+        finally:
+            store.pop(self.key, None)
+
+
+def deferred_cached_property(
+    executor: Executor,
+) -> Callable[[Callable[[Any], _T]], cached_property[_T]]:
+    """Return a decorator computing values in the background on ``executor``.
+
+    The decorated method becomes a `cached_property`, whose value starts
+    being computed on ``executor`` once `start_deferred` is called for the
+    instance, usually at the end of ``__init__``.  The first read waits
+    for the value, or raises the exception the method raised, and caches
+    it as usual, so later reads are plain hits.  Until then, the pending
+    value is kept in the instance dict under the name followed by
+    ``".future"``.
+    """
+
+    def decorator(func: Callable[[Any], _T]) -> cached_property[_T]:
+        return cached_property(_Deferred(func, executor, in_cache=False))
+
+    return decorator
+
+
+def deferred_under_cached_property(
+    executor: Executor,
+) -> Callable[[Callable[[Any], _T]], under_cached_property[_T]]:
+    """Return a decorator computing values in the background on ``executor``.
+
+    Like `deferred_cached_property`, but the decorated method becomes an
+    `under_cached_property`, and the pending value is kept in the
+    instance's ``_cache`` mapping.
+    """
+
+    def decorator(func: Callable[[Any], _T]) -> under_cached_property[_T]:
+        return under_cached_property(_Deferred(func, executor, in_cache=True))
+
+    return decorator
+
+
+# The deferred properties of each class `start_deferred` has seen, as the
+# attribute name, the cache key and a weak reference to the method, which
+# would otherwise keep its class alive when it refers to it, as methods
+# calling ``super()`` do.
+_Plan = tuple[tuple[str, str, "weakref.ref[_Deferred[Any]]"], ...]
+_plans: weakref.WeakKeyDictionary[type, _Plan] = weakref.WeakKeyDictionary()
+
+
+def _plan(cls: type) -> _Plan:
+    plan = _plans.get(cls)
+    if plan is None:
+        props = []
+        for attr, prop in cached_properties(cls).items():
+            if isinstance(prop, cached_property):
+                func = prop.func
+                name = attr
+            else:
+                func = prop.wrapped
+                name = func.__name__
+            if isinstance(func, _Deferred):
+                props.append((attr, name, weakref.ref(func)))
+        plan = _plans[cls] = tuple(props)
+    return plan
+
+
+def _compute(cls: type, attr: str, inst: Any) -> Any:
+    # Runs on the executor.  The method is found from the class, which
+    # pickles by name, for the workers of process pools.
+    prop = getattr(cls, attr)
+    func = prop.func if isinstance(prop, cached_property) else prop.wrapped
+    return cast("_Deferred[Any]", func).func(inst)
+
+
+def start_deferred(inst: object) -> None:
+    """Start computing the values of the deferred properties of ``inst``.
+
+    Values already cached or being computed are left alone.  Instances
+    sent to the workers of a process pool are pickled without the pending
+    values.
+    """
+    cls = type(inst)
+    for attr, name, deferred_ref in _plan(cls):
+        deferred = deferred_ref()
+        if deferred is None:
+            # The property was removed from the class.
+            continue
+        store = deferred.store(inst)
+        if name in store or deferred.key in store:
+            continue
+        future = deferred.executor.submit(_compute, cls, attr, inst)
+        store[deferred.key] = _Pending(future)
@@ -0,0 +1,56 @@
+"""An immutable ``_cache`` dictionary for instances shared between threads."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, NoReturn, Union
+
+__all__ = ("FrozenCache", "freeze")
+
+_Values = Union[Mapping[str, Any], Iterable[tuple[str, Any]]]
+
+
+class FrozenCache(dict[str, Any]):
+    """A ``_cache`` dictionary that is never modified.
+
+    Reads are those of a regular ``dict``, and since nothing writes to it
+    they are never contended between threads.  Every modification raises
+    `TypeError`, which the descriptors ignore when storing a value they
+    computed on a miss, so misses are computed again on each read.  Unless
+    ``strict`` is false, a miss raises `RuntimeError` instead of computing
+    the value.
+    """
+
+    __slots__ = ("strict",)
+
+    def __init__(self, values: _Values = (), strict: bool = False) -> None:
+        super().__init__(values)
+        self.strict = strict
+
+    def __missing__(self, key: str) -> NoReturn:
+        if self.strict:
+            raise RuntimeError(f"{key!r} is not cached and the cache is frozen")
+        raise KeyError(key)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = (
+        update
+    ) = _immutable
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (dict(self), self.strict))
+
+
+def freeze(inst: Any, *, strict: bool = False) -> None:
+    """Replace the ``_cache`` dictionary of ``inst`` with a `FrozenCache`.
+
+    Call it once the values an instance shares with other threads are
+    cached, for example with `warm`, so that reading them never contends
+    with a thread storing a value.  Passing ``strict=True`` makes reading
+    a value that is not cached raise `RuntimeError`.  The values of
+    `cached_property` live in the instance dict, which the interpreter
+    reads directly, and are not affected.
+    """
+    inst._cache = FrozenCache(inst._cache, strict)
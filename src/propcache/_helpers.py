@@ -1,39 +1,72 @@
+import importlib
 import os
 import sys
 from typing import TYPE_CHECKING
 
-__all__ = ("cached_property", "under_cached_property")
+__all__ = (
+    "cached_getter",
+    "cached_properties",
+    "cached_property",
+    "context_cached_property",
+    "inline_cached_properties",
+    "is_not_none",
+    "mirrored_under_cached_property",
+    "new_context_cache",
+    "propagate_cache",
+    "side_cached_property",
+    "thread_cached_property",
+    "under_cached_property",
+    "warm",
+    "weak_cached_property",
+    "weak_under_cached_property",
+)
+# The helpers of the backend shared with the other modules of the package.
+_PRIVATE_NAMES = ("_registered_properties",)
 
 
 NO_EXTENSIONS = bool(os.environ.get("PROPCACHE_NO_EXTENSIONS"))  # type: bool
 if sys.implementation.name != "cpython":
     NO_EXTENSIONS = True
 
+# The mypyc backend is only built on request, so it is opt-in at runtime too.
+USE_MYPYC = bool(os.environ.get("PROPCACHE_USE_MYPYC"))  # type: bool
+
 
-# isort: off
 if TYPE_CHECKING:
-    from ._helpers_py import cached_property as cached_property_py
-    from ._helpers_py import under_cached_property as under_cached_property_py
-
-    cached_property = cached_property_py
-    under_cached_property = under_cached_property_py
-elif not NO_EXTENSIONS:  # pragma: no branch
-    try:
-        from ._helpers_c import cached_property as cached_property_c  # type: ignore[attr-defined, unused-ignore]
-        from ._helpers_c import under_cached_property as under_cached_property_c  # type: ignore[attr-defined, unused-ignore]
-
-        cached_property = cached_property_c
-        under_cached_property = under_cached_property_c
-    except ImportError:  # pragma: no cover
-        from ._helpers_py import cached_property as cached_property_py
-        from ._helpers_py import under_cached_property as under_cached_property_py
-
-        cached_property = cached_property_py  # type: ignore[assignment, misc]
-        under_cached_property = under_cached_property_py
+    from ._helpers_py import _registered_properties as _registered_properties
+    from ._helpers_py import (
+        cached_getter,
+        cached_properties,
+        cached_property,
+        context_cached_property,
+        inline_cached_properties,
+        is_not_none,
+        mirrored_under_cached_property,
+        new_context_cache,
+        propagate_cache,
+        side_cached_property,
+        thread_cached_property,
+        under_cached_property,
+        warm,
+        weak_cached_property,
+        weak_under_cached_property,
+    )
 else:
-    from ._helpers_py import cached_property as cached_property_py
-    from ._helpers_py import under_cached_property as under_cached_property_py
 
-    cached_property = cached_property_py  # type: ignore[assignment, misc]
-    under_cached_property = under_cached_property_py
-# isort: on
+    def _load(module_name: str) -> None:
+        """Bind the names of ``__all__`` to those of the given backend."""
+        module = importlib.import_module(module_name, __package__)
+        names = (*__all__, *_PRIVATE_NAMES)
+        globals().update({name: getattr(module, name) for name in names})
+
+    if NO_EXTENSIONS:
+        _load("._helpers_py")
+    elif USE_MYPYC:
+        # Requested explicitly, so a missing build is an error rather than a
+        # silent fallback to the pure-Python backend.
+        _load("._helpers_mypyc")
+    else:
+        try:
+            _load("._helpers_c")
+        except ImportError:  # pragma: no cover
+            _load("._helpers_py")
@@ -0,0 +1,196 @@
+# cython: language_level=3
+"""Cython-level API of the accelerated property caches.
+
+Other Cython extensions can ``cimport`` the descriptor types and the inline
+helpers below to read and populate cached values without going through the
+Python descriptor protocol::
+
+    from propcache._helpers_c cimport under_cached_property
+    from propcache._helpers_c cimport under_cached_property_get
+
+Extensions written in C can use the same functions through the capsules
+exported in ``propcache._helpers_c.__pyx_capi__`` by including the
+generated ``propcache/_helpers_c_api.h`` header and calling
+``import_propcache___helpers_c()`` once.
+"""
+
+from cpython.dict cimport PyDict_CheckExact, PyDict_GetItem
+from cpython.object cimport PyObject
+
+
+cdef extern from "Python.h":
+    # Call a callable Python object callable with exactly
+    # 1 positional argument arg and no keyword arguments.
+    # Return the result of the call on success, or raise
+    # an exception and return NULL on failure.
+    PyObject* PyObject_CallOneArg(
+        object callable, object arg
+    ) except NULL
+    int PyDict_SetItem(
+        object dict, object key, PyObject* value
+    ) except -1
+    void Py_DECREF(PyObject*)
+
+
+cdef extern from *:
+    """
+    /* Where the ``_cache`` attribute lives for the last seen owner type,
+       kept up to date by ``cache_slot``. ``offset`` is negative once it
+       is known to be read by name. */
+    typedef struct {
+        PyTypeObject *type;
+        unsigned int version;
+        Py_ssize_t offset;
+    } propcache_cache_location;
+    """
+    ctypedef struct propcache_cache_location:
+        Py_ssize_t offset
+
+
+cdef PyObject* cache_slot(propcache_cache_location* loc, object inst)
+
+
+cdef inline object get_cache(propcache_cache_location* loc, object inst):
+    """Return ``inst._cache``, reading its slot directly when possible."""
+    cdef PyObject* cache
+    if loc.offset >= 0:
+        cache = cache_slot(loc, inst)
+        if cache is not NULL:
+            return <object>cache
+    return inst._cache
+
+
+cdef class under_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+    cdef propcache_cache_location cache_location
+    cdef readonly tuple cache_exceptions
+    cdef readonly object exception_ttl
+    cdef readonly object cache_if
+    cdef bint cache_if_not_none
+    # Whether ``cache_exceptions`` or ``cache_if`` is set, checked once
+    # on the hit path.
+    cdef bint has_options
+    cdef readonly bint writable
+    cdef readonly frozenset depends_on
+
+
+cdef class mirrored_under_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+    cdef propcache_cache_location cache_location
+
+
+cdef class side_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+
+
+cdef class context_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+
+
+cdef class thread_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+
+
+cdef class weak_under_cached_property:
+    cdef readonly object wrapped
+    cdef object name
+    cdef propcache_cache_location cache_location
+
+
+cdef class cached_property:
+    cdef readonly object func
+    cdef object name
+    cdef readonly tuple cache_exceptions
+    cdef readonly object exception_ttl
+    cdef readonly object cache_if
+    cdef bint cache_if_not_none
+    cdef readonly frozenset depends_on
+
+
+cdef class weak_cached_property:
+    cdef readonly object func
+    cdef object name
+
+    cdef object check_name(self)
+
+
+cdef object under_cached_property_get_with_options(
+    under_cached_property prop, object inst
+)
+cdef object cached_property_get_with_options(
+    cached_property prop, object inst
+)
+
+
+cdef extern from *:
+    """
+    /* Whether ``cache[key]`` is a plain dict lookup, as for the dict
+       subclasses not overriding ``__getitem__``, like ``FrozenCache``. */
+    static inline int
+    propcache_dict_reads(PyObject *cache)
+    {
+        return PyDict_Check(cache)
+            && Py_TYPE(cache)->tp_as_mapping->mp_subscript
+                == PyDict_Type.tp_as_mapping->mp_subscript;
+    }
+    """
+    bint propcache_dict_reads(object cache)
+
+
+cdef object cache_get_miss(object cache, object name, object func, object inst)
+
+
+cdef inline object cache_get(object cache, object name, object func, object inst):
+    """Return ``cache[name]``, storing ``func(inst)`` there on a miss."""
+    cdef PyObject* val
+    if PyDict_CheckExact(cache):
+        val = PyDict_GetItem(cache, name)
+        if val is not NULL:
+            return <object>val
+    return cache_get_miss(cache, name, func, inst)
+
+
+cdef inline object under_cached_property_get(
+    under_cached_property prop, object inst
+):
+    """Return the value of ``prop`` for ``inst``, computing it on a miss."""
+    if prop.has_options:
+        return under_cached_property_get_with_options(prop, inst)
+    return cache_get(
+        get_cache(&prop.cache_location, inst), prop.name, prop.wrapped, inst
+    )
+
+
+cdef inline int under_cached_property_set(
+    under_cached_property prop, object inst, object value
+) except -1:
+    """Store ``value`` as the cached value of ``prop`` for ``inst``."""
+    inst._cache[prop.name] = value
+    return 0
+
+
+cdef inline object cached_property_get(cached_property prop, object inst):
+    """Return the value of ``prop`` for ``inst``, computing it on a miss."""
+    if prop.name is None:
+        raise TypeError(
+            "Cannot use cached_property instance"
+            " without calling __set_name__ on it.")
+    if prop.cache_exceptions or prop.cache_if is not None:
+        return cached_property_get_with_options(prop, inst)
+    return cache_get(inst.__dict__, prop.name, prop.func, inst)
+
+
+cdef inline int cached_property_set(
+    cached_property prop, object inst, object value
+) except -1:
+    """Store ``value`` as the cached value of ``prop`` for ``inst``."""
+    if prop.name is None:
+        raise TypeError(
+            "Cannot use cached_property instance"
+            " without calling __set_name__ on it.")
+    return PyDict_SetItem(inst.__dict__, prop.name, <PyObject*>value)
@@ -1,22 +1,127 @@
 # cython: language_level=3, freethreading_compatible=True
+from contextvars import ContextVar
+from functools import partial
+from operator import attrgetter
+from threading import local
+from time import monotonic
 from types import GenericAlias
+from weakref import WeakKeyDictionary, ref
 
-from cpython.dict cimport PyDict_GetItem
-from cpython.object cimport PyObject
+from cpython.contextvars cimport get_value
+from cpython.dict cimport PyDict_GetItemWithError
+from cpython.long cimport PyLong_AsVoidPtr, PyLong_FromVoidPtr
+from cpython.object cimport PyObject_GenericSetAttr
+from cpython.ref cimport Py_INCREF
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 
 
-cdef extern from "Python.h":
-    # Call a callable Python object callable with exactly
-    # 1 positional argument arg and no keyword arguments.
-    # Return the result of the call on success, or raise
-    # an exception and return NULL on failure.
-    PyObject* PyObject_CallOneArg(
-        object callable, object arg
-    ) except NULL
-    int PyDict_SetItem(
-        object dict, object key, PyObject* value
-    ) except -1
-    void Py_DECREF(PyObject*)
+cdef extern from *:
+    """
+    #ifndef Py_T_OBJECT_EX
+    #include <structmember.h>
+    #define Py_T_OBJECT_EX T_OBJECT_EX
+    #define Py_AUDIT_READ READ_RESTRICTED
+    #endif
+
+    /* ``offset`` is 0 until the location is first updated, the offset of
+       the ``_cache`` slot of ``type`` when it is a plain slot, and -1
+       once an owner type without such a slot is seen, so that ``_cache``
+       is read by name from then on without checking the type. The type
+       is validated by its version tag, which changes whenever the type or
+       any of its bases is modified. The location is not shared safely
+       between threads without the GIL. */
+    #ifndef Py_GIL_DISABLED
+    static void
+    propcache_cache_location_update(
+        propcache_cache_location *loc, PyTypeObject *tp, PyObject *name)
+    {
+        loc->type = NULL;
+        loc->offset = -1;
+        if (tp->tp_getattro != PyObject_GenericGetAttr) {
+            return;
+        }
+        /* Borrowed reference, also assigns a version tag to the type. */
+        PyObject *descr = _PyType_Lookup(tp, name);
+        if (!(tp->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG)
+                || descr == NULL || !Py_IS_TYPE(descr, &PyMemberDescr_Type)) {
+            return;
+        }
+        PyMemberDef *member = ((PyMemberDescrObject *)descr)->d_member;
+        if (member->type == Py_T_OBJECT_EX && !(member->flags & Py_AUDIT_READ)) {
+            loc->offset = member->offset;
+            loc->version = tp->tp_version_tag;
+            loc->type = tp;
+        }
+    }
+    #endif
+
+    /* Return a borrowed reference to the ``_cache`` slot of ``inst``, or
+       NULL when it is not known to be a plain slot or is not set. */
+    static inline PyObject *
+    propcache_cache_slot(
+        propcache_cache_location *loc, PyObject *inst, PyObject *name)
+    {
+    #ifndef Py_GIL_DISABLED
+        if (loc->offset >= 0) {
+            PyTypeObject *tp = Py_TYPE(inst);
+            if (loc->type != tp || loc->version != tp->tp_version_tag) {
+                propcache_cache_location_update(loc, tp, name);
+            }
+            if (loc->offset > 0) {
+                return *(PyObject **)((char *)inst + loc->offset);
+            }
+        }
+    #endif
+        return NULL;
+    }
+    """
+    PyObject* propcache_cache_slot(
+        propcache_cache_location* loc, object inst, object name
+    )
+
+
+cdef PyObject* cache_slot(propcache_cache_location* loc, object inst):
+    """Return the ``_cache`` slot of ``inst``, or NULL to read it by name."""
+    return propcache_cache_slot(loc, inst, "_cache")
+
+
+cdef object cache_get_miss(object cache, object name, object func, object inst):
+    """Return ``cache[name]`` once it is not found by a plain dict lookup.
+
+    Caches which are not plain dicts, like ``BoundedCache``, may keep
+    their own bookkeeping in the item access methods, so these are called
+    as usual unless they are the ones of ``dict``.
+    """
+    cdef PyObject* val
+    if PyDict_CheckExact(cache):
+        val = PyObject_CallOneArg(func, inst)
+        PyDict_SetItem(cache, name, val)
+        Py_DECREF(val)
+        return <object>val
+    if propcache_dict_reads(cache):
+        val = PyDict_GetItem(cache, name)
+        if val is not NULL:
+            return <object>val
+    try:
+        return cache[name]
+    except KeyError:
+        pass
+    value = func(inst)
+    fill_cache(cache, name, value)
+    return value
+
+
+cdef int fill_cache(object cache, object name, object val) except -1:
+    """Store a value a descriptor computed on a miss into ``cache``.
+
+    Immutable caches, like `FrozenCache`, raise `TypeError` and are left
+    as they are, so the value is computed again on each read.
+    """
+    try:
+        cache[name] = val
+    except TypeError:
+        pass
+    return 0
 
 
 cdef class under_cached_property:
@@ -28,13 +133,77 @@ cdef class under_cached_property:
 
     """
 
-    cdef readonly object wrapped
-    cdef object name
+    def __init__(
+        self,
+        object wrapped=None,
+        *,
+        cache_exceptions=False,
+        exception_ttl=None,
+        cache_if=None,
+        bint writable=False,
+        depends_on=None,
+    ):
+        if wrapped is not None:
+            self.wrapped = wrapped
+            self.name = wrapped.__name__
+        self.cache_exceptions = exception_types(cache_exceptions)
+        self.exception_ttl = exception_ttl
+        self.cache_if = cache_if
+        self.cache_if_not_none = cache_if is is_not_none
+        self.has_options = bool(self.cache_exceptions) or cache_if is not None
+        self.writable = writable
+        self.depends_on = None if depends_on is None else frozenset(depends_on)
+
+    def __call__(self, object wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+        return self
+
+    def __set_name__(self, owner, object name):
+        register_property(owner, name)
+
+    @property
+    def __doc__(self):
+        return self.wrapped.__doc__
+
+    def __get__(self, object inst, owner):
+        if inst is None:
+            return self
+        return under_cached_property_get(self, inst)
+
+    def __set__(self, inst, value):
+        if not self.writable:
+            raise AttributeError("cached property is read-only")
+        under_cached_property_set(self, inst, value)
+
+    def __delete__(self, inst):
+        if not self.writable:
+            raise AttributeError("cached property is read-only")
+        cache = get_cache(&self.cache_location, inst)
+        cache.pop(self.name, None)
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+cdef class mirrored_under_cached_property:
+    """Use as a class method decorator.  It operates like
+    `under_cached_property`, storing the result of the method it
+    decorates into the instance's ``_cache`` dict, but it also mirrors
+    the result into the instance dict.  It is, in Python parlance, a
+    non-data descriptor, so later reads are served by the interpreter's
+    own attribute lookup without calling the descriptor.  The result is
+    stored in ``_cache`` under a `_MirrorKey`, so removing it from there
+    also removes the mirror.
+
+    """
 
     def __init__(self, object wrapped):
         self.wrapped = wrapped
         self.name = wrapped.__name__
 
+    def __set_name__(self, owner, object name):
+        register_property(owner, name)
+
     @property
     def __doc__(self):
         return self.wrapped.__doc__
@@ -42,13 +211,762 @@ cdef class under_cached_property:
     def __get__(self, object inst, owner):
         if inst is None:
             return self
-        cdef dict cache = inst._cache
-        cdef PyObject* val = PyDict_GetItem(cache, self.name)
-        if val == NULL:
-            val = PyObject_CallOneArg(self.wrapped, inst)
-            PyDict_SetItem(cache, self.name, val)
-            Py_DECREF(val)
-        return <object>val
+        cache = get_cache(&self.cache_location, inst)
+        try:
+            val = cache[self.name]
+        except KeyError:
+            val = self.wrapped(inst)
+        else:
+            # Stored again below under a key tied to the new mirror.
+            try:
+                del cache[self.name]
+            except TypeError:
+                # The cache is immutable, like `FrozenCache`.
+                return val
+        key = _mirror_key(self.name, inst)
+        try:
+            cache[key] = val
+        except TypeError:
+            # The cache is immutable, like `FrozenCache`, so nothing is
+            # mirrored either.
+            return val
+        PyDict_SetItem(inst.__dict__, self.name, <PyObject*>val)
+        return val
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+class _MirrorKey(str):
+    """A ``_cache`` key of `mirrored_under_cached_property`.
+
+    It removes the mirror of its value from the instance dict once it is
+    released, as happens when the value is deleted from ``_cache``, or the
+    dict is cleared or replaced.  It is pickled along with its instance, so
+    the copies of the instance keep their own mirrors in sync.
+    """
+
+    def _instance(self):
+        owner = self.owner
+        if isinstance(owner, ref):
+            return owner()
+        return owner
+
+    def __del__(self):
+        inst = self._instance()
+        if inst is not None:
+            inst.__dict__.pop(self, None)
+
+    def __reduce__(self):
+        inst = self._instance()
+        if inst is None:
+            return (str, (str(self),))
+        return (_mirror_key, (str(self), inst))
+
+
+def _mirror_key(str name, object inst):
+    key = _MirrorKey(name)
+    try:
+        key.owner = ref(inst)
+    except TypeError:
+        # Without weak references, the instance is kept instead, in a
+        # reference cycle through ``_cache``.
+        key.owner = inst
+    return key
+
+
+cdef extern from *:
+    """
+    /* Values of ``side_cached_property`` live in an open addressing table
+       keyed by the address of their instance. Each entry keeps a weak
+       reference to the instance whose callback removes the entry when the
+       instance dies, before its address can be reused. */
+    typedef struct {
+        void *key;
+        PyObject *cache;
+        PyObject *ref;
+    } propcache_side_entry;
+
+    /* Marks removed entries, so probing goes on past them. */
+    #define PROPCACHE_SIDE_DUMMY ((void *)1)
+    #define PROPCACHE_SIDE_MIN_SIZE 8
+
+    static struct {
+        propcache_side_entry *entries;
+        size_t mask;
+        size_t used;
+        size_t filled;
+    #ifdef Py_GIL_DISABLED
+        PyMutex mutex;
+    #endif
+    } propcache_side_table;
+
+    #ifdef Py_GIL_DISABLED
+    #define PROPCACHE_SIDE_LOCK() PyMutex_Lock(&propcache_side_table.mutex)
+    #define PROPCACHE_SIDE_UNLOCK() PyMutex_Unlock(&propcache_side_table.mutex)
+    #else
+    #define PROPCACHE_SIDE_LOCK()
+    #define PROPCACHE_SIDE_UNLOCK()
+    #endif
+
+    /* Return the entry holding ``key``, or the one to store it in. The
+       table must have been allocated and have a free entry. */
+    static propcache_side_entry *
+    propcache_side_lookup(void *key)
+    {
+        /* The low bits are always zero due to the allocator alignment. */
+        size_t hash = (size_t)((uintptr_t)key >> 4);
+        size_t mask = propcache_side_table.mask;
+        size_t i = (hash ^ (hash >> 12)) & mask;
+        propcache_side_entry *freeslot = NULL;
+        for (;;) {
+            propcache_side_entry *entry = &propcache_side_table.entries[i];
+            if (entry->key == key) {
+                return entry;
+            }
+            if (entry->key == NULL) {
+                return freeslot != NULL ? freeslot : entry;
+            }
+            if (entry->key == PROPCACHE_SIDE_DUMMY && freeslot == NULL) {
+                freeslot = entry;
+            }
+            i = (i + 1) & mask;
+        }
+    }
+
+    /* Rehash the live entries into a table sized for three times as many,
+       dropping the removed ones. */
+    static int
+    propcache_side_resize(void)
+    {
+        size_t size = PROPCACHE_SIDE_MIN_SIZE;
+        while (size <= propcache_side_table.used * 3) {
+            size <<= 1;
+        }
+        propcache_side_entry *old_entries = propcache_side_table.entries;
+        size_t old_size = old_entries != NULL ? propcache_side_table.mask + 1 : 0;
+        propcache_side_entry *entries = PyMem_Calloc(
+            size, sizeof(propcache_side_entry));
+        if (entries == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        propcache_side_table.entries = entries;
+        propcache_side_table.mask = size - 1;
+        propcache_side_table.filled = propcache_side_table.used;
+        for (size_t i = 0; i < old_size; i++) {
+            propcache_side_entry *entry = &old_entries[i];
+            if (entry->key != NULL && entry->key != PROPCACHE_SIDE_DUMMY) {
+                *propcache_side_lookup(entry->key) = *entry;
+            }
+        }
+        PyMem_Free(old_entries);
+        return 0;
+    }
+
+    /* Return a new reference to the cache of ``inst``, or to None. */
+    static PyObject *
+    propcache_side_table_get(PyObject *inst)
+    {
+        PyObject *cache = Py_None;
+        PROPCACHE_SIDE_LOCK();
+        if (propcache_side_table.entries != NULL) {
+            propcache_side_entry *entry = propcache_side_lookup(inst);
+            if (entry->key == inst) {
+                cache = entry->cache;
+            }
+        }
+        Py_INCREF(cache);
+        PROPCACHE_SIDE_UNLOCK();
+        return cache;
+    }
+
+    /* Store ``cache`` and ``ref`` for ``inst`` unless it already has a
+       cache, and return a new reference to the stored cache. */
+    static PyObject *
+    propcache_side_table_setdefault(
+        PyObject *inst, PyObject *cache, PyObject *ref)
+    {
+        PROPCACHE_SIDE_LOCK();
+        if (propcache_side_table.entries == NULL
+                || (propcache_side_table.filled + 1) * 3
+                    >= (propcache_side_table.mask + 1) * 2) {
+            if (propcache_side_resize() < 0) {
+                PROPCACHE_SIDE_UNLOCK();
+                return NULL;
+            }
+        }
+        propcache_side_entry *entry = propcache_side_lookup(inst);
+        if (entry->key != inst) {
+            if (entry->key == NULL) {
+                propcache_side_table.filled++;
+            }
+            propcache_side_table.used++;
+            entry->key = inst;
+            entry->cache = Py_NewRef(cache);
+            entry->ref = Py_NewRef(ref);
+        }
+        cache = Py_NewRef(entry->cache);
+        PROPCACHE_SIDE_UNLOCK();
+        return cache;
+    }
+
+    static void
+    propcache_side_table_remove(void *key)
+    {
+        PyObject *cache = NULL;
+        PyObject *ref = NULL;
+        PROPCACHE_SIDE_LOCK();
+        if (propcache_side_table.entries != NULL) {
+            propcache_side_entry *entry = propcache_side_lookup(key);
+            if (entry->key == key) {
+                cache = entry->cache;
+                ref = entry->ref;
+                entry->key = PROPCACHE_SIDE_DUMMY;
+                entry->cache = NULL;
+                entry->ref = NULL;
+                propcache_side_table.used--;
+            }
+        }
+        PROPCACHE_SIDE_UNLOCK();
+        /* Releasing the values can run arbitrary code. */
+        Py_XDECREF(cache);
+        Py_XDECREF(ref);
+    }
+
+    /* The table is owned by a single object, so the garbage collector
+       sees the references it holds to the caches and weak references. */
+    static int
+    propcache_side_table_traverse(PyObject *self, visitproc visit, void *arg)
+    {
+        size_t size = propcache_side_table.entries != NULL
+            ? propcache_side_table.mask + 1 : 0;
+        for (size_t i = 0; i < size; i++) {
+            propcache_side_entry *entry = &propcache_side_table.entries[i];
+            Py_VISIT(entry->cache);
+            Py_VISIT(entry->ref);
+        }
+        Py_VISIT(Py_TYPE(self));
+        return 0;
+    }
+
+    static int
+    propcache_side_table_clear(PyObject *self)
+    {
+        PROPCACHE_SIDE_LOCK();
+        propcache_side_entry *entries = propcache_side_table.entries;
+        size_t size = entries != NULL ? propcache_side_table.mask + 1 : 0;
+        propcache_side_table.entries = NULL;
+        propcache_side_table.mask = 0;
+        propcache_side_table.used = 0;
+        propcache_side_table.filled = 0;
+        PROPCACHE_SIDE_UNLOCK();
+        for (size_t i = 0; i < size; i++) {
+            Py_XDECREF(entries[i].cache);
+            Py_XDECREF(entries[i].ref);
+        }
+        PyMem_Free(entries);
+        return 0;
+    }
+
+    static void
+    propcache_side_table_dealloc(PyObject *self)
+    {
+        PyTypeObject *tp = Py_TYPE(self);
+        PyObject_GC_UnTrack(self);
+        (void)propcache_side_table_clear(self);
+        tp->tp_free(self);
+        Py_DECREF(tp);
+    }
+
+    static PyType_Slot propcache_side_table_slots[] = {
+        {Py_tp_traverse, propcache_side_table_traverse},
+        {Py_tp_clear, propcache_side_table_clear},
+        {Py_tp_dealloc, propcache_side_table_dealloc},
+        {0, NULL},
+    };
+
+    static PyType_Spec propcache_side_table_spec = {
+        "propcache._helpers_c._SideTable",
+        sizeof(PyObject),
+        0,
+        Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+        propcache_side_table_slots,
+    };
+
+    /* Return the object owning the table. */
+    static PyObject *
+    propcache_side_table_owner(void)
+    {
+        PyObject *tp = PyType_FromSpec(&propcache_side_table_spec);
+        if (tp == NULL) {
+            return NULL;
+        }
+        PyObject *owner = PyType_GenericAlloc((PyTypeObject *)tp, 0);
+        Py_DECREF(tp);
+        return owner;
+    }
+    """
+    object propcache_side_table_get(object inst)
+    object propcache_side_table_setdefault(object inst, object cache, object ref)
+    void propcache_side_table_remove(void* key)
+    object propcache_side_table_owner()
+
+
+# Shows the references of the table to the garbage collector, and releases
+# the table with the module.
+cdef object _side_table = propcache_side_table_owner()
+
+
+def _release_side_cache(key, wr):
+    propcache_side_table_remove(PyLong_AsVoidPtr(key))
+
+
+cdef dict side_cache(object inst):
+    cache = propcache_side_table_get(inst)
+    if cache is not None:
+        return <dict>cache
+    # Raises TypeError for objects not supporting weak references.
+    wr = ref(inst, partial(_release_side_cache, PyLong_FromVoidPtr(<void*>inst)))
+    return <dict>propcache_side_table_setdefault(inst, {}, wr)
+
+
+cdef class side_cached_property:
+    """Use as a class method decorator.  It operates like
+    `under_cached_property`, but the result of the method it decorates is
+    stored in a table kept by propcache, keyed by the identity of the
+    instance, so the instance needs neither a ``__dict__`` nor a
+    ``_cache`` attribute.  The instance must support weak references,
+    which are used to drop its values when it dies.  It is, in Python
+    parlance, a data descriptor; deleting the attribute invalidates the
+    cached value.
+
+    """
+
+    def __init__(self, object wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+
+    def __set_name__(self, owner, object name):
+        register_property(owner, name)
+
+    @property
+    def __doc__(self):
+        return self.wrapped.__doc__
+
+    def __get__(self, object inst, owner):
+        if inst is None:
+            return self
+        return cache_get(side_cache(inst), self.name, self.wrapped, inst)
+
+    def __set__(self, inst, value):
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst):
+        cache = propcache_side_table_get(inst)
+        if cache is not None:
+            cache.pop(self.name, None)
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+cdef class _ContextStore(dict):
+    """The values of `context_cached_property` in one context.
+
+    The values of each instance are keyed by its id, along with a weak
+    reference to it whose callback drops the entry when the instance
+    dies, before its id can be reused.
+
+    """
+
+    cdef object __weakref__
+
+
+def _release_context_cache(store_ref, key, wr):
+    store = store_ref()
+    if store is not None:
+        store.pop(key, None)
+
+
+# The values of `context_cached_property` in the current context, once
+# `new_context_cache` was called in it or in the context it was copied from.
+cdef object _context_values = ContextVar("propcache_context_values")
+
+
+def new_context_cache():
+    """Start caching the values of `context_cached_property` afresh.
+
+    The values computed from now on in the current context, and in the
+    contexts copied from it later, are kept apart from those cached
+    before, which other contexts may share.
+    """
+    _context_values.set(_ContextStore())
+
+
+cdef dict context_cache(object inst):
+    # Nothing is cached without a store started by `new_context_cache`, or
+    # for instances not supporting weak references, which would otherwise
+    # be kept alive by the store.
+    store = get_value(_context_values)
+    if store is None:
+        return None
+    key = PyLong_FromVoidPtr(<void*>inst)
+    cdef PyObject* entry = PyDict_GetItemWithError(store, key)
+    if entry is not NULL:
+        return <dict>(<tuple><object>entry)[1]
+    try:
+        wr = ref(inst, partial(_release_context_cache, ref(store), key))
+    except TypeError:
+        return None
+    cache = {}
+    store[key] = (wr, cache)
+    return cache
+
+
+cdef class context_cached_property:
+    """Use as a class method decorator.  It operates like
+    `under_cached_property`, but the result of the method it decorates is
+    cached in the current :class:`contextvars.Context` rather than on the
+    instance, so each context, like a request being served, computes it
+    once.  Values are only cached once `new_context_cache` was called, as
+    at the start of each request, and the cache is shared by the context
+    it is called in and the contexts copied from that one later, like
+    those of the tasks it starts.  The values are released along with the
+    contexts, or along with the instances.  The instances are told apart
+    by identity, so they need not be hashable, but they must support weak
+    references for their values to be cached.  It is, in Python parlance,
+    a data descriptor; deleting the attribute invalidates the cached value
+    in the current context.
+
+    """
+
+    def __init__(self, object wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+
+    @property
+    def __doc__(self):
+        return self.wrapped.__doc__
+
+    def __get__(self, object inst, owner):
+        if inst is None:
+            return self
+        cache = context_cache(inst)
+        if cache is None:
+            return self.wrapped(inst)
+        return cache_get(cache, self.name, self.wrapped, inst)
+
+    def __set__(self, inst, value):
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst):
+        store = get_value(_context_values)
+        if store is not None:
+            entry = store.get(id(inst))
+            if entry is not None:
+                entry[1].pop(self.name, None)
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+cdef class _ThreadValues:
+    """The values of `thread_cached_property` for one instance.
+
+    They are kept in the ``__dict__`` of a `threading.local` object,
+    distinct in each thread, along with the instance, or a weak reference
+    to it.  Shallow copies of the instance share them through their
+    dict, and replace them with their own on first use.  Copies of them,
+    including pickled ones, start out empty and without an instance.
+    """
+
+    cdef object owner
+    cdef object local
+
+    def __init__(self):
+        self.local = local()
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+cdef inline bint owns_thread_values(object inst, _ThreadValues values):
+    owner = values.owner
+    if type(owner) is ref:
+        owner = propcache_weakref_get(owner)
+    return owner is inst
+
+
+cdef _ThreadValues new_thread_values(
+    object inst, dict inst_dict, object name, object stale
+):
+    values = _ThreadValues()
+    try:
+        values.owner = ref(inst)
+    except TypeError:
+        # Without weak references, the instance is kept instead, in a
+        # reference cycle through its dict.
+        values.owner = inst
+    if stale is None:
+        # Another thread may have stored the values first.
+        return inst_dict.setdefault(name, values)
+    inst_dict[name] = values
+    return values
+
+
+cdef class thread_cached_property:
+    """Use as a class method decorator.  It operates like
+    `cached_property`, but the result of the method it decorates is
+    cached once per thread, so each thread uses its own value, like a
+    parser or a database cursor that must not be shared between threads.
+    The values are kept in a `threading.local` object stored in the
+    instance dict, and are released when their thread exits or the
+    instance dies.  It is, in Python parlance, a data descriptor;
+    deleting the attribute invalidates the cached value of the current
+    thread.
+
+    """
+
+    def __init__(self, object wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+
+    @property
+    def __doc__(self):
+        return self.wrapped.__doc__
+
+    def __set_name__(self, owner, object name):
+        register_property(owner, name)
+
+    def __get__(self, object inst, owner):
+        if inst is None:
+            return self
+        cdef dict inst_dict = inst.__dict__
+        cdef PyObject* found = PyDict_GetItem(inst_dict, self.name)
+        cdef _ThreadValues values
+        if found is NULL:
+            values = new_thread_values(inst, inst_dict, self.name, None)
+        else:
+            stale = <object>found
+            if type(stale) is _ThreadValues and owns_thread_values(inst, stale):
+                values = <_ThreadValues>stale
+            else:
+                values = new_thread_values(inst, inst_dict, self.name, stale)
+        return cache_get(values.local.__dict__, self.name, self.wrapped, inst)
+
+    def __set__(self, inst, value):
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst):
+        values = inst.__dict__.get(self.name)
+        if type(values) is _ThreadValues and owns_thread_values(inst, values):
+            (<_ThreadValues>values).local.__dict__.pop(self.name, None)
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+cdef object _NOT_FOUND = object()
+
+
+cdef tuple exception_types(object cache_exceptions):
+    """Return the exception types to cache, as an ``except`` clause takes."""
+    if cache_exceptions is True:
+        return (Exception,)
+    if cache_exceptions is False:
+        return ()
+    if isinstance(cache_exceptions, tuple):
+        return cache_exceptions
+    return (cache_exceptions,)
+
+
+def is_not_none(value):
+    """Return whether ``value`` is not ``None``, to use as ``cache_if``.
+
+    The accelerated properties compare with ``None`` directly instead of
+    calling this predicate.
+    """
+    return value is not None
+
+
+cdef bint should_cache(object cache_if, bint cache_if_not_none, object val) except -1:
+    """Return whether ``val`` qualifies for caching by the ``cache_if`` option."""
+    if cache_if is None:
+        return True
+    if cache_if_not_none:
+        return val is not None
+    return bool(cache_if(val))
+
+
+cdef class _CachedException:
+    """An exception raised by a wrapped function, cached in place of a value.
+
+    The original traceback is kept, so raising the exception again does
+    not grow it with every access.
+    """
+
+    cdef object exc
+    cdef object tb
+    cdef object expires
+
+    def __init__(self, exc, ttl):
+        self.exc = exc
+        self.tb = exc.__traceback__
+        self.expires = None if ttl is None else monotonic() + ttl
+
+    cdef int reraise_unexpired(self) except -1:
+        """Raise the exception again unless its time to live has passed."""
+        if self.expires is None or monotonic() < self.expires:
+            raise self.exc.with_traceback(self.tb)
+        return 0
+
+    def __reduce__(self):
+        # Tracebacks cannot be pickled, and the monotonic clock is not
+        # shared between processes, so only keep the remaining time.
+        ttl = None if self.expires is None else self.expires - monotonic()
+        return (_CachedException, (self.exc, ttl))
+
+
+cdef object under_cached_property_get_with_options(
+    under_cached_property prop, object inst
+):
+    cache = get_cache(&prop.cache_location, inst)
+    try:
+        val = cache[prop.name]
+    except KeyError:
+        pass
+    else:
+        if type(val) is not _CachedException:
+            return val
+        (<_CachedException>val).reraise_unexpired()
+    try:
+        val = prop.wrapped(inst)
+    except prop.cache_exceptions as exc:
+        fill_cache(cache, prop.name, _CachedException(exc, prop.exception_ttl))
+        raise
+    if should_cache(prop.cache_if, prop.cache_if_not_none, val):
+        fill_cache(cache, prop.name, val)
+    return val
+
+
+cdef object cached_property_get_with_options(
+    cached_property prop, object inst
+):
+    # Failures are stored in the instance dict under a key that is not an
+    # identifier, as their tracebacks refer to the instance.
+    cdef dict cache = inst.__dict__
+    val = cache.get(prop.name, _NOT_FOUND)
+    if val is not _NOT_FOUND:
+        return val
+    if prop.cache_exceptions:
+        key = prop.name + ".exception"
+        failure = cache.get(key)
+        if failure is not None:
+            (<_CachedException>failure).reraise_unexpired()
+            del cache[key]
+        try:
+            val = prop.func(inst)
+        except prop.cache_exceptions as exc:
+            cache[key] = _CachedException(exc, prop.exception_ttl)
+            raise
+    else:
+        val = prop.func(inst)
+    if should_cache(prop.cache_if, prop.cache_if_not_none, val):
+        cache[prop.name] = val
+    return val
+
+
+cdef extern from *:
+    """
+    /* Return a new reference to the referent of ``ref``, or to None once
+       it is dead. */
+    static inline PyObject *
+    propcache_weakref_get(PyObject *ref)
+    {
+    #if PY_VERSION_HEX >= 0x030D0000
+        PyObject *obj;
+        if (PyWeakref_GetRef(ref, &obj) == 0) {
+            return Py_NewRef(Py_None);
+        }
+        return obj;
+    #else
+        return Py_NewRef(PyWeakref_GET_OBJECT(ref));
+    #endif
+    }
+    """
+    object propcache_weakref_get(object ref)
+
+
+class _WeakValue(ref):
+    """A weak reference to a cached value.
+
+    A dedicated type tells these apart from cached values that happen to
+    be weak references themselves.
+    """
+
+    __slots__ = ()
+
+
+cdef object weak_value_get(object cache, object name):
+    """Return the value cached under ``name``, or ``_NOT_FOUND``."""
+    cdef PyObject* val
+    if PyDict_CheckExact(cache):
+        val = PyDict_GetItem(cache, name)
+        if val is NULL:
+            return _NOT_FOUND
+        found = <object>val
+    else:
+        try:
+            found = cache[name]
+        except KeyError:
+            return _NOT_FOUND
+    if type(found) is not _WeakValue:
+        return found
+    referent = propcache_weakref_get(found)
+    return _NOT_FOUND if referent is None else referent
+
+
+cdef int weak_value_set(object cache, object name, object val) except -1:
+    """Cache a weak reference to ``val``, or ``val`` when it has none."""
+    try:
+        wr = _WeakValue(val)
+    except TypeError:
+        wr = val
+    cache[name] = wr
+    return 0
+
+
+cdef class weak_under_cached_property:
+    """Use as a class method decorator.  It operates like
+    `under_cached_property`, but only a weak reference to the result of
+    the method it decorates is stored in the instance's ``_cache`` dict,
+    so the result is computed again once nothing else refers to it.
+    Results that do not support weak references are stored as they are.
+    It is, in Python parlance, a data descriptor.
+
+    """
+
+    def __init__(self, object wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+
+    @property
+    def __doc__(self):
+        return self.wrapped.__doc__
+
+    def __set_name__(self, owner, object name):
+        register_property(owner, name)
+
+    def __get__(self, object inst, owner):
+        if inst is None:
+            return self
+        cache = get_cache(&self.cache_location, inst)
+        val = weak_value_get(cache, self.name)
+        if val is _NOT_FOUND:
+            val = self.wrapped(inst)
+            try:
+                weak_value_set(cache, self.name, val)
+            except TypeError:
+                # The cache is immutable, like `FrozenCache`.
+                pass
+        return val
 
     def __set__(self, inst, value):
         raise AttributeError("cached property is read-only")
@@ -65,12 +983,26 @@ cdef class cached_property:
 
     """
 
-    cdef readonly object func
-    cdef object name
-
-    def __init__(self, func):
+    def __init__(
+        self,
+        func=None,
+        *,
+        cache_exceptions=False,
+        exception_ttl=None,
+        cache_if=None,
+        depends_on=None,
+    ):
         self.func = func
         self.name = None
+        self.cache_exceptions = exception_types(cache_exceptions)
+        self.exception_ttl = exception_ttl
+        self.cache_if = cache_if
+        self.cache_if_not_none = cache_if is is_not_none
+        self.depends_on = None if depends_on is None else frozenset(depends_on)
+
+    def __call__(self, func):
+        self.func = func
+        return self
 
     @property
     def __doc__(self):
@@ -84,20 +1016,443 @@ cdef class cached_property:
                 "Cannot assign the same cached_property to two different names "
                 f"({self.name!r} and {name!r})."
             )
+        register_property(owner, name)
 
     def __get__(self, inst, owner):
         if inst is None:
             return self
+        return cached_property_get(self, inst)
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+
+# The names of the attributes of all the descriptors but
+# `context_cached_property` defined in the body of each class, as
+# registered by their `__set_name__`.  The properties themselves would keep
+# their class alive as a key when their method refers to it, as methods
+# calling ``super()`` do, so they are looked up by name.
+cdef object _class_properties = WeakKeyDictionary()
+
+
+# The class attribute keeping the descriptors `inline_cached_properties`
+# removed from the class.
+cdef str INLINED_PROPERTIES = "__inline_cached_properties__"
+
+
+cdef register_property(object owner, object name):
+    names = _class_properties.get(owner)
+    if names is None:
+        names = _class_properties[owner] = []
+    if name not in names:
+        (<list>names).append(name)
+
+
+def cached_properties(cls):
+    """Return the cached properties of ``cls`` by attribute name.
+
+    These are its `cached_property` and `under_cached_property`
+    attributes, the inherited ones included, in the order of the method
+    resolution.  Each class registers its properties when it is created,
+    so only those are looked at rather than all the attributes of the
+    classes.  Properties assigned to a class after it was created are not
+    registered, while those moved away by `inline_cached_properties` are
+    still found.
+    """
+    return _registered_properties(cls, (cached_property, under_cached_property))
+
+
+def _registered_properties(cls, tuple types):
+    """Return the registered properties of ``cls`` that are ``types``."""
+    cdef tuple mro = cls.__mro__
+    cdef dict props = {}
+    cdef Py_ssize_t i
+    for i in range(len(mro)):
+        klass = mro[i]
+        own = _class_properties.get(klass)
+        if not own:
+            continue
+        klass_dict = vars(klass)
+        inlined = klass_dict.get(INLINED_PROPERTIES, {})
+        for name in <list>own:
+            if name in props:
+                continue
+            prop = klass_dict.get(name, inlined.get(name))
+            if not isinstance(prop, types):
+                continue
+            # Skip the properties overridden by a subclass attribute.
+            if any(name in vars(sub) for sub in mro[:i]):
+                continue
+            props[name] = prop
+    return props
+
+
+def propagate_cache(src, dst, *, changed=(), names=None):
+    """Copy the values cached for ``src`` that are still valid for ``dst``.
+
+    The values of the `cached_property` and `under_cached_property`
+    attributes of the class of ``src``, or only of those in ``names``, are
+    copied to the instance dict or ``_cache`` of ``dst``.  Values of
+    properties depending on one of the ``changed`` fields are left out,
+    and so are the values of properties not declaring ``depends_on`` at
+    all when any field changed.  Cached exceptions are never copied.
+    """
+    cdef frozenset changed_fields = frozenset(changed)
+    cdef frozenset selected = None if names is None else frozenset(names)
+    cdef frozenset depends_on
+    cdef dict src_dict = None
+    cdef under_cached_property under_prop
+    for attr, prop in (<dict>cached_properties(type(src))).items():
+        if selected is not None and attr not in selected:
+            continue
+        if isinstance(prop, cached_property):
+            depends_on = (<cached_property>prop).depends_on
+        else:
+            depends_on = (<under_cached_property>prop).depends_on
+        if changed_fields and (
+            depends_on is None or not depends_on.isdisjoint(changed_fields)
+        ):
+            continue
+        if isinstance(prop, cached_property):
+            name = (<cached_property>prop).name
+            if src_dict is None:
+                src_dict = src.__dict__
+            if name is not None and name in src_dict:
+                dst.__dict__[name] = src_dict[name]
+            continue
+        under_prop = <under_cached_property>prop
+        cache = get_cache(&under_prop.cache_location, src)
+        try:
+            val = cache[under_prop.name]
+        except KeyError:
+            continue
+        if type(val) is not _CachedException:
+            dst._cache[under_prop.name] = val
+
+
+# The properties of each class `warm` has seen, as found on its first call:
+# the attribute name, the key of the value and whether it is kept in the
+# instance dict rather than in ``_cache``.  Like in ``_class_properties``,
+# the properties themselves are not kept.
+cdef object _warm_plans = WeakKeyDictionary()
+
+
+cdef tuple warm_plan(object cls):
+    plan = _warm_plans.get(cls)
+    if plan is None:
+        plan = _warm_plans[cls] = tuple(
+            (attr, attr, True)
+            if isinstance(prop, cached_property)
+            else (attr, (<under_cached_property>prop).name, False)
+            for attr, prop in (<dict>cached_properties(cls)).items()
+        )
+    return <tuple>plan
+
+
+def warm(inst, names=None, *, executor=None):
+    """Compute the values of the cached properties of ``inst`` not cached yet.
+
+    All the `cached_property` and `under_cached_property` attributes of
+    the class are computed, or only those in ``names``.  They are found
+    on the first call for each class.  When an ``executor`` is passed,
+    the missing values are computed concurrently by its workers, so they
+    must not depend on each other.
+    """
+    cdef frozenset selected = None if names is None else frozenset(names)
+    cls = type(inst)
+    pending = []
+    for attr, key, in_dict in warm_plan(cls):
+        if selected is not None and attr not in selected:
+            continue
+        if executor is None:
+            getattr(inst, attr)
+            continue
+        store = inst.__dict__ if in_dict else inst._cache
+        if key not in store:
+            pending.append(executor.submit(getattr, inst, attr))
+    for future in pending:
+        future.result()
+
+
+cdef extern from *:
+    """
+    /* Return the version tag of ``type``, or 0 when the attributes found for
+       the type cannot be kept, as its instances do not use the generic
+       attribute lookup or the tag cannot be read safely. */
+    static inline unsigned int
+    propcache_type_version(PyObject *type)
+    {
+    #ifndef Py_GIL_DISABLED
+        PyTypeObject *tp = (PyTypeObject *)type;
+        if (tp->tp_getattro == PyObject_GenericGetAttr
+                && (tp->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG)) {
+            return tp->tp_version_tag;
+        }
+    #endif
+        return 0;
+    }
+
+    /* Like ``propcache_type_version``, but first assign a version tag to
+       the type if it has none, which looking an attribute up does. */
+    static unsigned int
+    propcache_type_assign_version(PyObject *type, PyObject *name)
+    {
+    #ifndef Py_GIL_DISABLED
+        (void)_PyType_Lookup((PyTypeObject *)type, name);
+    #endif
+        return propcache_type_version(type);
+    }
+    """
+    unsigned int propcache_type_version(object tp)
+    unsigned int propcache_type_assign_version(object tp, object name)
+
+
+cdef object type_lookup(object tp, object name):
+    """Return the attribute ``name`` of ``tp`` without binding it."""
+    for klass in tp.__mro__:
+        klass_dict = klass.__dict__
+        if name in klass_dict:
+            return klass_dict[name]
+    return None
+
+
+cdef class cached_getter:
+    """Return a callable reading the named attributes of its argument.
+
+    It operates like :func:`operator.attrgetter`, returning a tuple of the
+    values, or the value when a single name is given, but the values of
+    `cached_property` and `under_cached_property` attributes are read
+    straight from their caches, computing them on a miss, rather than
+    through the attribute lookup.  The descriptors are looked up once for
+    the type of the last instance, until the type changes.  Dotted names
+    are read with ``attrgetter``.
+
+    """
+
+    cdef readonly tuple names
+    # An ``attrgetter`` for each dotted name, None for the others.
+    cdef tuple getters
+    # The type the descriptors were looked up for, its version tag and the
+    # descriptors, or None for the attributes read with ``getattr``.
+    cdef object plan
+
+    def __init__(self, name, *names):
+        names = (name, *names)
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError("attribute name must be a string")
+        self.names = names
+        self.getters = tuple(
+            attrgetter(name) if "." in name else None for name in names
+        )
+        self.plan = None
+
+    cdef tuple resolve(self, object tp):
+        cdef unsigned int version = propcache_type_assign_version(
+            tp, self.names[0]
+        )
+        props = []
+        for name, getter in zip(self.names, self.getters):
+            prop = type_lookup(tp, name) if version and getter is None else None
+            if type(prop) is cached_property or type(prop) is under_cached_property:
+                props.append(prop)
+            else:
+                props.append(None)
+        plan = (tp, version, tuple(props))
+        if version:
+            self.plan = plan
+        return plan
+
+    def __call__(self, inst):
+        cdef object tp = type(inst)
+        cdef object plan = self.plan
+        if (
+            plan is None
+            or (<tuple>plan)[0] is not tp
+            or (<tuple>plan)[1] != propcache_type_version(tp)
+        ):
+            plan = self.resolve(tp)
+        cdef tuple props = (<tuple>plan)[2]
+        cdef Py_ssize_t size = len(props)
+        cdef Py_ssize_t i
+        cdef tuple values = PyTuple_New(size)
+        cdef cached_property dict_prop
+        cdef under_cached_property cache_prop
+        # Fetched once for all the properties without options.
+        cdef object inst_dict = None
+        cdef object cache = None
+        for i in range(size):
+            prop = props[i]
+            if prop is None:
+                getter = self.getters[i]
+                if getter is None:
+                    val = getattr(inst, self.names[i])
+                else:
+                    val = getter(inst)
+            elif type(prop) is cached_property:
+                dict_prop = <cached_property>prop
+                if (
+                    dict_prop.name is None
+                    or dict_prop.cache_exceptions
+                    or dict_prop.cache_if is not None
+                ):
+                    val = cached_property_get(dict_prop, inst)
+                else:
+                    if inst_dict is None:
+                        inst_dict = inst.__dict__
+                    val = cache_get(inst_dict, dict_prop.name, dict_prop.func, inst)
+            else:
+                cache_prop = <under_cached_property>prop
+                if cache_prop.has_options:
+                    val = under_cached_property_get(cache_prop, inst)
+                else:
+                    if cache is None:
+                        cache = get_cache(&cache_prop.cache_location, inst)
+                    val = cache_get(cache, cache_prop.name, cache_prop.wrapped, inst)
+            Py_INCREF(val)
+            PyTuple_SET_ITEM(values, i, val)
+        if size == 1:
+            return values[0]
+        return values
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.names))})"
+
+    def __reduce__(self):
+        return (type(self), self.names)
+
+
+cdef class weak_cached_property:
+    """Use as a class method decorator.  It operates like
+    `cached_property`, but only a weak reference to the result of the
+    method it decorates is stored in the instance dict, so the result is
+    computed again once nothing else refers to it.  Results that do not
+    support weak references are stored as they are.  It is, in Python
+    parlance, a data descriptor, and assigning to the attribute caches
+    the assigned value the same way.
+
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = None
+
+    @property
+    def __doc__(self):
+        return self.func.__doc__
+
+    def __set_name__(self, owner, object name):
+        if self.name is None:
+            self.name = name
+        elif name != self.name:
+            raise TypeError(
+                "Cannot assign the same weak_cached_property to two different "
+                f"names ({self.name!r} and {name!r})."
+            )
+        register_property(owner, name)
+
+    cdef object check_name(self):
         if self.name is None:
             raise TypeError(
-                "Cannot use cached_property instance"
+                "Cannot use weak_cached_property instance"
                 " without calling __set_name__ on it.")
+        return self.name
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+        name = self.check_name()
         cdef dict cache = inst.__dict__
-        cdef PyObject* val = PyDict_GetItem(cache, self.name)
-        if val is NULL:
-            val = PyObject_CallOneArg(self.func, inst)
-            PyDict_SetItem(cache, self.name, val)
-            Py_DECREF(val)
-        return <object>val
+        val = weak_value_get(cache, name)
+        if val is _NOT_FOUND:
+            val = self.func(inst)
+            weak_value_set(cache, name, val)
+        return val
+
+    def __set__(self, inst, value):
+        weak_value_set(inst.__dict__, self.check_name(), value)
+
+    def __delete__(self, inst):
+        name = self.check_name()
+        try:
+            del inst.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     __class_getitem__ = classmethod(GenericAlias)
+
+
+# C API for extensions not written in Cython, exported as capsules through
+# ``__pyx_capi__``. See ``_helpers_c.pxd`` for the Cython-level equivalent.
+
+cdef api object propcache_under_cached_property_get(object prop, object inst):
+    return under_cached_property_get(<under_cached_property?>prop, inst)
+
+
+cdef api int propcache_under_cached_property_set(
+    object prop, object inst, object value
+) except -1:
+    return under_cached_property_set(<under_cached_property?>prop, inst, value)
+
+
+cdef api object propcache_cached_property_get(object prop, object inst):
+    return cached_property_get(<cached_property?>prop, inst)
+
+
+cdef api int propcache_cached_property_set(
+    object prop, object inst, object value
+) except -1:
+    return cached_property_set(<cached_property?>prop, inst, value)
+
+
+def inline_cached_properties(cls):
+    """Use as a class decorator.  It replaces every `cached_property`
+    declared in the class body with a ``__getattr__`` hook computing the
+    value on the first access and storing it in the instance dict.  With
+    no descriptor left on the class, later reads are plain instance
+    attribute lookups, which the specializing interpreter of CPython
+    3.12+ can inline.
+
+    Any class attribute of the same name would stop the specialization,
+    so the descriptors are moved to the ``__inline_cached_properties__``
+    dict of the class, where `cached_properties` finds them.  The
+    properties a base class defines as a class attribute, either inherited
+    or overridden, cannot be inlined, and raise a `TypeError`.
+
+    """
+    for name, prop in (<dict>cached_properties(cls)).items():
+        if not isinstance(prop, cached_property):
+            continue
+        for base in cls.__mro__[1:]:
+            if name in vars(base):
+                raise TypeError(
+                    f"Cannot inline the cached_property {name!r} of "
+                    f"{cls.__qualname__!r}, as {base.__qualname__!r} defines "
+                    "it as a class attribute."
+                )
+    cdef dict props = {}
+    cdef dict funcs = {}
+    for name, attr in list(vars(cls).items()):
+        if isinstance(attr, cached_property):
+            props[name] = attr
+            funcs[name] = (<cached_property>attr).func
+            delattr(cls, name)
+    setattr(cls, INLINED_PROPERTIES, props)
+    fallback = getattr(cls, "__getattr__", None)
+
+    def __getattr__(self, name):
+        func = funcs.get(name)
+        if func is None:
+            if fallback is None:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no attribute {name!r}"
+                )
+            return fallback(self, name)
+        val = func(self)
+        # Unlike writing to ``__dict__``, the generic setattr keeps the
+        # values inlined in the instance, which is what gets specialized.
+        PyObject_GenericSetAttr(self, name, val)
+        return val
+
+    __getattr__.__qualname__ = f"{cls.__qualname__}.__getattr__"
+    cls.__getattr__ = __getattr__
+    return cls
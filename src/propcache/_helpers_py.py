@@ -2,12 +2,50 @@
 
 from __future__ import annotations
 
+import operator
 import sys
-from collections.abc import Callable, Mapping
-from functools import cached_property
-from typing import Any, Generic, Protocol, TypeVar, overload
+import time
+import weakref
 
-__all__ = ("under_cached_property", "cached_property")
+# ``threading.local`` is ``_thread._local``, which mypyc needs imported
+# from where it is defined to subclass it.
+from _thread import _local
+from collections.abc import Callable, Iterable, Mapping
+from contextvars import ContextVar
+from functools import partial
+from types import GenericAlias
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    NoReturn,
+    Protocol,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+__all__ = (
+    "under_cached_property",
+    "mirrored_under_cached_property",
+    "cached_property",
+    "side_cached_property",
+    "weak_under_cached_property",
+    "weak_cached_property",
+    "inline_cached_properties",
+    "is_not_none",
+    "propagate_cache",
+    "warm",
+    "cached_properties",
+    "cached_getter",
+    "context_cached_property",
+    "new_context_cache",
+    "thread_cached_property",
+)
 
 
 if sys.version_info >= (3, 11):
@@ -16,15 +54,94 @@ else:
     Self = Any
 
 _T = TypeVar("_T")
+_T2 = TypeVar("_T2")
+_NOT_FOUND = object()
+_EXCEPTION_SUFFIX = ".exception"
+_ExceptionTypes = Union[bool, type[BaseException], tuple[type[BaseException], ...]]
 # We use Mapping to make it possible to use TypedDict, but this isn't
 # technically type safe as we need to assign into the dict.
 _Cache = TypeVar("_Cache", bound=Mapping[str, Any])
+_Cls = TypeVar("_Cls")
+
+# This module is also compiled with mypyc when building with `with-mypyc`.
+# mypyc cannot emit a ``tp_descr_set`` slot for native classes, so data
+# descriptors have to opt out of being native; the methods still compile.
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # pragma: no cover
+
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[_Cls], _Cls]:
+        return lambda cls: cls
 
 
 class _CacheImpl(Protocol[_Cache]):
     _cache: _Cache
 
 
+def _exception_types(
+    cache_exceptions: _ExceptionTypes,
+) -> tuple[type[BaseException], ...]:
+    """Return the exception types to cache, as an ``except`` clause takes."""
+    if cache_exceptions is True:
+        return (Exception,)
+    if cache_exceptions is False:
+        return ()
+    if isinstance(cache_exceptions, tuple):
+        return cache_exceptions
+    return (cache_exceptions,)
+
+
+def is_not_none(value: object) -> bool:
+    """Return whether ``value`` is not ``None``, to use as ``cache_if``.
+
+    The accelerated properties compare with ``None`` directly instead of
+    calling this predicate.
+    """
+    return value is not None
+
+
+def _fill_cache(cache: Any, name: str, val: object) -> None:
+    """Store a value a descriptor computed on a miss into ``cache``.
+
+    Immutable caches, like `FrozenCache`, raise `TypeError` and are left
+    as they are, so the value is computed again on each read.
+    """
+    try:
+        cache[name] = val
+    except TypeError:
+        pass
+
+
+class _CachedException:
+    """An exception raised by a wrapped function, cached in place of a value.
+
+    The original traceback is kept, so raising the exception again does
+    not grow it with every access.
+    """
+
+    __slots__ = ("exc", "tb", "expires")
+
+    def __init__(self, exc: BaseException, ttl: float | None) -> None:
+        self.exc = exc
+        self.tb = exc.__traceback__
+        self.expires = None if ttl is None else time.monotonic() + ttl
+
+    def reraise_unexpired(self) -> None:
+        """Raise the exception again unless its time to live has passed."""
+        if self.expires is None or time.monotonic() < self.expires:
+            self.reraise()
+
+    def reraise(self) -> NoReturn:
+        raise self.exc.with_traceback(self.tb)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Tracebacks cannot be pickled, and the monotonic clock is not
+        # shared between processes, so only keep the remaining time.
+        ttl = None if self.expires is None else self.expires - time.monotonic()
+        return (_CachedException, (self.exc, ttl))
+
+
+@mypyc_attr(native_class=False)
 class under_cached_property(Generic[_T]):
     """Use as a class method decorator.
 
@@ -33,6 +150,99 @@ class under_cached_property(Generic[_T]):
     method it decorates into the instance dict after the first call,
     effectively replacing the function it decorates with an instance
     variable.  It is, in Python parlance, a data descriptor.
+
+    Passing ``cache_exceptions`` caches the exceptions of these types
+    raised by the method as well, optionally for ``exception_ttl``
+    seconds, and raises them again instead of calling the method.
+    Passing ``cache_if`` only caches the results it returns true for.
+    Passing ``writable=True`` lets assigning to the attribute store the
+    cached value and deleting it drop the value.  Passing ``depends_on``
+    names the fields the value is computed from, for `propagate_cache`.
+    """
+
+    def __init__(
+        self,
+        wrapped: Callable[[Any], _T] | None = None,
+        *,
+        cache_exceptions: _ExceptionTypes = False,
+        exception_ttl: float | None = None,
+        cache_if: Callable[[Any], object] | None = None,
+        writable: bool = False,
+        depends_on: Iterable[str] | None = None,
+    ) -> None:
+        if wrapped is not None:
+            self.wrapped = wrapped
+            self.__doc__ = wrapped.__doc__
+            self.name = wrapped.__name__
+        self.cache_exceptions = _exception_types(cache_exceptions)
+        self.exception_ttl = exception_ttl
+        self.cache_if = cache_if
+        self.writable = writable
+        self.depends_on = None if depends_on is None else frozenset(depends_on)
+
+    def __call__(self, wrapped: Callable[[Any], _T2]) -> under_cached_property[_T2]:
+        """Decorate ``wrapped``, when the options were passed on their own."""
+        prop = cast("under_cached_property[_T2]", self)
+        prop.wrapped = wrapped
+        prop.__doc__ = wrapped.__doc__
+        prop.name = wrapped.__name__
+        return prop
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        _register_property(owner, name)
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(
+        self, inst: _CacheImpl[Any], owner: type[object] | None = None
+    ) -> _T: ...
+
+    def __get__(
+        self, inst: _CacheImpl[Any] | None, owner: type[object] | None = None
+    ) -> _T | Self:
+        if inst is None:
+            return self
+        cache = inst._cache
+        try:
+            val = cache[self.name]
+        except KeyError:
+            pass
+        else:
+            if type(val) is not _CachedException:
+                return val  # type: ignore[no-any-return]
+            val.reraise_unexpired()
+        try:
+            val = self.wrapped(inst)
+        except self.cache_exceptions as exc:
+            _fill_cache(cache, self.name, _CachedException(exc, self.exception_ttl))
+            raise
+        if self.cache_if is None or self.cache_if(val):
+            _fill_cache(cache, self.name, val)
+        return val
+
+    def __set__(self, inst: _CacheImpl[Any], value: _T) -> None:
+        if not self.writable:
+            raise AttributeError("cached property is read-only")
+        inst._cache[self.name] = value
+
+    def __delete__(self, inst: _CacheImpl[Any]) -> None:
+        if not self.writable:
+            raise AttributeError("cached property is read-only")
+        inst._cache.pop(self.name, None)
+
+
+class mirrored_under_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `under_cached_property`, storing the result of the
+    method it decorates into the instance's ``_cache`` dict, but it also
+    mirrors the result into the instance dict.  It is, in Python parlance,
+    a non-data descriptor, so later reads are served by the interpreter's
+    own attribute lookup without calling the descriptor.  The result is
+    stored in ``_cache`` under a `_MirrorKey`, so removing it from there
+    also removes the mirror.
     """
 
     def __init__(self, wrapped: Callable[[Any], _T]) -> None:
@@ -40,6 +250,9 @@ class under_cached_property(Generic[_T]):
         self.__doc__ = wrapped.__doc__
         self.name = wrapped.__name__
 
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        _register_property(owner, name)
+
     @overload
     def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
 
@@ -53,12 +266,858 @@ class under_cached_property(Generic[_T]):
     ) -> _T | Self:
         if inst is None:
             return self
+        cache = inst._cache
+        try:
+            val: _T = cache[self.name]
+        except KeyError:
+            val = self.wrapped(inst)
+        else:
+            # Stored again below under a key tied to the new mirror.
+            try:
+                del cache[self.name]
+            except TypeError:
+                # The cache is immutable, like `FrozenCache`.
+                return val
+        key = _mirror_key(self.name, inst)
+        try:
+            cache[key] = val
+        except TypeError:
+            # The cache is immutable, like `FrozenCache`, so nothing is
+            # mirrored either.
+            return val
+        inst.__dict__[self.name] = val
+        return val
+
+
+@mypyc_attr(native_class=False)
+class _MirrorKey(str):
+    """A ``_cache`` key of `mirrored_under_cached_property`.
+
+    It removes the mirror of its value from the instance dict once it is
+    released, as happens when the value is deleted from ``_cache``, or the
+    dict is cleared or replaced.  It is pickled along with its instance, so
+    the copies of the instance keep their own mirrors in sync.
+    """
+
+    owner: weakref.ref[Any] | object
+
+    def _instance(self) -> object | None:
+        owner = self.owner
+        if isinstance(owner, weakref.ref):
+            return owner()
+        return owner
+
+    def __del__(self) -> None:
+        inst = self._instance()
+        if inst is not None:
+            inst.__dict__.pop(self, None)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        inst = self._instance()
+        if inst is None:
+            return (str, (str(self),))
+        return (_mirror_key, (str(self), inst))
+
+
+def _mirror_key(name: str, inst: object) -> _MirrorKey:
+    key = _MirrorKey(name)
+    try:
+        key.owner = weakref.ref(inst)
+    except TypeError:
+        # Without weak references, the instance is kept instead, in a
+        # reference cycle through ``_cache``.
+        key.owner = inst
+    return key
+
+
+# Values of `side_cached_property` keyed by the id of their instance. Each
+# instance has a weak reference in ``_side_refs`` whose callback drops the
+# entry when the instance dies, before its id can be reused.
+_side_caches: dict[int, dict[str, Any]] = {}
+_side_refs: dict[int, weakref.ref[Any]] = {}
+
+
+def _release_side_cache(
+    key: int,
+    ref: weakref.ref[Any],
+    refs: dict[int, weakref.ref[Any]] = _side_refs,
+    caches: dict[int, dict[str, Any]] = _side_caches,
+) -> None:
+    # The tables are bound as defaults since instances may die at exit,
+    # once the module globals have been cleared.
+    del refs[key]
+    caches.pop(key, None)
+
+
+def _side_cache(inst: object) -> dict[str, Any]:
+    key = id(inst)
+    cache = _side_caches.get(key)
+    if cache is None:
+        # Raises TypeError for objects not supporting weak references.
+        _side_refs[key] = weakref.ref(inst, partial(_release_side_cache, key))
+        cache = _side_caches[key] = {}
+    return cache
+
+
+@mypyc_attr(native_class=False)
+class side_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `under_cached_property`, but the result of the
+    method it decorates is stored in a table kept by propcache, keyed by
+    the identity of the instance, so the instance needs neither a
+    ``__dict__`` nor a ``_cache`` attribute.  The instance must support
+    weak references, which are used to drop its values when it dies.
+    It is, in Python parlance, a data descriptor; deleting the attribute
+    invalidates the cached value.
+    """
+
+    def __init__(self, wrapped: Callable[[Any], _T]) -> None:
+        self.wrapped = wrapped
+        self.__doc__ = wrapped.__doc__
+        self.name = wrapped.__name__
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        _register_property(owner, name)
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T: ...
+
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T | Self:
+        if inst is None:
+            return self
+        cache = _side_cache(inst)
+        try:
+            return cache[self.name]  # type: ignore[no-any-return]
+        except KeyError:
+            val = self.wrapped(inst)
+            cache[self.name] = val
+            return val
+
+    def __set__(self, inst: object, value: _T) -> None:
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst: object) -> None:
+        cache = _side_caches.get(id(inst))
+        if cache is not None:
+            cache.pop(self.name, None)
+
+
+@mypyc_attr(native_class=False)
+class _ContextStore(dict[int, tuple[weakref.ref[Any], dict[str, Any]]]):
+    """The values of `context_cached_property` in one context.
+
+    The values of each instance are keyed by its id, along with a weak
+    reference to it whose callback drops the entry when the instance dies,
+    before its id can be reused.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+def _release_context_cache(
+    store_ref: weakref.ref[_ContextStore], key: int, ref: weakref.ref[Any]
+) -> None:
+    store = store_ref()
+    if store is not None:
+        store.pop(key, None)
+
+
+# The values of `context_cached_property` in the current context, once
+# `new_context_cache` was called in it or in the context it was copied from.
+_context_values: ContextVar[_ContextStore] = ContextVar("propcache_context_values")
+
+
+def new_context_cache() -> None:
+    """Start caching the values of `context_cached_property` afresh.
+
+    The values computed from now on in the current context, and in the
+    contexts copied from it later, are kept apart from those cached
+    before, which other contexts may share.
+    """
+    _context_values.set(_ContextStore())
+
+
+def _context_cache(inst: object) -> dict[str, Any] | None:
+    """Return the values of ``inst`` in the current context.
+
+    Nothing is cached without a store started by `new_context_cache`, or
+    for instances not supporting weak references, which would otherwise
+    be kept alive by the store.
+    """
+    store = _context_values.get(None)
+    if store is None:
+        return None
+    key = id(inst)
+    entry = store.get(key)
+    if entry is None:
+        try:
+            ref = weakref.ref(
+                inst, partial(_release_context_cache, weakref.ref(store), key)
+            )
+        except TypeError:
+            return None
+        entry = store[key] = (ref, {})
+    return entry[1]
+
+
+@mypyc_attr(native_class=False)
+class context_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `under_cached_property`, but the result of the
+    method it decorates is cached in the current `contextvars.Context`
+    rather than on the instance, so each context, like a request being
+    served, computes it once.  Values are only cached once
+    `new_context_cache` was called, as at the start of each request, and
+    the cache is shared by the context it is called in and the contexts
+    copied from that one later, like those of the tasks it starts.  The
+    values are released along with the contexts, or along with the
+    instances.  The instances are told apart by identity, so they need
+    not be hashable, but they must support weak references for their
+    values to be cached.  It is, in Python parlance, a data descriptor;
+    deleting the attribute invalidates the cached value in the current
+    context.
+    """
+
+    def __init__(self, wrapped: Callable[[Any], _T]) -> None:
+        self.wrapped = wrapped
+        self.__doc__ = wrapped.__doc__
+        self.name = wrapped.__name__
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T: ...
+
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T | Self:
+        if inst is None:
+            return self
+        cache = _context_cache(inst)
+        if cache is None:
+            return self.wrapped(inst)
+        try:
+            return cache[self.name]  # type: ignore[no-any-return]
+        except KeyError:
+            val = self.wrapped(inst)
+            cache[self.name] = val
+            return val
+
+    def __set__(self, inst: object, value: _T) -> None:
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst: object) -> None:
+        store = _context_values.get(None)
+        if store is not None:
+            entry = store.get(id(inst))
+            if entry is not None:
+                entry[1].pop(self.name, None)
+
+
+@mypyc_attr(native_class=False)
+class _ThreadValues(_local):
+    """The values of `thread_cached_property` for one instance.
+
+    Its ``__dict__`` is distinct in each thread, while its ``owner`` is
+    shared: the instance, or a weak reference to it.  Shallow copies of
+    the instance share it through their dict, and replace it with their
+    own on first use.  Copies of it, including pickled ones, start out
+    empty and without an owner.
+    """
+
+    __slots__ = ("owner",)
+
+    owner: weakref.ref[Any] | object
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, ())
+
+
+def _owns_thread_values(inst: object, values: _ThreadValues) -> bool:
+    owner = getattr(values, "owner", None)
+    if isinstance(owner, weakref.ref):
+        owner = owner()
+    return owner is inst
+
+
+def _new_thread_values(
+    inst: object, name: str, stale: _ThreadValues | None
+) -> _ThreadValues:
+    values = _ThreadValues()
+    try:
+        values.owner = weakref.ref(inst)
+    except TypeError:
+        # Without weak references, the instance is kept instead, in a
+        # reference cycle through its dict.
+        values.owner = inst
+    if stale is None:
+        # Another thread may have stored the values first.
+        return inst.__dict__.setdefault(name, values)  # type: ignore[no-any-return]
+    inst.__dict__[name] = values
+    return values
+
+
+@mypyc_attr(native_class=False)
+class thread_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `cached_property`, but the result of the method it
+    decorates is cached once per thread, so each thread uses its own
+    value, like a parser or a database cursor that must not be shared
+    between threads.  The values are kept in a `threading.local` object
+    stored in the instance dict, and are released when their thread exits
+    or the instance dies.  It is, in Python parlance, a data descriptor;
+    deleting the attribute invalidates the cached value of the current
+    thread.
+    """
+
+    def __init__(self, wrapped: Callable[[Any], _T]) -> None:
+        self.wrapped = wrapped
+        self.__doc__ = wrapped.__doc__
+        self.name = wrapped.__name__
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        _register_property(owner, name)
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T: ...
+
+    def __get__(self, inst: object, owner: type[object] | None = None) -> _T | Self:
+        if inst is None:
+            return self
+        values = inst.__dict__.get(self.name)
+        if values is None or not _owns_thread_values(inst, values):
+            values = _new_thread_values(inst, self.name, values)
+        cache = values.__dict__
         try:
-            return inst._cache[self.name]  # type: ignore[no-any-return]
+            return cache[self.name]  # type: ignore[no-any-return]
         except KeyError:
             val = self.wrapped(inst)
-            inst._cache[self.name] = val
+            cache[self.name] = val
             return val
 
+    def __set__(self, inst: object, value: _T) -> None:
+        raise AttributeError("cached property is read-only")
+
+    def __delete__(self, inst: object) -> None:
+        values = inst.__dict__.get(self.name)
+        if values is not None and _owns_thread_values(inst, values):
+            values.__dict__.pop(self.name, None)
+
+
+@mypyc_attr(native_class=False)
+class _WeakValue(weakref.ref):  # type: ignore[type-arg]
+    """A weak reference to a cached value.
+
+    A dedicated type tells these apart from cached values that happen to
+    be weak references themselves.
+    """
+
+    __slots__ = ()
+
+
+def _weak_value_get(cache: Mapping[str, Any], name: str) -> Any:
+    """Return the value cached under ``name``, or ``_NOT_FOUND``."""
+    try:
+        val = cache[name]
+    except KeyError:
+        return _NOT_FOUND
+    if type(val) is _WeakValue:
+        val = val()
+        if val is None:
+            return _NOT_FOUND
+    return val
+
+
+def _weak_value_set(cache: Any, name: str, val: object) -> None:
+    """Cache a weak reference to ``val``, or ``val`` when it has none."""
+    try:
+        val = _WeakValue(val)
+    except TypeError:
+        pass
+    cache[name] = val
+
+
+@mypyc_attr(native_class=False)
+class weak_under_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `under_cached_property`, but only a weak reference to
+    the result of the method it decorates is stored in the instance's
+    ``_cache`` dict, so the result is computed again once nothing else
+    refers to it.  Results that do not support weak references are stored
+    as they are.  It is, in Python parlance, a data descriptor.
+    """
+
+    def __init__(self, wrapped: Callable[[Any], _T]) -> None:
+        self.wrapped = wrapped
+        self.__doc__ = wrapped.__doc__
+        self.name = wrapped.__name__
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        _register_property(owner, name)
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(
+        self, inst: _CacheImpl[Any], owner: type[object] | None = None
+    ) -> _T: ...
+
+    def __get__(
+        self, inst: _CacheImpl[Any] | None, owner: type[object] | None = None
+    ) -> _T | Self:
+        if inst is None:
+            return self
+        cache = inst._cache
+        val = _weak_value_get(cache, self.name)
+        if val is _NOT_FOUND:
+            val = self.wrapped(inst)
+            try:
+                _weak_value_set(cache, self.name, val)
+            except TypeError:
+                # The cache is immutable, like `FrozenCache`.
+                pass
+        return val  # type: ignore[no-any-return]
+
     def __set__(self, inst: _CacheImpl[Any], value: _T) -> None:
         raise AttributeError("cached property is read-only")
+
+
+class cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates almost exactly like
+    the Python `@property` decorator, but it puts the result of the
+    method it decorates into the instance dict after the first call,
+    effectively replacing the function it decorates with an instance
+    variable.  It is, in Python parlance, a non-data descriptor.
+
+    This mirrors the C implementation rather than re-exporting
+    :func:`functools.cached_property` so both backends behave the same:
+    the cached value is written straight into ``__dict__`` without
+    locking, and the name is checked on ``__set_name__``.
+
+    Passing ``cache_exceptions`` caches the exceptions of these types
+    raised by the method as well, optionally for ``exception_ttl``
+    seconds.  They are kept in the instance dict under the name followed
+    by ``".exception"``.  Passing ``cache_if`` only caches the results it
+    returns true for.  Passing ``depends_on`` names the fields the value
+    is computed from, for `propagate_cache`.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[Any], _T] | None = None,
+        *,
+        cache_exceptions: _ExceptionTypes = False,
+        exception_ttl: float | None = None,
+        cache_if: Callable[[Any], object] | None = None,
+        depends_on: Iterable[str] | None = None,
+    ) -> None:
+        if func is not None:
+            self.func = func
+            self.__doc__ = func.__doc__
+        self.name: str | None = None
+        self.cache_exceptions = _exception_types(cache_exceptions)
+        self.exception_ttl = exception_ttl
+        self.cache_if = cache_if
+        self.depends_on = None if depends_on is None else frozenset(depends_on)
+
+    def __call__(self, func: Callable[[Any], _T2]) -> cached_property[_T2]:
+        """Decorate ``func``, when the options were passed on their own."""
+        prop = cast("cached_property[_T2]", self)
+        prop.func = func
+        prop.__doc__ = func.__doc__
+        return prop
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        if self.name is None:
+            self.name = name
+        elif name != self.name:
+            raise TypeError(
+                "Cannot assign the same cached_property to two different names "
+                f"({self.name!r} and {name!r})."
+            )
+        _register_property(owner, name)
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, inst: Any, owner: type[object] | None = None) -> _T: ...
+
+    def __get__(self, inst: Any, owner: type[object] | None = None) -> _T | Self:
+        if inst is None:
+            return self
+        name = self.name
+        if name is None:
+            raise TypeError(
+                "Cannot use cached_property instance"
+                " without calling __set_name__ on it."
+            )
+        # Hits never reach this point since the instance dict takes
+        # precedence over a non-data descriptor, so keep the miss path
+        # flat: one dict probe, one call and one store.
+        cache = inst.__dict__
+        val = cache.get(name, _NOT_FOUND)
+        if val is _NOT_FOUND:
+            if self.cache_exceptions:
+                val = _call_caching_exceptions(self, inst, name)
+            else:
+                val = self.func(inst)
+            if self.cache_if is None or self.cache_if(val):
+                cache[name] = val
+        return val  # type: ignore[no-any-return]
+
+    if TYPE_CHECKING:
+        # Mirror typeshed's ``functools.cached_property`` so overriding the
+        # cached value by assignment keeps type checking.
+        def __set__(self, inst: object, value: _T) -> None: ...
+
+
+def _call_caching_exceptions(prop: cached_property[_T], inst: Any, name: str) -> _T:
+    """Call the function of ``prop``, caching the exceptions it raises.
+
+    Failures are stored in the instance dict under a key that is not an
+    identifier, as the descriptor is not consulted for ``name`` itself once
+    it is in the dict.  Their tracebacks refer to the instance, so keeping
+    them anywhere outside of it would keep the instance alive.
+    """
+    cache = inst.__dict__
+    key = name + _EXCEPTION_SUFFIX
+    failure = cache.get(key)
+    if failure is not None:
+        failure.reraise_unexpired()
+        del cache[key]
+    try:
+        return prop.func(inst)
+    except prop.cache_exceptions as exc:
+        cache[key] = _CachedException(exc, prop.exception_ttl)
+        raise
+
+
+# The names of the attributes of all the descriptors but
+# `context_cached_property` defined in the body of each class, as
+# registered by their `__set_name__`.  The properties themselves would keep
+# their class alive as a key when their method refers to it, as methods
+# calling ``super()`` do, so they are looked up by name.
+_Property = Union["cached_property[Any]", "under_cached_property[Any]"]
+_class_properties: weakref.WeakKeyDictionary[type, list[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# The class attribute keeping the descriptors `inline_cached_properties`
+# removed from the class.
+_INLINED_PROPERTIES = "__inline_cached_properties__"
+
+
+def _register_property(owner: type, name: str) -> None:
+    names = _class_properties.get(owner)
+    if names is None:
+        names = _class_properties[owner] = []
+    if name not in names:
+        names.append(name)
+
+
+def cached_properties(cls: type) -> dict[str, _Property]:
+    """Return the cached properties of ``cls`` by attribute name.
+
+    These are its `cached_property` and `under_cached_property`
+    attributes, the inherited ones included, in the order of the method
+    resolution.  Each class registers its
+    properties when it is created, so only those are looked at rather
+    than all the attributes of the classes.  Properties assigned to a
+    class after it was created are not registered, while those moved
+    away by `inline_cached_properties` are still found.
+    """
+    return _registered_properties(cls, (cached_property, under_cached_property))
+
+
+def _registered_properties(cls: type, types: tuple[type, ...]) -> dict[str, Any]:
+    """Return the registered properties of ``cls`` that are ``types``."""
+    mro = cls.__mro__
+    props: dict[str, Any] = {}
+    for i, klass in enumerate(mro):
+        own = _class_properties.get(klass)
+        if not own:
+            continue
+        klass_dict = vars(klass)
+        inlined = klass_dict.get(_INLINED_PROPERTIES, {})
+        for name in own:
+            if name in props:
+                continue
+            prop = klass_dict.get(name, inlined.get(name))
+            if not isinstance(prop, types):
+                continue
+            # Skip the properties overridden by a subclass attribute.
+            if any(name in vars(sub) for sub in mro[:i]):
+                continue
+            props[name] = prop
+    return props
+
+
+def propagate_cache(
+    src: object,
+    dst: object,
+    *,
+    changed: Iterable[str] = (),
+    names: Iterable[str] | None = None,
+) -> None:
+    """Copy the values cached for ``src`` that are still valid for ``dst``.
+
+    The values of the `cached_property` and `under_cached_property`
+    attributes of the class of ``src``, or only of those in ``names``, are
+    copied to the instance dict or ``_cache`` of ``dst``.  Values of
+    properties depending on one of the ``changed`` fields are left out,
+    and so are the values of properties not declaring ``depends_on`` at
+    all when any field changed.  Cached exceptions are never copied.
+    """
+    changed_fields = frozenset(changed)
+    selected = None if names is None else frozenset(names)
+    for attr, prop in cached_properties(type(src)).items():
+        if selected is not None and attr not in selected:
+            continue
+        depends_on = prop.depends_on
+        if changed_fields and (
+            depends_on is None or not depends_on.isdisjoint(changed_fields)
+        ):
+            continue
+        if isinstance(prop, cached_property):
+            name = prop.name
+            if name is not None and name in src.__dict__:
+                dst.__dict__[name] = src.__dict__[name]
+        else:
+            try:
+                val = src._cache[prop.name]  # type: ignore[attr-defined]
+            except KeyError:
+                continue
+            if type(val) is not _CachedException:
+                dst._cache[prop.name] = val  # type: ignore[attr-defined]
+
+
+# The properties of each class `warm` has seen, as found on its first call:
+# the attribute name, the key of the value and whether it is kept in the
+# instance dict rather than in ``_cache``.  Like in ``_class_properties``,
+# the properties themselves are not kept.
+_WarmPlan = tuple[tuple[str, str, bool], ...]
+_warm_plans: weakref.WeakKeyDictionary[type, _WarmPlan] = weakref.WeakKeyDictionary()
+
+
+def _warm_plan(cls: type) -> _WarmPlan:
+    plan = _warm_plans.get(cls)
+    if plan is None:
+        plan = _warm_plans[cls] = tuple(
+            (attr, attr, True)
+            if isinstance(prop, cached_property)
+            else (attr, prop.name, False)
+            for attr, prop in cached_properties(cls).items()
+        )
+    return plan
+
+
+def warm(
+    inst: object,
+    names: Iterable[str] | None = None,
+    *,
+    executor: Executor | None = None,
+) -> None:
+    """Compute the values of the cached properties of ``inst`` not cached yet.
+
+    All the `cached_property` and `under_cached_property` attributes of
+    the class are computed, or only those in ``names``.  They are found
+    on the first call for each class.  When an ``executor`` is passed,
+    the missing values are computed concurrently by its workers, so they
+    must not depend on each other.
+    """
+    selected = None if names is None else frozenset(names)
+    cls = type(inst)
+    pending = []
+    for attr, key, in_dict in _warm_plan(cls):
+        if selected is not None and attr not in selected:
+            continue
+        if executor is None:
+            getattr(inst, attr)
+            continue
+        store = inst.__dict__ if in_dict else inst._cache  # type: ignore[attr-defined]
+        if key not in store:
+            pending.append(executor.submit(getattr, inst, attr))
+    for future in pending:
+        future.result()
+
+
+class cached_getter:
+    """Return a callable reading the named attributes of its argument.
+
+    It operates like :func:`operator.attrgetter`, returning a tuple of the
+    values, or the value when a single name is given, and reading dotted
+    names attribute by attribute.  The C extension
+    reads the values of `cached_property` and `under_cached_property`
+    attributes straight from their caches; here the attribute lookup of
+    ``attrgetter`` is already the fastest way to read them.
+    """
+
+    def __init__(self, name: str, *names: str) -> None:
+        all_names = (name, *names)
+        for attr in all_names:
+            if not isinstance(attr, str):
+                raise TypeError("attribute name must be a string")
+        self.names = all_names
+        self._getter: Callable[[object], Any] = operator.attrgetter(*all_names)
+
+    def __call__(self, inst: object) -> Any:
+        return self._getter(inst)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.names))})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), self.names)
+
+
+@mypyc_attr(native_class=False)
+class weak_cached_property(Generic[_T]):
+    """Use as a class method decorator.
+
+    It operates like `cached_property`, but only a weak reference to the
+    result of the method it decorates is stored in the instance dict, so
+    the result is computed again once nothing else refers to it.  Results
+    that do not support weak references are stored as they are.  It is,
+    in Python parlance, a data descriptor, and assigning to the attribute
+    caches the assigned value the same way.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.name: str | None = None
+
+    def __set_name__(self, owner: type[object], name: str) -> None:
+        if self.name is None:
+            self.name = name
+        elif name != self.name:
+            raise TypeError(
+                "Cannot assign the same weak_cached_property to two different "
+                f"names ({self.name!r} and {name!r})."
+            )
+        _register_property(owner, name)
+
+    def _check_name(self) -> str:
+        name = self.name
+        if name is None:
+            raise TypeError(
+                "Cannot use weak_cached_property instance"
+                " without calling __set_name__ on it."
+            )
+        return name
+
+    @overload
+    def __get__(self, inst: None, owner: type[object] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, inst: Any, owner: type[object] | None = None) -> _T: ...
+
+    def __get__(self, inst: Any, owner: type[object] | None = None) -> _T | Self:
+        if inst is None:
+            return self
+        name = self._check_name()
+        cache = inst.__dict__
+        val = _weak_value_get(cache, name)
+        if val is _NOT_FOUND:
+            val = self.func(inst)
+            _weak_value_set(cache, name, val)
+        return val  # type: ignore[no-any-return]
+
+    def __set__(self, inst: Any, value: _T) -> None:
+        _weak_value_set(inst.__dict__, self._check_name(), value)
+
+    def __delete__(self, inst: Any) -> None:
+        name = self._check_name()
+        try:
+            del inst.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def inline_cached_properties(cls: type[_Cls]) -> type[_Cls]:
+    """Use as a class decorator.
+
+    It replaces every `cached_property` declared in the class body with a
+    ``__getattr__`` hook computing the value on the first access and
+    storing it in the instance dict.  With no descriptor left on the
+    class, later reads are plain instance attribute lookups, which the
+    specializing interpreter of CPython 3.12+ can inline.
+
+    Looking up a missing attribute goes through the hook, so ``hasattr``
+    misses become slower.  A ``__getattr__`` defined by the class or its
+    bases is still called for names that are not cached properties.
+
+    Any class attribute of the same name would stop the specialization, so
+    the descriptors are moved to the ``__inline_cached_properties__`` dict
+    of the class, where `cached_properties` finds them.  The properties a
+    base class defines as a class attribute, either inherited or
+    overridden, cannot be inlined, and raise a `TypeError`.
+    """
+    for name, prop in cached_properties(cls).items():
+        if not isinstance(prop, cached_property):
+            continue
+        for base in cls.__mro__[1:]:
+            if name in vars(base):
+                raise TypeError(
+                    f"Cannot inline the cached_property {name!r} of "
+                    f"{cls.__qualname__!r}, as {base.__qualname__!r} defines "
+                    "it as a class attribute."
+                )
+    props: dict[str, cached_property[Any]] = {}
+    funcs: dict[str, Callable[[Any], Any]] = {}
+    for name, attr in list(vars(cls).items()):
+        if isinstance(attr, cached_property):
+            props[name] = attr
+            funcs[name] = attr.func
+            delattr(cls, name)
+    setattr(cls, _INLINED_PROPERTIES, props)
+    fallback: Callable[[Any, str], Any] | None = getattr(cls, "__getattr__", None)
+
+    def __getattr__(self: Any, name: str) -> Any:
+        func = funcs.get(name)
+        if func is None:
+            if fallback is None:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no attribute {name!r}"
+                )
+            return fallback(self, name)
+        val = func(self)
+        # Unlike writing to ``__dict__``, the generic setattr keeps the
+        # values inlined in the instance, which is what gets specialized.
+        object.__setattr__(self, name, val)
+        return val
+
+    __getattr__.__qualname__ = f"{cls.__qualname__}.__getattr__"
+    setattr(cls, "__getattr__", __getattr__)
+    return cls
+
+
+# Compiled with mypyc, the descriptors which are not native classes lose
+# their ``Generic`` base, so they are made subscriptable again, like the
+# descriptors of the other backends.
+for _generic in (
+    under_cached_property,
+    mirrored_under_cached_property,
+    side_cached_property,
+    context_cached_property,
+    thread_cached_property,
+    weak_under_cached_property,
+    cached_property,
+    weak_cached_property,
+):
+    if not hasattr(_generic, "__class_getitem__"):  # pragma: no cover
+        setattr(_generic, "__class_getitem__", classmethod(GenericAlias))
@@ -0,0 +1,183 @@
+"""Cached values persisted on disk across restarts."""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import hashlib
+import marshal
+import os
+import pickle
+import sqlite3
+import threading
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from ._helpers import under_cached_property
+
+__all__ = ("persistent_cached_property",)
+
+_T = TypeVar("_T")
+
+
+class _Serializer(Protocol):
+    """Turns the values into the data stored, like `pickle` or `json`."""
+
+    def dumps(self, value: Any, /) -> bytes | str: ...
+
+    def loads(self, data: Any, /) -> Any: ...
+
+
+def _fingerprint(func: Callable[..., Any], version: str) -> str:
+    """Return a digest changing along with the code of ``func``."""
+    code = func.__code__
+    data = marshal.dumps((code.co_code, code.co_consts, code.co_names))
+    return hashlib.sha256(data + version.encode()).hexdigest()
+
+
+class _Store:
+    """A table of serialized values in a SQLite database.
+
+    The database is opened on first use, and shared between threads.  A
+    forked child opens its own connection, as SQLite connections must
+    not be used across a fork.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        # The connection of the parent is left alone rather than closed,
+        # which could affect its transactions, and so is the lock, which
+        # another thread of the parent may have held.
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = os.getpid()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Forked without running the ``os.register_at_fork`` hooks.
+            self._connection = None
+            self._pid = os.getpid()
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS propcache ("
+                "name TEXT, key TEXT, fingerprint TEXT, value BLOB, "
+                "PRIMARY KEY (name, key))"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, name: str, key: str, fingerprint: str) -> Any:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT fingerprint, value FROM propcache"
+                    " WHERE name = ? AND key = ?",
+                    (name, key),
+                )
+                .fetchone()
+            )
+        if row is None or row[0] != fingerprint:
+            return None
+        return row[1]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def set(self, name: str, key: str, fingerprint: str, value: bytes | str) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO propcache VALUES (?, ?, ?, ?)",
+                    (name, key, fingerprint, value),
+                )
+
+
+_stores: dict[str, _Store] = {}
+_stores_lock = threading.Lock()
+
+
+def _close_stores() -> None:
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+
+
+def _after_fork() -> None:
+    global _stores_lock
+    _stores_lock = threading.Lock()
+    for store in _stores.values():
+        store._after_fork()
+
+
+atexit.register(_close_stores)
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _store(path: str | os.PathLike[str]) -> _Store:
+    path = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = _Store(path)
+        return store
+
+
+def persistent_cached_property(
+    path: str | os.PathLike[str],
+    *,
+    key: Callable[[Any], str],
+    version: str = "",
+    serializer: _Serializer | None = None,
+) -> Callable[[Callable[[Any], _T]], under_cached_property[_T]]:
+    """Return a decorator caching values in a SQLite database at ``path``.
+
+    The decorated method becomes an `under_cached_property`, so cached
+    values are read from the instance's ``_cache`` dict as usual.  On a
+    miss the value is looked up in the database by the name of the method
+    and ``key(inst)``, a string identifying the instance across restarts,
+    and only computed when not found.  Values are stale once the code of
+    the method or ``version`` changes.
+
+    Values are pickled unless another ``serializer`` with ``dumps`` and
+    ``loads`` functions is passed.  Unpickling runs arbitrary code, so
+    anyone able to write to the database can run code in the processes
+    reading it; pass a serializer like `json` unless only trusted users
+    can write to ``path``.
+    """
+
+    def decorator(func: Callable[[Any], _T]) -> under_cached_property[_T]:
+        name = f"{func.__module__}.{func.__qualname__}"
+        fingerprint = _fingerprint(func, version)
+        store = _store(path)
+
+        def load(inst: Any) -> _T:
+            inst_key = key(inst)
+            data = store.get(name, inst_key, fingerprint)
+            if data is not None:
+                if serializer is None:
+                    return pickle.loads(data)  # type: ignore[no-any-return]
+                return serializer.loads(data)  # type: ignore[no-any-return]
+            value = func(inst)
+            if serializer is None:
+                data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            else:
+                data = serializer.dumps(value)
+            store.set(name, inst_key, fingerprint, data)
+            return value
+
+        functools.update_wrapper(load, func)
+        return under_cached_property(load)
+
+    return decorator
@@ -0,0 +1,166 @@
+"""Leaving cached values out of pickled state."""
+
+from __future__ import annotations
+
+import copy
+import weakref
+from collections.abc import Mapping
+from typing import Any
+
+from . import _helpers
+from ._frozen import FrozenCache
+
+__all__ = ("CacheFreePickleMixin", "cache_free_state")
+
+# Descriptors by where they keep their values.
+_DICT_DESCRIPTORS = (
+    _helpers.cached_property,
+    _helpers.mirrored_under_cached_property,
+    _helpers.thread_cached_property,
+    _helpers.weak_cached_property,
+)
+_CACHE_DESCRIPTORS = (
+    _helpers.under_cached_property,
+    _helpers.mirrored_under_cached_property,
+    _helpers.weak_under_cached_property,
+)
+_WEAK_DESCRIPTORS = (
+    _helpers.weak_cached_property,
+    _helpers.weak_under_cached_property,
+)
+_PICKLED_DESCRIPTORS = _DICT_DESCRIPTORS + _CACHE_DESCRIPTORS
+
+_CachedNames = tuple[frozenset[str], frozenset[str]]
+_NO_NAMES: _CachedNames = (frozenset(), frozenset())
+# The cached names of each class, with and without the weak values.
+_names_by_class: weakref.WeakKeyDictionary[type, tuple[_CachedNames, _CachedNames]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _value_key(name: str, prop: object) -> str:
+    """Return the key ``prop``, registered as ``name``, caches values under."""
+    if isinstance(prop, (_helpers.cached_property, _helpers.weak_cached_property)):
+        # Their name is checked to be the attribute name.
+        return name
+    # The others cache under the name of their method.
+    return prop.wrapped.__name__  # type: ignore[attr-defined,no-any-return]
+
+
+def _collect_names(cls: type) -> tuple[_CachedNames, _CachedNames]:
+    """Return the cached names of ``cls``, with and without the weak values."""
+    dict_names: set[str] = set()
+    cache_names: set[str] = set()
+    weak_dict_names: set[str] = set()
+    weak_cache_names: set[str] = set()
+    props = _helpers._registered_properties(cls, _PICKLED_DESCRIPTORS)
+    for name, prop in props.items():
+        key = _value_key(name, prop)
+        weak = isinstance(prop, _WEAK_DESCRIPTORS)
+        if isinstance(prop, _DICT_DESCRIPTORS):
+            # Along with the exceptions cached by ``cached_property``.
+            keys = (key, key + ".exception")
+            (weak_dict_names if weak else dict_names).update(keys)
+        if isinstance(prop, _CACHE_DESCRIPTORS):
+            (weak_cache_names if weak else cache_names).add(key)
+    strong = (frozenset(dict_names), frozenset(cache_names))
+    every = (strong[0] | weak_dict_names, strong[1] | weak_cache_names)
+    return every, strong
+
+
+def _cached_names(cls: type, *, weak: bool = True) -> _CachedNames:
+    """Return the keys of cached values in ``__dict__`` and in ``_cache``.
+
+    The values of the weak descriptors are left out unless ``weak`` is
+    true.  The descriptors are looked up in the registry filled when the
+    classes are created, once per class.
+    """
+    names = _names_by_class.get(cls)
+    if names is None:
+        names = _names_by_class[cls] = _collect_names(cls)
+    return names[0] if weak else names[1]
+
+
+def _slot_names(cls: type) -> list[str]:
+    """Return the names of the slots of ``cls`` and its bases.
+
+    These are the attributes :meth:`object.__getstate__` puts in the slot
+    state, with the private names mangled.
+    """
+    names = []
+    for klass in cls.__mro__:
+        slots = vars(klass).get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                stripped = klass.__name__.lstrip("_")
+                if stripped:
+                    name = f"_{stripped}{name}"
+            names.append(name)
+    return names
+
+
+def _without(cache: Mapping[str, Any], names: frozenset[str]) -> Mapping[str, Any]:
+    if not names:
+        return cache
+    if type(cache) is dict:
+        return {key: value for key, value in cache.items() if key not in names}
+    if type(cache) is FrozenCache:
+        values = {key: value for key, value in cache.items() if key not in names}
+        return FrozenCache(values, cache.strict)
+    # Copy other mappings, like ``BoundedCache``, to keep their settings.
+    stripped = copy.copy(cache)
+    for name in names.intersection(stripped):
+        del stripped[name]  # type: ignore[attr-defined]
+    return stripped
+
+
+def cache_free_state(obj: object) -> Any:
+    """Return the state of ``obj`` to pickle, without its cached values.
+
+    The state has the format of :meth:`object.__getstate__`, which the
+    default unpickling restores.  The values of the propcache descriptors
+    of the class are left out of the instance dict and of the ``_cache``
+    mapping, which is copied rather than modified.
+    """
+    cls = type(obj)
+    dict_names, cache_names = getattr(cls, "_propcache_unpickled", None) or (
+        _cached_names(cls)
+    )
+    state = getattr(obj, "__dict__", None)
+    if state is not None:
+        state = {key: value for key, value in state.items() if key not in dict_names}
+        if "_cache" in state:
+            state["_cache"] = _without(state["_cache"], cache_names)
+    slots = {}
+    for name in _slot_names(cls):
+        try:
+            value = getattr(obj, name)
+        except AttributeError:
+            continue
+        slots[name] = _without(value, cache_names) if name == "_cache" else value
+    if slots:
+        return state, slots
+    return state
+
+
+class CacheFreePickleMixin:
+    """Leave the cached values out when pickling instances.
+
+    The propcache descriptors of each subclass are collected when it is
+    created.  Pass ``include_cache=True`` as a class keyword to pickle
+    its cached values after all, as without the mixin.
+    """
+
+    __slots__ = ()
+    _propcache_unpickled: tuple[frozenset[str], frozenset[str]]
+
+    def __init_subclass__(cls, *, include_cache: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._propcache_unpickled = _NO_NAMES if include_cache else _cached_names(cls)
+
+    def __getstate__(self) -> Any:
+        return cache_free_state(self)
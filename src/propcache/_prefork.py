@@ -0,0 +1,37 @@
+"""Computing cached values before forking worker processes."""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Iterable
+
+from . import _helpers
+
+__all__ = ("prefork_warm",)
+
+# The weak descriptors are left out, as nothing would keep their values.
+_WARMED_DESCRIPTORS = (
+    _helpers.cached_property,
+    _helpers.under_cached_property,
+    _helpers.mirrored_under_cached_property,
+    _helpers.side_cached_property,
+)
+
+
+def prefork_warm(objects: Iterable[object], *, freeze: bool = True) -> None:
+    """Compute the cached values of ``objects`` before forking workers.
+
+    Every propcache property of the objects is read, so that the workers
+    inherit the values instead of each computing them.  Unless ``freeze``
+    is false, the garbage collector is then run and told to ignore all
+    the objects alive, so that collections in the workers do not write
+    to the memory pages of the inherited objects, which the workers keep
+    sharing with the parent as long as nothing writes to them.
+    """
+    for obj in objects:
+        for name in _helpers._registered_properties(type(obj), _WARMED_DESCRIPTORS):
+            getattr(obj, name)
+    # Missing on PyPy.
+    if freeze and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
@@ -0,0 +1,169 @@
+"""Sharing cached values between processes through shared memory."""
+
+from __future__ import annotations
+
+import pickle
+import struct
+import sys
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+
+from ._pickling import _cached_names
+
+__all__ = ("CacheSnapshot",)
+
+# The segment starts with the size of the pickled index, which maps each
+# key to the offset and size of the pickled values of its object.
+_HEADER = struct.Struct("<Q")
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise ValueError("the snapshot is closed")
+    return buf
+
+
+def _cached_values(obj: object) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the values cached for ``obj`` in ``__dict__`` and ``_cache``."""
+    dict_names, cache_names = _cached_names(type(obj), weak=False)
+    inst_dict = getattr(obj, "__dict__", {})
+    dict_values = {name: inst_dict[name] for name in dict_names if name in inst_dict}
+    cache = getattr(obj, "_cache", None)
+    cache_values = {}
+    if cache is not None:
+        cache_values = {name: cache[name] for name in cache_names if name in cache}
+    return dict_values, cache_values
+
+
+class CacheSnapshot:
+    """A snapshot of cached values in a shared memory segment.
+
+    A parent process creates the snapshot from the objects whose cached
+    values are worth sharing, by key.  Other processes attach to it by
+    name and restore the values into their own equal objects, each one
+    unpickled only when it is restored.  Values already cached by an
+    object are kept.
+
+    The values of an object are restored all at once rather than on the
+    first access to each, which would put a snapshot lookup on every
+    descriptor miss.
+
+    The creating process owns the segment and unlinks it once done, which
+    leaving a ``with`` block does; the attaching processes are expected
+    to be its workers.
+    """
+
+    def __init__(
+        self,
+        shm: SharedMemory,
+        index: dict[str, tuple[int, int]],
+        base: int,
+        *,
+        owner: bool,
+    ) -> None:
+        self._shm = shm
+        self._index = index
+        self._base = base
+        self._owner = owner
+
+    @classmethod
+    def create(
+        cls, objects: Mapping[str, object], *, name: str | None = None
+    ) -> CacheSnapshot:
+        """Write the cached values of ``objects`` into a new segment."""
+        blobs = {
+            key: pickle.dumps(_cached_values(obj), pickle.HIGHEST_PROTOCOL)
+            for key, obj in objects.items()
+        }
+        index = {}
+        offset = 0
+        for key, blob in blobs.items():
+            index[key] = (offset, len(blob))
+            offset += len(blob)
+        index_data = pickle.dumps(index, pickle.HIGHEST_PROTOCOL)
+        base = _HEADER.size + len(index_data)
+        shm = SharedMemory(name=name, create=True, size=base + offset)
+        buf = _buffer(shm)
+        _HEADER.pack_into(buf, 0, len(index_data))
+        buf[_HEADER.size : base] = index_data
+        for key, blob in blobs.items():
+            start = base + index[key][0]
+            buf[start : start + len(blob)] = blob
+        return cls(shm, index, base, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> CacheSnapshot:
+        """Open the snapshot created under ``name`` by another process."""
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=False)
+        else:
+            # Registers the segment with the resource tracker again, which
+            # child processes share with the parent that created it.
+            shm = SharedMemory(name=name)
+        buf = _buffer(shm)
+        (index_size,) = _HEADER.unpack_from(buf)
+        base = _HEADER.size + index_size
+        index = pickle.loads(buf[_HEADER.size : base])
+        return cls(shm, index, base, owner=False)
+
+    @property
+    def name(self) -> str:
+        """The name to attach to the snapshot by."""
+        return self._shm.name
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def restore(self, key: str, obj: object) -> bool:
+        """Restore the values cached for ``key`` into ``obj``.
+
+        Return whether the snapshot has values for ``key``.
+        """
+        try:
+            offset, size = self._index[key]
+        except KeyError:
+            return False
+        start = self._base + offset
+        buf = _buffer(self._shm)
+        dict_values, cache_values = pickle.loads(buf[start : start + size])
+        if dict_values:
+            inst_dict = obj.__dict__
+            for name, value in dict_values.items():
+                inst_dict.setdefault(name, value)
+        if cache_values:
+            cache = obj._cache  # type: ignore[attr-defined]
+            for name, value in cache_values.items():
+                if name not in cache:
+                    cache[name] = value
+        return True
+
+    def close(self) -> None:
+        """Close the segment in this process."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the segment, once no process is going to attach to it."""
+        self._shm.unlink()
+
+    def __enter__(self) -> CacheSnapshot:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pass snapshots to other processes by name.
+        return (CacheSnapshot.attach, (self.name,))
@@ -1,8 +1,97 @@
 """Public API of the property caching library."""
 
-from ._helpers import cached_property, under_cached_property
+import importlib
+from typing import TYPE_CHECKING
+
+from ._bounded import BoundedCache
+from ._frozen import FrozenCache, freeze
+from ._helpers import (
+    cached_getter,
+    cached_properties,
+    cached_property,
+    context_cached_property,
+    inline_cached_properties,
+    is_not_none,
+    mirrored_under_cached_property,
+    new_context_cache,
+    propagate_cache,
+    side_cached_property,
+    thread_cached_property,
+    under_cached_property,
+    warm,
+    weak_cached_property,
+    weak_under_cached_property,
+)
+
+if TYPE_CHECKING:
+    from ._deferred import (
+        deferred_cached_property,
+        deferred_under_cached_property,
+        start_deferred,
+    )
+    from ._persistent import persistent_cached_property
+    from ._pickling import CacheFreePickleMixin, cache_free_state
+    from ._prefork import prefork_warm
+    from ._snapshot import CacheSnapshot
+
+# The modules of the helpers whose dependencies, like ``sqlite3`` or
+# ``multiprocessing.shared_memory``, are only imported once they are used.
+_LAZY_MODULES = {
+    "CacheFreePickleMixin": "._pickling",
+    "CacheSnapshot": "._snapshot",
+    "cache_free_state": "._pickling",
+    "deferred_cached_property": "._deferred",
+    "deferred_under_cached_property": "._deferred",
+    "persistent_cached_property": "._persistent",
+    "prefork_warm": "._prefork",
+    "start_deferred": "._deferred",
+}
 
 __all__ = (
+    "BoundedCache",
+    "CacheFreePickleMixin",
+    "CacheSnapshot",
+    "FrozenCache",
+    "cache_free_state",
+    "cached_getter",
+    "cached_properties",
     "cached_property",
+    "context_cached_property",
+    "deferred_cached_property",
+    "deferred_under_cached_property",
+    "freeze",
+    "inline_cached_properties",
+    "is_not_none",
+    "mirrored_under_cached_property",
+    "new_context_cache",
+    "persistent_cached_property",
+    "prefork_warm",
+    "propagate_cache",
+    "side_cached_property",
+    "start_deferred",
+    "thread_cached_property",
     "under_cached_property",
+    "warm",
+    "weak_cached_property",
+    "weak_under_cached_property",
 )
+
+
+def _import_lazy(attr: str) -> object:
+    """Import the helpers listed in ``_LAZY_MODULES`` on first use."""
+    try:
+        module_name = _LAZY_MODULES[attr]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}") from None
+    value = getattr(importlib.import_module(module_name, __package__), attr)
+    globals()[attr] = value
+    return value
+
+
+def _dir_lazy() -> list[str]:
+    """Include the lazily imported helpers in the module's dir() output."""
+    return [*globals().keys(), *_LAZY_MODULES]
+
+
+__getattr__ = _import_lazy
+__dir__ = _dir_lazy
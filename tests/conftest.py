@@ -2,11 +2,16 @@ import argparse
 from dataclasses import dataclass
 from functools import cached_property
 from importlib import import_module
+from importlib.util import find_spec
 from types import ModuleType
 
 import pytest
 
 C_EXT_MARK = pytest.mark.c_extension
+MYPYC_EXT_SKIP_MARK = pytest.mark.skipif(
+    find_spec("propcache._helpers_mypyc") is None,
+    reason="The mypyc backend is only built with the `with-mypyc` setting",
+)
 
 
 @dataclass(frozen=True)
@@ -24,15 +29,25 @@ class PropcacheImplementation:
     is_pure_python: bool
     """A flag showing whether this is a pure-python module or a C-extension."""
 
+    is_mypyc: bool = False
+    """A flag showing whether this is the mypyc-compiled pure-python module."""
+
     @cached_property
     def tag(self) -> str:
         """Return a text representation of the pure-python attribute."""
+        if self.is_mypyc:
+            return "mypyc-extension"
         return "pure-python" if self.is_pure_python else "c-extension"
 
     @cached_property
     def imported_module(self) -> ModuleType:
         """Return a loaded importable containing a propcache variant."""
-        importable_module = "_helpers_py" if self.is_pure_python else "_helpers_c"
+        if self.is_mypyc:
+            importable_module = "_helpers_mypyc"
+        elif self.is_pure_python:
+            importable_module = "_helpers_py"
+        else:
+            importable_module = "_helpers_c"
         return import_module(f"propcache.{importable_module}")
 
     def __str__(self) -> str:
@@ -47,6 +62,10 @@ class PropcacheImplementation:
             PropcacheImplementation(is_pure_python=False),
             marks=C_EXT_MARK,
         ),
+        pytest.param(
+            PropcacheImplementation(is_pure_python=False, is_mypyc=True),
+            marks=(C_EXT_MARK, MYPYC_EXT_SKIP_MARK),
+        ),
         PropcacheImplementation(is_pure_python=True),
     ),
     ids=str,
@@ -1,11 +1,96 @@
 """Test we do not break the public API."""
 
+import os
+import subprocess
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+
+import pytest
+
 from propcache import _helpers, api
 
+IS_PYPY = hasattr(sys, "pypy_version_info")
+
 
 def test_api() -> None:
     """Verify the public API is accessible."""
     assert api.cached_property is not None
     assert api.under_cached_property is not None
     assert api.cached_property is _helpers.cached_property
+    assert api.BoundedCache is not None
+    assert api.CacheFreePickleMixin is not None
+    assert api.CacheSnapshot is not None
+    assert api.FrozenCache is not None
+    assert api.freeze is not None
+    assert api.cache_free_state is not None
     assert api.under_cached_property is _helpers.under_cached_property
+    assert api.mirrored_under_cached_property is _helpers.mirrored_under_cached_property
+    assert api.inline_cached_properties is _helpers.inline_cached_properties
+    assert api.is_not_none is _helpers.is_not_none
+    assert api.cached_properties is _helpers.cached_properties
+    assert api.cached_getter is _helpers.cached_getter
+    assert api.context_cached_property is _helpers.context_cached_property
+    assert api.new_context_cache is _helpers.new_context_cache
+    assert api.propagate_cache is _helpers.propagate_cache
+    assert api.warm is _helpers.warm
+    assert api.deferred_cached_property is not None
+    assert api.deferred_under_cached_property is not None
+    assert api.persistent_cached_property is not None
+    assert api.prefork_warm is not None
+    assert api.start_deferred is not None
+    assert api.side_cached_property is _helpers.side_cached_property
+    assert api.thread_cached_property is _helpers.thread_cached_property
+    assert api.weak_cached_property is _helpers.weak_cached_property
+    assert api.weak_under_cached_property is _helpers.weak_under_cached_property
+
+
+@pytest.mark.c_extension
+@pytest.mark.skipif(IS_PYPY, reason="PyPy has no C extension")
+def test_c_api_is_exported() -> None:
+    """Verify the C API is exported as capsules for other extensions."""
+    helpers_c = import_module("propcache._helpers_c")
+    assert set(helpers_c.__pyx_capi__) >= {
+        "propcache_cached_property_get",
+        "propcache_cached_property_set",
+        "propcache_under_cached_property_get",
+        "propcache_under_cached_property_set",
+    }
+
+
+def run_python(code: str, **env: str) -> "subprocess.CompletedProcess[str]":
+    """Run ``code`` in a new interpreter importing the tested propcache."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), **env}
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, env=env, text=True
+    )
+
+
+def test_api_imports_optional_helpers_lazily() -> None:
+    """Verify importing the API leaves the heavier dependencies out."""
+    code = (
+        "import sys, propcache.api; "
+        "print(sorted({'sqlite3', 'multiprocessing.shared_memory', "
+        "'concurrent.futures', 'pickle'} & set(sys.modules)))"
+    )
+    assert run_python(code).stdout == "[]\n"
+
+
+def test_api_lazy_attributes() -> None:
+    """Verify the lazily imported helpers are cached and listed."""
+    assert api.CacheSnapshot is api.CacheSnapshot
+    assert "prefork_warm" in dir(api)
+    with pytest.raises(AttributeError, match="has no attribute 'invalid_attr'"):
+        api.invalid_attr  # noqa: B018
+
+
+@pytest.mark.skipif(IS_PYPY, reason="PyPy has no C extension")
+def test_mypyc_backend_requested_without_fallback() -> None:
+    """Verify requesting the mypyc backend never falls back to another one."""
+    code = "import propcache.api as api; print(api.cached_property.__module__)"
+    result = run_python(code, PROPCACHE_USE_MYPYC="1", PROPCACHE_NO_EXTENSIONS="")
+    if find_spec("propcache._helpers_mypyc") is None:
+        assert result.returncode != 0
+        assert "propcache._helpers_mypyc" in result.stderr
+    else:
+        assert result.stdout == "propcache._helpers_mypyc\n"
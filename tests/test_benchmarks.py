@@ -1,6 +1,10 @@
 """codspeed benchmarks for propcache."""
 
-from typing import TYPE_CHECKING
+import contextvars
+import functools
+import pickle
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
 import pytest
 
@@ -9,19 +13,144 @@ if TYPE_CHECKING:
 else:  # pragma: no branch
     pytest_codspeed = pytest.importorskip("pytest_codspeed")
 
-from propcache import cached_property, under_cached_property
+from propcache.api import (
+    BoundedCache,
+    CacheFreePickleMixin,
+    cached_property,
+    context_cached_property,
+    freeze,
+    mirrored_under_cached_property,
+    side_cached_property,
+    thread_cached_property,
+    under_cached_property,
+    weak_cached_property,
+    weak_under_cached_property,
+)
+
+_T_co = TypeVar("_T_co", covariant=True)
+_Cls = TypeVar("_Cls")
+
+
+class APIProtocol(Protocol):
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> cached_property[_T_co]: ...
+
+    @overload
+    def under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self,
+        *,
+        cache_exceptions: type[BaseException] | bool = False,
+        cache_if: Callable[[Any], object] | None = None,
+        depends_on: tuple[str, ...] | None = None,
+    ) -> "under_cached_property[Any]": ...
+
+    def is_not_none(self, value: object) -> bool: ...
+
+    def warm(self, inst: object) -> None: ...
+
+    def cached_properties(self, cls: type) -> dict[str, Any]: ...
+
+    def cached_getter(self, name: str, *names: str) -> Callable[[object], Any]: ...
+
+    def propagate_cache(
+        self, src: object, dst: object, *, changed: tuple[str, ...] = ()
+    ) -> None: ...
+
+    def mirrored_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> mirrored_under_cached_property[_T_co]: ...
+
+    def context_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> context_cached_property[_T_co]: ...
+
+    def new_context_cache(self) -> None: ...
+
+    def side_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> side_cached_property[_T_co]: ...
+
+    def thread_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> thread_cached_property[_T_co]: ...
+
+    def weak_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> weak_under_cached_property[_T_co]: ...
+
+    def weak_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> weak_cached_property[_T_co]: ...
+
+    def inline_cached_properties(self, cls: type[_Cls]) -> type[_Cls]: ...
 
 
 def test_under_cached_property_cache_hit(
     benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for under_cached_property cache hit with ``_cache`` in ``__dict__``."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache = {"prop": 42}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            raise NotImplementedError
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_under_cached_property_cache_hit_frozen(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for under_cached_property cache hit with a frozen cache."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache = {"prop": 42}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            raise NotImplementedError
+
+    t = Test()
+    freeze(t)
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_under_cached_property_cache_hit_slots(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
 ) -> None:
-    """Benchmark for under_cached_property cache hit."""
+    """Benchmark for under_cached_property cache hit with a ``_cache`` slot."""
 
     class Test:
+        __slots__ = ("_cache",)
+
         def __init__(self) -> None:
             self._cache = {"prop": 42}
 
-        @under_cached_property
+        @propcache_module.under_cached_property
         def prop(self) -> int:
             """Return the value of the property."""
             raise NotImplementedError
@@ -34,14 +163,65 @@ def test_under_cached_property_cache_hit(
             t.prop
 
 
-def test_cached_property_cache_hit(benchmark: pytest_codspeed.BenchmarkFixture) -> None:
+def test_under_cached_property_bounded_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for under_cached_property cache hit with a BoundedCache."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache = BoundedCache(maxsize=8)
+            self._cache["prop"] = 42
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            raise NotImplementedError
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_mirrored_under_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for mirrored_under_cached_property cache hit."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
     """Benchmark for cached_property cache hit."""
 
     class Test:
         def __init__(self) -> None:
             self.__dict__["prop"] = 42
 
-        @cached_property
+        @propcache_module.cached_property
         def prop(self) -> int:
             """Return the value of the property."""
             raise NotImplementedError
@@ -54,8 +234,212 @@ def test_cached_property_cache_hit(benchmark: pytest_codspeed.BenchmarkFixture)
             t.prop
 
 
+def test_side_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for side_cached_property cache hit."""
+
+    class Test:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_context_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for context_cached_property cache hit."""
+
+    class Test:
+        @propcache_module.context_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    context = contextvars.Context()
+    context.run(propcache_module.new_context_cache)
+    context.run(getattr, t, "prop")
+
+    def read() -> None:
+        for _ in range(100):
+            t.prop
+
+    @benchmark
+    def _run() -> None:
+        context.run(read)
+
+
+def test_thread_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for thread_cached_property cache hit."""
+
+    class Test:
+        @propcache_module.thread_cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_weak_under_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for weak_under_cached_property cache hit."""
+
+    class Value:
+        pass
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, Value] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> Value:
+            """Return the value of the property."""
+            return Value()
+
+    t = Test()
+    value = t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+    assert t.prop is value
+
+
+def test_weak_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for weak_cached_property cache hit."""
+
+    class Value:
+        pass
+
+    class Test:
+        @propcache_module.weak_cached_property
+        def prop(self) -> Value:
+            """Return the value of the property."""
+            return Value()
+
+    t = Test()
+    value = t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+    assert t.prop is value
+
+
+def test_inline_cached_properties_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for inline_cached_properties cache hit."""
+
+    @propcache_module.inline_cached_properties
+    class Test:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+# The benchmarks below do not involve propcache. They are the baselines the
+# cache hits above are compared to on every Python version.
+
+
+def test_plain_attribute_read(benchmark: pytest_codspeed.BenchmarkFixture) -> None:
+    """Benchmark for reading a plain instance attribute."""
+
+    class Test:
+        def __init__(self) -> None:
+            self.prop = 42
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_property_read(benchmark: pytest_codspeed.BenchmarkFixture) -> None:
+    """Benchmark for reading a builtin property."""
+
+    class Test:
+        @property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_functools_cached_property_cache_hit(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+) -> None:
+    """Benchmark for functools.cached_property cache hit."""
+
+    class Test:
+        @functools.cached_property
+        def prop(self) -> int:
+            """Return the value of the property."""
+            return 42
+
+    t = Test()
+    t.prop
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
 def test_under_cached_property_cache_miss(
     benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
 ) -> None:
     """Benchmark for under_cached_property cache miss."""
 
@@ -63,7 +447,7 @@ def test_under_cached_property_cache_miss(
         def __init__(self) -> None:
             self._cache: dict[str, int] = {}
 
-        @under_cached_property
+        @propcache_module.under_cached_property
         def prop(self) -> int:
             """Return the value of the property."""
             return 42
@@ -78,13 +462,195 @@ def test_under_cached_property_cache_miss(
             t.prop
 
 
+def test_under_cached_property_cached_exception(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for under_cached_property raising a cached exception."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(cache_exceptions=ValueError)
+        def prop(self) -> int:
+            """Raise an exception."""
+            raise ValueError
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            try:
+                t.prop
+            except ValueError:
+                pass
+
+
+def test_under_cached_property_cache_if_not_none_rejected(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for under_cached_property not caching a None result."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(cache_if=propcache_module.is_not_none)
+        def prop(self) -> None:
+            """Return None, which is not cached."""
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            t.prop
+
+
+def test_propagate_cache(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for propagate_cache copying the values of a class."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(depends_on=("a",))
+        def prop1(self) -> int:
+            """Return the value of the property."""
+            return 1
+
+        @propcache_module.under_cached_property(depends_on=("b",))
+        def prop2(self) -> int:
+            """Return the value of the property."""
+            return 2
+
+        @propcache_module.cached_property
+        def prop3(self) -> int:
+            """Return the value of the property."""
+            return 3
+
+    src = Test()
+    src.prop1, src.prop2, src.prop3
+    dst = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            propcache_module.propagate_cache(src, dst, changed=("b",))
+
+
+def test_cached_getter(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for reading cached properties with a batched getter."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.cached_property
+        def prop1(self) -> int:
+            """Return the value of the property."""
+            return 1
+
+        @propcache_module.under_cached_property
+        def prop2(self) -> int:
+            """Return the value of the property."""
+            return 2
+
+        @propcache_module.cached_property
+        def prop3(self) -> int:
+            """Return the value of the property."""
+            return 3
+
+        @propcache_module.under_cached_property
+        def prop4(self) -> int:
+            """Return the value of the property."""
+            return 4
+
+    t = Test()
+    getter = propcache_module.cached_getter("prop1", "prop2", "prop3", "prop4")
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            getter(t)
+
+
+def test_cached_properties(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for listing the cached properties of a large class."""
+
+    class Base:
+        @propcache_module.cached_property
+        def prop1(self) -> int:
+            """Return the value of the property."""
+            return 1
+
+        @propcache_module.under_cached_property
+        def prop2(self) -> int:
+            """Return the value of the property."""
+            return 2
+
+    methods: dict[str, Any] = {f"method{i}": lambda self: None for i in range(100)}
+    Test = type("Test", (Base,), methods)
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            propcache_module.cached_properties(Test)
+
+
+def test_warm(
+    benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
+) -> None:
+    """Benchmark for warm on an instance with its values already cached."""
+
+    class Test:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property
+        def prop1(self) -> int:
+            """Return the value of the property."""
+            return 1
+
+        @propcache_module.under_cached_property
+        def prop2(self) -> int:
+            """Return the value of the property."""
+            return 2
+
+        @propcache_module.cached_property
+        def prop3(self) -> int:
+            """Return the value of the property."""
+            return 3
+
+    t = Test()
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            propcache_module.warm(t)
+
+
 def test_cached_property_cache_miss(
     benchmark: pytest_codspeed.BenchmarkFixture,
+    propcache_module: APIProtocol,
 ) -> None:
     """Benchmark for cached_property cache miss."""
 
     class Test:
-        @cached_property
+        @propcache_module.cached_property
         def prop(self) -> int:
             """Return the value of the property."""
             return 42
@@ -97,3 +663,39 @@ def test_cached_property_cache_miss(
         for _ in range(100):
             cache.pop("prop", None)
             t.prop
+
+
+class _PickledRecord(CacheFreePickleMixin, include_cache=True):
+    """A record whose cached values are pickled along with it."""
+
+    def __init__(self) -> None:
+        self._cache: dict[str, Any] = {}
+        self.items = list(range(100))
+
+    @under_cached_property
+    def total(self) -> list[int]:
+        """Return a large derived value."""
+        return [item * 2 for item in self.items]
+
+    @cached_property
+    def text(self) -> str:
+        """Return a large derived value."""
+        return ",".join(map(str, self.items))
+
+
+class _CacheFreeRecord(_PickledRecord):
+    """A record whose cached values are left out when pickling."""
+
+
+@pytest.mark.parametrize("record_type", (_PickledRecord, _CacheFreeRecord))
+def test_pickle_round_trip(
+    benchmark: pytest_codspeed.BenchmarkFixture, record_type: type[_PickledRecord]
+) -> None:
+    """Benchmark for pickling a record with or without its cached values."""
+    record = record_type()
+    record.total, record.text
+
+    @benchmark
+    def _run() -> None:
+        for _ in range(100):
+            pickle.loads(pickle.dumps(record))
@@ -0,0 +1,121 @@
+import copy
+import pickle
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import BoundedCache, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> under_cached_property[_T_co]: ...
+
+
+def test_bounded_cache_maxsize() -> None:
+    cache = BoundedCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    assert list(cache) == ["b", "c"]
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    cache = BoundedCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+
+
+def test_bounded_cache_maxweight() -> None:
+    cache = BoundedCache(maxweight=5, weight=len)
+    cache["a"] = "xx"
+    cache["b"] = "yy"
+    cache["c"] = "zz"
+    assert list(cache) == ["b", "c"]
+
+    cache["b"] = "y"
+    cache["d"] = "w"
+    assert list(cache) == ["c", "b", "d"]
+
+
+def test_bounded_cache_value_over_budget() -> None:
+    cache = BoundedCache(maxweight=1, weight=len)
+    cache["a"] = "x"
+    cache["b"] = "yy"
+    assert not cache
+
+
+def test_bounded_cache_removal_releases_weight() -> None:
+    cache = BoundedCache(maxweight=4, weight=len)
+    cache["a"] = "xx"
+    cache["b"] = "yy"
+    assert cache.pop("a") == "xx"
+    assert cache.pop("a", None) is None
+    with pytest.raises(KeyError):
+        cache.pop("a")
+    del cache["b"]
+    cache["c"] = "zz"
+    cache["d"] = "ww"
+    assert cache.popitem() == ("d", "ww")
+    cache.clear()
+    cache["e"] = "xxxx"
+    assert list(cache) == ["e"]
+
+
+def test_bounded_cache_weight_requires_maxweight() -> None:
+    with pytest.raises(TypeError):
+        BoundedCache(maxweight=1)
+    with pytest.raises(TypeError):
+        BoundedCache(weight=len)
+
+
+@pytest.mark.parametrize(
+    "clone",
+    (BoundedCache.copy, copy.copy, lambda c: pickle.loads(pickle.dumps(c))),
+)
+def test_bounded_cache_copy(clone: Callable[[BoundedCache], BoundedCache]) -> None:
+    cache = BoundedCache(maxsize=3, maxweight=4, weight=len)
+    cache["a"] = "xx"
+    cache["b"] = "yy"
+
+    cloned = clone(cache)
+    assert cloned == cache
+    assert (cloned.maxsize, cloned.maxweight, cloned.weight) == (3, 4, len)
+    cloned["c"] = "z"
+    assert list(cloned) == ["b", "c"]
+
+
+def test_under_cached_property_bounded_cache(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+
+    class A:
+        def __init__(self) -> None:
+            self._cache = BoundedCache(maxsize=2)
+
+        @propcache_module.under_cached_property
+        def a(self) -> str:
+            calls.append("a")
+            return "a"
+
+        @propcache_module.under_cached_property
+        def b(self) -> str:
+            calls.append("b")
+            return "b"
+
+        @propcache_module.under_cached_property
+        def c(self) -> str:
+            calls.append("c")
+            return "c"
+
+    inst = A()
+    assert (inst.a, inst.b, inst.a, inst.c) == ("a", "b", "a", "c")
+    assert list(inst._cache) == ["a", "c"]
+    assert (inst.a, inst.b) == ("a", "b")
+    assert calls == ["a", "b", "c", "b"]
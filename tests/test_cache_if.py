@@ -0,0 +1,145 @@
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar, overload
+
+import pytest
+
+from propcache.api import cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    @overload
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> "cached_property[_T_co]": ...
+
+    @overload
+    def cached_property(
+        self,
+        *,
+        cache_if: Callable[[Any], object] | None = None,
+        cache_exceptions: bool = False,
+    ) -> "cached_property[Any]": ...
+
+    @overload
+    def under_cached_property(
+        self, wrapped: Callable[[Any], _T_co]
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self,
+        *,
+        cache_if: Callable[[Any], object] | None = None,
+        cache_exceptions: bool = False,
+    ) -> "under_cached_property[Any]": ...
+
+    def is_not_none(self, value: object) -> bool: ...
+
+
+def test_is_not_none(propcache_module: APIProtocol) -> None:
+    assert propcache_module.is_not_none(0)
+    assert not propcache_module.is_not_none(None)
+
+
+def test_under_cached_property_cache_if_not_none(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+            self.value: int | None = None
+
+        @propcache_module.under_cached_property(cache_if=propcache_module.is_not_none)
+        def prop(self) -> int | None:
+            nonlocal calls
+            calls += 1
+            return self.value
+
+    a = A()
+    assert (a.prop, a.prop) == (None, None)
+    assert calls == 2
+    assert a._cache == {}
+
+    a.value = 1
+    assert a.prop == 1
+    a.value = 2
+    assert a.prop == 1
+    assert calls == 3
+
+
+def test_under_cached_property_cache_if(propcache_module: APIProtocol) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, str] = {}
+            self.state = "pending"
+
+        @propcache_module.under_cached_property(cache_if=lambda v: v != "pending")
+        def prop(self) -> str:
+            return self.state
+
+    a = A()
+    assert a.prop == "pending"
+    assert a._cache == {}
+    a.state = "done"
+    assert a.prop == "done"
+    a.state = "pending"
+    assert a.prop == "done"
+
+
+@pytest.mark.parametrize("cache_exceptions", (False, True))
+def test_cached_property_cache_if_not_none(
+    propcache_module: APIProtocol, cache_exceptions: bool
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self.value: int | None = None
+
+        @propcache_module.cached_property(
+            cache_if=propcache_module.is_not_none,
+            cache_exceptions=cache_exceptions,
+        )
+        def prop(self) -> int | None:
+            nonlocal calls
+            calls += 1
+            return self.value
+
+    a = A()
+    assert (a.prop, a.prop) == (None, None)
+    assert calls == 2
+    assert "prop" not in a.__dict__
+
+    a.value = 1
+    assert a.prop == 1
+    a.value = 2
+    assert a.prop == 1
+    assert calls == 3
+
+
+def test_cached_property_cache_if(propcache_module: APIProtocol) -> None:
+    checked: list[object] = []
+
+    def cache_if(value: object) -> bool:
+        checked.append(value)
+        return bool(value)
+
+    class A:
+        def __init__(self) -> None:
+            self.items: list[int] = []
+
+        @propcache_module.cached_property(cache_if=cache_if)
+        def prop(self) -> list[int]:
+            return list(self.items)
+
+    a = A()
+    assert a.prop == []
+    a.items.append(1)
+    assert a.prop == [1]
+    a.items.append(2)
+    assert a.prop == [1]
+    assert checked == [[], [1]]
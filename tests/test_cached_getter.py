@@ -0,0 +1,191 @@
+import operator
+import pickle
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar, overload
+
+import pytest
+
+from propcache.api import cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class GetterProtocol(Protocol):
+    @property
+    def names(self) -> tuple[str, ...]: ...
+
+    def __call__(self, inst: object) -> Any: ...
+
+
+class APIProtocol(Protocol):
+    @overload
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> "cached_property[_T_co]": ...
+
+    @overload
+    def cached_property(
+        self, *, cache_if: Callable[[Any], object] | None = None
+    ) -> "cached_property[Any]": ...
+
+    @overload
+    def under_cached_property(
+        self, wrapped: Callable[[Any], _T_co]
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self, *, cache_exceptions: type[BaseException] = ...
+    ) -> "under_cached_property[Any]": ...
+
+    def is_not_none(self, value: object) -> bool: ...
+
+    def cached_getter(self, *names: Any) -> GetterProtocol: ...
+
+
+def make_class(propcache_module: APIProtocol, calls: list[str]) -> type[Any]:
+    class Point:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+            self.x = 1
+
+        @propcache_module.cached_property
+        def y(self) -> int:
+            calls.append("y")
+            return 2
+
+        @propcache_module.under_cached_property
+        def z(self) -> int:
+            calls.append("z")
+            return 3
+
+        @property
+        def norm(self) -> int:
+            return self.x + self.y + self.z
+
+    return Point
+
+
+def test_cached_getter(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    point = make_class(propcache_module, calls)()
+    getter = propcache_module.cached_getter("x", "y", "z", "norm")
+    assert getter.names == ("x", "y", "z", "norm")
+    assert getter(point) == (1, 2, 3, 6)
+    assert getter(point) == (1, 2, 3, 6)
+    assert calls == ["y", "z"]
+    assert point.__dict__["y"] == 2
+    assert point._cache == {"z": 3}
+
+
+def test_cached_getter_single_name(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    point = make_class(propcache_module, calls)()
+    assert propcache_module.cached_getter("z")(point) == 3
+    assert propcache_module.cached_getter("y")(point) == 2
+
+
+def test_cached_getter_types(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Point = make_class(propcache_module, calls)
+
+    class Sub(Point):  # type: ignore[valid-type, misc]
+        y = None
+
+    getter = propcache_module.cached_getter("y", "z")
+    assert getter(Point()) == (2, 3)
+    assert getter(Sub()) == (None, 3)
+    assert getter(Point()) == (2, 3)
+
+    Point.z = 4
+    assert getter(Point()) == (2, 4)
+    assert getter(Sub()) == (None, 4)
+
+
+def test_cached_getter_options(propcache_module: APIProtocol) -> None:
+    calls = []
+
+    class Lookup:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.cached_property(cache_if=propcache_module.is_not_none)
+        def missing(self) -> None:
+            calls.append("missing")
+
+        @propcache_module.under_cached_property(cache_exceptions=KeyError)
+        def failing(self) -> int:
+            calls.append("failing")
+            raise KeyError("failing")
+
+    lookup = Lookup()
+    assert propcache_module.cached_getter("missing")(lookup) is None
+    assert propcache_module.cached_getter("missing")(lookup) is None
+    getter = propcache_module.cached_getter("missing", "failing")
+    for _ in range(2):
+        with pytest.raises(KeyError, match="failing"):
+            getter(lookup)
+    assert calls == ["missing", "missing", "missing", "failing", "missing"]
+
+
+def test_cached_getter_getattr(propcache_module: APIProtocol) -> None:
+    class Dynamic:
+        @propcache_module.cached_property
+        def value(self) -> int:
+            return 1
+
+        def __getattr__(self, name: str) -> str:
+            return name
+
+    getter = propcache_module.cached_getter("value", "other")
+    assert getter(Dynamic()) == (1, "other")
+
+
+def test_cached_getter_dotted_names(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Point = make_class(propcache_module, calls)
+
+    class Segment:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.under_cached_property
+        def end(self) -> object:
+            calls.append("end")
+            return Point()
+
+    segment = Segment()
+    getter = propcache_module.cached_getter("end.y", "end", "end.z.real")
+    assert getter(segment) == (2, segment.end, 3)
+    assert getter(segment) == (2, segment.end, 3)
+    assert calls == ["end", "y", "z"]
+    assert propcache_module.cached_getter("end.x")(segment) == 1
+    with pytest.raises(AttributeError):
+        propcache_module.cached_getter("end.missing")(segment)
+
+
+def test_cached_getter_errors(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    point = make_class(propcache_module, calls)()
+    with pytest.raises(AttributeError):
+        propcache_module.cached_getter("y", "missing")(point)
+    with pytest.raises(TypeError):
+        propcache_module.cached_getter("y", 1)
+    with pytest.raises(TypeError):
+        propcache_module.cached_getter()
+
+
+def test_cached_getter_repr_and_pickle(propcache_module: APIProtocol) -> None:
+    getter = propcache_module.cached_getter("x", "y")
+    assert repr(getter) == "cached_getter('x', 'y')"
+    copy = pickle.loads(pickle.dumps(getter))
+    assert type(copy) is type(getter)
+    assert copy.names == ("x", "y")
+
+
+def test_cached_getter_matches_attrgetter(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Point = make_class(propcache_module, calls)
+    names = ("norm", "z", "x", "y")
+    getter = propcache_module.cached_getter(*names)
+    assert getter(Point()) == operator.attrgetter(*names)(Point())
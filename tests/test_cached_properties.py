@@ -0,0 +1,139 @@
+import gc
+import weakref
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from propcache.api import cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> cached_property[_T_co]: ...
+
+    def under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> under_cached_property[_T_co]: ...
+
+    def cached_properties(self, cls: type) -> dict[str, Any]: ...
+
+
+def make_base(propcache_module: APIProtocol) -> type[Any]:
+    class Base:
+        @propcache_module.cached_property
+        def first(self) -> int:
+            return 1
+
+        def method(self) -> int:
+            return 0
+
+        @propcache_module.under_cached_property
+        def second(self) -> int:
+            return 2
+
+        @propcache_module.cached_property
+        def third(self) -> int:
+            return 3
+
+    return Base
+
+
+def test_cached_properties(propcache_module: APIProtocol) -> None:
+    Base = make_base(propcache_module)
+    props = propcache_module.cached_properties(Base)
+    assert list(props) == ["first", "second", "third"]
+    assert props["first"] is vars(Base)["first"]
+    assert props["second"] is vars(Base)["second"]
+    assert propcache_module.cached_properties(object) == {}
+
+
+def test_cached_properties_inherited(propcache_module: APIProtocol) -> None:
+    Base = make_base(propcache_module)
+
+    class Child(Base):  # type: ignore[valid-type, misc]
+        @propcache_module.under_cached_property
+        def first(self) -> int:
+            return 10
+
+        third = 30
+
+        @propcache_module.cached_property
+        def fourth(self) -> int:
+            return 4
+
+    class GrandChild(Child):
+        pass
+
+    props = propcache_module.cached_properties(GrandChild)
+    assert list(props) == ["first", "fourth", "second"]
+    assert props["first"] is vars(Child)["first"]
+    assert props["second"] is vars(Base)["second"]
+    assert list(propcache_module.cached_properties(Base)) == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_cached_properties_multiple_inheritance(
+    propcache_module: APIProtocol,
+) -> None:
+    class Left:
+        @propcache_module.cached_property
+        def value(self) -> str:
+            return "left"
+
+    class Right:
+        @propcache_module.cached_property
+        def value(self) -> str:
+            return "right"
+
+        @propcache_module.cached_property
+        def right(self) -> str:
+            return "right"
+
+    class Both(Left, Right):
+        pass
+
+    props = propcache_module.cached_properties(Both)
+    assert props == {"value": vars(Left)["value"], "right": vars(Right)["right"]}
+
+
+def test_cached_properties_class_changed(propcache_module: APIProtocol) -> None:
+    Base = make_base(propcache_module)
+    del Base.first
+    Base.second = None
+    Base.fourth = propcache_module.under_cached_property(lambda self: 4)
+    assert list(propcache_module.cached_properties(Base)) == ["third"]
+
+
+def test_cached_properties_used_by_warm(propcache_module: Any) -> None:
+    Base = make_base(propcache_module)
+    inst = Base()
+    inst._cache = {}
+    propcache_module.warm(inst)
+    assert inst.__dict__ == {"_cache": {"second": 2}, "first": 1, "third": 3}
+
+
+def test_cached_properties_class_collected(propcache_module: APIProtocol) -> None:
+    class Base:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            return 1
+
+    class A(Base):
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            return super().prop + 1
+
+        @propcache_module.under_cached_property
+        def other(self) -> int:
+            return 2
+
+    assert list(propcache_module.cached_properties(A)) == ["prop", "other"]
+    class_ref = weakref.ref(A)
+    del A
+    gc.collect()
+    assert class_ref() is None
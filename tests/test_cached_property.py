@@ -221,3 +221,26 @@ def test_cached_property_no_refcount_leak(propcache_module: APIProtocol) -> None
     # - original in `result`
     # - new one in `result4`
     assert count_sentinels() == initial_sentinel_count + 2
+
+
+def test_cached_property_stored_in_instance_dict(
+    propcache_module: APIProtocol,
+) -> None:
+    """Test that the value is stored in ``__dict__`` and recomputed once deleted."""
+    calls = 0
+
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+    a = A()
+    assert a.prop == 1
+    assert a.prop == 1
+    assert a.__dict__["prop"] == 1
+
+    del a.prop
+    assert a.prop == 2
+    assert calls == 2
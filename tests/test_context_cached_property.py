@@ -0,0 +1,252 @@
+import asyncio
+import contextvars
+import gc
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import context_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+locale: contextvars.ContextVar[str] = contextvars.ContextVar("locale")
+
+
+class APIProtocol(Protocol):
+    def context_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> context_cached_property[_T_co]: ...
+
+    def new_context_cache(self) -> None: ...
+
+
+def make_class(propcache_module: APIProtocol, calls: list[str]) -> type[Any]:
+    class Greeting:
+        @propcache_module.context_cached_property
+        def text(self) -> str:
+            """Return the greeting in the current locale."""
+            calls.append(locale.get())
+            return {"en": "hello", "fr": "bonjour"}[locale.get()]
+
+    return Greeting
+
+
+def run_in(
+    propcache_module: APIProtocol, locale_name: str, func: Callable[[], Any]
+) -> Any:
+    """Call ``func`` in a new context with ``locale_name`` and a cache set."""
+
+    def run() -> Any:
+        propcache_module.new_context_cache()
+        locale.set(locale_name)
+        return func()
+
+    return contextvars.Context().run(run)
+
+
+def test_context_cached_property(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Greeting = make_class(propcache_module, calls)
+    if TYPE_CHECKING:
+        assert isinstance(Greeting.text, context_cached_property)
+    else:
+        assert isinstance(Greeting.text, propcache_module.context_cached_property)
+    assert Greeting.text.__doc__ == "Return the greeting in the current locale."
+
+    greeting = Greeting()
+    assert run_in(propcache_module, "en", lambda: (greeting.text, greeting.text)) == (
+        "hello",
+        "hello",
+    )
+    assert run_in(propcache_module, "fr", lambda: (greeting.text, greeting.text)) == (
+        "bonjour",
+        "bonjour",
+    )
+    assert calls == ["en", "fr"]
+    assert greeting.__dict__ == {}
+
+
+def test_context_cached_property_tasks(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    greeting = make_class(propcache_module, calls)()
+
+    async def handle(locale_name: str) -> tuple[str, str]:
+        propcache_module.new_context_cache()
+        locale.set(locale_name)
+        first = greeting.text
+        await asyncio.sleep(0)
+        # Tasks started by the request share its values.
+        second = await asyncio.create_task(asyncio.sleep(0, greeting.text))
+        return first, second
+
+    async def serve() -> list[tuple[str, str]]:
+        greeting.text
+        return list(await asyncio.gather(handle("en"), handle("fr")))
+
+    results = run_in(propcache_module, "en", lambda: asyncio.run(serve()))
+    assert results == [("hello", "hello"), ("bonjour", "bonjour")]
+    assert calls == ["en", "en", "fr"]
+
+
+def test_context_cached_property_copied_context(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    greeting = make_class(propcache_module, calls)()
+
+    def copy_and_read() -> Any:
+        greeting.text
+        return contextvars.copy_context().run(lambda: greeting.text)
+
+    assert run_in(propcache_module, "en", copy_and_read) == "hello"
+    assert calls == ["en"]
+
+
+def test_context_cached_property_without_cache(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    greeting = make_class(propcache_module, calls)()
+
+    async def handle(locale_name: str) -> str:
+        locale.set(locale_name)
+        return greeting.text  # type: ignore[no-any-return]
+
+    async def serve() -> list[str]:
+        greeting.text
+        return list(await asyncio.gather(handle("en"), handle("fr"), handle("fr")))
+
+    def run() -> list[str]:
+        locale.set("en")
+        return asyncio.run(serve())
+
+    # Without a cache started, the tasks do not share the outer value.
+    assert contextvars.Context().run(run) == ["hello", "bonjour", "bonjour"]
+    assert calls == ["en", "en", "fr", "fr"]
+
+
+def test_context_cached_property_released(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Greeting = make_class(propcache_module, calls)
+    greeting = Greeting()
+    ref = weakref.ref(greeting)
+    run_in(propcache_module, "en", lambda: greeting.text)
+    del greeting
+    gc.collect()
+    assert ref() is None
+
+
+def test_context_cached_property_delete(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    greeting = make_class(propcache_module, calls)()
+
+    def read_delete_read() -> str:
+        greeting.text
+        del greeting.text
+        del greeting.text
+        return greeting.text  # type: ignore[no-any-return]
+
+    assert run_in(propcache_module, "en", read_delete_read) == "hello"
+    assert calls == ["en", "en"]
+    # Without a cache started in the current context.
+    del greeting.text
+
+
+def test_context_cached_property_read_only(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    greeting = make_class(propcache_module, calls)()
+    with pytest.raises(AttributeError, match="read-only"):
+        greeting.text = "hi"
+
+
+def test_context_cached_property_equal_instances(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+
+    class Name:
+        def __init__(self, value: str) -> None:
+            self.value = value
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Name) and other.value == self.value
+
+        def __hash__(self) -> int:
+            return hash(self.value)
+
+        @propcache_module.context_cached_property
+        def upper(self) -> list[str]:
+            calls.append(self.value)
+            return [self.value.upper()]
+
+    first, second = Name("a"), Name("a")
+
+    def read() -> tuple[list[str], list[str]]:
+        return first.upper, second.upper
+
+    first_upper, second_upper = run_in(propcache_module, "en", read)
+    assert first_upper == second_upper
+    assert first_upper is not second_upper
+    assert calls == ["a", "a"]
+
+
+def test_context_cached_property_unhashable(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+
+    class Greeting:
+        __hash__ = None  # type: ignore[assignment]
+
+        @propcache_module.context_cached_property
+        def text(self) -> str:
+            calls.append(locale.get())
+            return "hello"
+
+    greeting = Greeting()
+    assert run_in(propcache_module, "en", lambda: (greeting.text, greeting.text)) == (
+        "hello",
+        "hello",
+    )
+    assert calls == ["en"]
+
+
+def test_context_cached_property_released_with_instance(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    Greeting = make_class(propcache_module, calls)
+
+    def read_twice() -> None:
+        greeting = Greeting()
+        ref = weakref.ref(greeting)
+        greeting.text
+        del greeting
+        assert ref() is None
+        # A new instance, which may reuse the id, computes its own value.
+        Greeting().text
+
+    run_in(propcache_module, "en", read_twice)
+    assert calls == ["en", "en"]
+
+
+def test_context_cached_property_without_weakref(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+
+    class Point:
+        __slots__ = ()
+
+        @propcache_module.context_cached_property
+        def norm(self) -> int:
+            calls.append("norm")
+            return 1
+
+    def read() -> tuple[int, int]:
+        point = Point()
+        return point.norm, point.norm
+
+    assert run_in(propcache_module, "en", read) == (1, 1)
+    # The store would keep them alive, so their values are not cached.
+    assert calls == ["norm", "norm"]
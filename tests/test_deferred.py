@@ -0,0 +1,205 @@
+import gc
+import multiprocessing
+import os
+import pickle
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any
+
+import pytest
+
+from propcache import _deferred
+from propcache.api import (
+    cached_property,
+    deferred_cached_property,
+    deferred_under_cached_property,
+    start_deferred,
+    under_cached_property,
+)
+
+
+class ForwardingExecutor(Executor):
+    """An executor submitting to the one the tests set up."""
+
+    def __init__(self) -> None:
+        self.executor: Executor | None = None
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        assert self.executor is not None
+        return self.executor.submit(fn, *args, **kwargs)
+
+
+process_executor = ForwardingExecutor()
+
+
+class Report:
+    def __init__(self) -> None:
+        self._cache: dict[str, Any] = {}
+        start_deferred(self)
+
+    @deferred_cached_property(process_executor)
+    def pid(self) -> int:
+        return os.getpid()
+
+    @deferred_under_cached_property(process_executor)
+    def under_pid(self) -> int:
+        return os.getpid()
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+def make_class(
+    executor: Executor,
+    calls: list[str],
+    started: threading.Event,
+    start: bool = True,
+) -> Any:
+    class Config:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+            if start:
+                start_deferred(self)
+
+        @deferred_cached_property(executor)
+        def schema(self) -> str:
+            """Return the schema."""
+            started.wait()
+            calls.append("schema")
+            return "schema"
+
+        @deferred_under_cached_property(executor)
+        def defaults(self) -> str:
+            """Return the defaults."""
+            started.wait()
+            calls.append("defaults")
+            return "defaults"
+
+    return Config
+
+
+def test_deferred_properties(executor: ThreadPoolExecutor) -> None:
+    calls: list[str] = []
+    started = threading.Event()
+    Config = make_class(executor, calls, started)
+    assert isinstance(Config.schema, cached_property)
+    assert isinstance(Config.defaults, under_cached_property)
+    assert Config.schema.__doc__ == "Return the schema."
+    assert Config.defaults.__doc__ == "Return the defaults."
+
+    config = Config()
+    assert "schema.future" in config.__dict__
+    assert "defaults.future" in config._cache
+    started.set()
+    assert config.schema == "schema"
+    assert config.defaults == "defaults"
+    assert config.schema == "schema"
+    assert config.defaults == "defaults"
+    assert sorted(calls) == ["defaults", "schema"]
+    assert "schema.future" not in config.__dict__
+    assert config.__dict__["schema"] == "schema"
+    assert config._cache == {"defaults": "defaults"}
+
+
+def test_deferred_properties_not_started(executor: ThreadPoolExecutor) -> None:
+    calls: list[str] = []
+    started = threading.Event()
+    started.set()
+
+    config = make_class(executor, calls, started, start=False)()
+    assert config.__dict__ == {"_cache": {}}
+    assert config.schema == "schema"
+    assert config.defaults == "defaults"
+    assert calls == ["schema", "defaults"]
+
+
+def test_start_deferred_twice(executor: ThreadPoolExecutor) -> None:
+    calls: list[str] = []
+    started = threading.Event()
+    config = make_class(executor, calls, started)()
+    start_deferred(config)
+    started.set()
+    assert config.schema == "schema"
+    assert config.defaults == "defaults"
+    start_deferred(config)
+    executor.shutdown()
+    assert sorted(calls) == ["defaults", "schema"]
+
+
+def test_deferred_property_error(executor: ThreadPoolExecutor) -> None:
+    calls = []
+
+    class Config:
+        def __init__(self) -> None:
+            start_deferred(self)
+
+        @deferred_cached_property(executor)
+        def schema(self) -> str:
+            calls.append("schema")
+            raise ValueError("invalid")
+
+    config = Config()
+    with pytest.raises(ValueError, match="invalid"):
+        config.schema
+    assert config.__dict__ == {}
+    with pytest.raises(ValueError, match="invalid"):
+        config.schema
+    assert calls == ["schema", "schema"]
+
+
+def test_deferred_properties_pickled_pending() -> None:
+    future: Future[int] = Future()
+    report = Report.__new__(Report)
+    report.__dict__["pid.future"] = _deferred._Pending(future)
+    report._cache = {"under_pid.future": _deferred._Pending(future)}
+
+    copy = pickle.loads(pickle.dumps(report))
+    assert copy.pid == os.getpid()
+    assert copy.under_pid == os.getpid()
+    assert copy.__dict__ == {"_cache": {"under_pid": os.getpid()}, "pid": os.getpid()}
+    assert not future.done()
+
+
+def test_deferred_properties_in_process_pool() -> None:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        process_executor.executor = pool
+        try:
+            report = Report()
+        finally:
+            process_executor.executor = None
+        assert report.pid != os.getpid()
+        assert report.under_pid == report.pid
+
+
+def test_deferred_class_collected(executor: ThreadPoolExecutor) -> None:
+    class Base:
+        @property
+        def prop(self) -> int:
+            return 1
+
+    class A(Base):
+        def __init__(self) -> None:
+            start_deferred(self)
+
+        @deferred_cached_property(executor)
+        def prop(self) -> int:
+            return super().prop + 1
+
+    assert A().prop == 2
+    class_ref = weakref.ref(A)
+    del A
+    gc.collect()
+    assert class_ref() is None
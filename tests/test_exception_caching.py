@@ -0,0 +1,245 @@
+import gc
+import traceback
+import weakref
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar, overload
+
+import pytest
+
+from propcache.api import cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+_ExceptionTypes = bool | type[BaseException] | tuple[type[BaseException], ...]
+
+
+class APIProtocol(Protocol):
+    @overload
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> "cached_property[_T_co]": ...
+
+    @overload
+    def cached_property(
+        self,
+        *,
+        cache_exceptions: _ExceptionTypes,
+        exception_ttl: float | None = None,
+    ) -> "cached_property[Any]": ...
+
+    @overload
+    def under_cached_property(
+        self, wrapped: Callable[[Any], _T_co]
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self,
+        *,
+        cache_exceptions: _ExceptionTypes,
+        exception_ttl: float | None = None,
+    ) -> "under_cached_property[Any]": ...
+
+
+def test_under_cached_property_exceptions_not_cached_by_default(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise ValueError
+
+    a = A()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            a.prop
+    assert calls == 2
+
+
+def test_under_cached_property_cache_exceptions(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(cache_exceptions=True)
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise ValueError(calls)
+
+    a = A()
+    tracebacks = []
+    for _ in range(3):
+        with pytest.raises(ValueError, match="1") as excinfo:
+            a.prop
+        tracebacks.append(traceback.extract_tb(excinfo.value.__traceback__))
+    assert calls == 1
+    assert len(tracebacks[1]) == len(tracebacks[2])
+
+
+def test_under_cached_property_cache_exceptions_types(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self, exc: type[Exception]) -> None:
+            self._cache: dict[str, int] = {}
+            self.exc = exc
+
+        @propcache_module.under_cached_property(cache_exceptions=KeyError)
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise self.exc
+
+    cached = A(KeyError)
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            cached.prop
+    assert calls == 1
+
+    uncached = A(ValueError)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            uncached.prop
+    assert calls == 3
+
+
+def test_under_cached_property_exception_ttl(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(
+            cache_exceptions=ValueError, exception_ttl=0
+        )
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError
+            return calls
+
+    a = A()
+    with pytest.raises(ValueError):
+        a.prop
+    assert a.prop == 2
+    assert a.prop == 2
+    assert a._cache == {"prop": 2}
+
+
+def test_cached_property_cache_exceptions(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        @propcache_module.cached_property(cache_exceptions=(KeyError, ValueError))
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise ValueError(calls)
+
+    a = A()
+    for _ in range(2):
+        with pytest.raises(ValueError, match="1"):
+            a.prop
+    assert calls == 1
+    assert "prop" not in a.__dict__
+
+    b = A()
+    with pytest.raises(ValueError, match="2"):
+        b.prop
+
+
+def test_cached_property_exception_ttl(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        @propcache_module.cached_property(cache_exceptions=True, exception_ttl=0)
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError
+            return calls
+
+    a = A()
+    with pytest.raises(ValueError):
+        a.prop
+    assert a.prop == 2
+    assert a.prop == 2
+
+
+def test_cached_property_cache_exceptions_in_instance_dict(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        __slots__ = ("__dict__",)
+
+        @propcache_module.cached_property(cache_exceptions=True)
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise ValueError
+
+    a = A()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            a.prop
+    assert calls == 1
+    assert list(a.__dict__) == ["prop.exception"]
+
+
+def test_cache_exceptions_released_with_instance(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.cached_property(cache_exceptions=True)
+        def prop(self) -> int:
+            raise ValueError
+
+        @propcache_module.under_cached_property(cache_exceptions=True)
+        def under_prop(self) -> int:
+            raise ValueError
+
+    a = A()
+    with pytest.raises(ValueError):
+        a.prop
+    with pytest.raises(ValueError):
+        a.under_prop
+    inst_ref = weakref.ref(a)
+
+    del a
+    gc.collect()
+    assert inst_ref() is None
+
+
+def test_cache_exceptions_factory_docstring(propcache_module: APIProtocol) -> None:
+    class A:
+        @propcache_module.cached_property(cache_exceptions=True)
+        def prop(self) -> None:
+            """Docstring."""
+
+        @propcache_module.under_cached_property(cache_exceptions=True)
+        def under_prop(self) -> None:
+            """Under docstring."""
+
+    assert A.prop.__doc__ == "Docstring."
+    assert A.under_prop.__doc__ == "Under docstring."
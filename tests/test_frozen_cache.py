@@ -0,0 +1,222 @@
+import pickle
+import threading
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar, overload
+
+import pytest
+
+from propcache.api import (
+    BoundedCache,
+    CacheFreePickleMixin,
+    FrozenCache,
+    cached_property,
+    freeze,
+    mirrored_under_cached_property,
+    under_cached_property,
+    weak_under_cached_property,
+)
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> cached_property[_T_co]: ...
+
+    @overload
+    def under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> under_cached_property[_T_co]: ...
+
+    @overload
+    def under_cached_property(
+        self, *, cache_exceptions: bool = ..., writable: bool = ...
+    ) -> "under_cached_property[Any]": ...
+
+    def mirrored_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> mirrored_under_cached_property[_T_co]: ...
+
+    def weak_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> weak_under_cached_property[_T_co]: ...
+
+    def warm(self, inst: object) -> None: ...
+
+
+def make_class(propcache_module: APIProtocol, calls: list[str]) -> type[Any]:
+    class Config:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.under_cached_property
+        def schema(self) -> str:
+            calls.append("schema")
+            return "schema"
+
+        @propcache_module.under_cached_property
+        def defaults(self) -> str:
+            calls.append("defaults")
+            return "defaults"
+
+        @propcache_module.cached_property
+        def name(self) -> str:
+            calls.append("name")
+            return "name"
+
+    return Config
+
+
+def test_freeze(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    config = make_class(propcache_module, calls)()
+    assert config.schema == "schema"
+    freeze(config)
+    assert type(config._cache) is FrozenCache
+    assert config._cache == {"schema": "schema"}
+    assert config.schema == "schema"
+    assert calls == ["schema"]
+
+    assert config.defaults == "defaults"
+    assert config.defaults == "defaults"
+    assert config._cache == {"schema": "schema"}
+    assert config.name == "name"
+    assert config.name == "name"
+    assert calls == ["schema", "defaults", "defaults", "name"]
+
+
+def test_freeze_strict(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    config = make_class(propcache_module, calls)()
+    config.schema
+    freeze(config, strict=True)
+    assert config.schema == "schema"
+    with pytest.raises(RuntimeError, match="'defaults' is not cached"):
+        config.defaults
+    assert calls == ["schema"]
+
+
+def test_freeze_warmed_shared_between_threads(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    config = make_class(propcache_module, calls)()
+    propcache_module.warm(config)
+    freeze(config, strict=True)
+    results = []
+
+    def read() -> None:
+        for _ in range(1000):
+            results.append((config.schema, config.defaults, config.name))
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert set(results) == {("schema", "defaults", "name")}
+    assert sorted(calls) == ["defaults", "name", "schema"]
+
+
+def test_frozen_cache_is_immutable() -> None:
+    cache = FrozenCache({"a": 1})
+    modifications: tuple[Callable[[], object], ...] = (
+        lambda: cache.__setitem__("b", 2),
+        lambda: cache.__delitem__("a"),
+        lambda: cache.pop("a"),
+        lambda: cache.popitem(),
+        lambda: cache.setdefault("b", 2),
+        lambda: cache.update(b=2),
+        lambda: cache.clear(),
+        lambda: cache.__ior__({"b": 2}),
+    )
+    for modify in modifications:
+        with pytest.raises(TypeError, match="FrozenCache is immutable"):
+            modify()
+    assert cache == {"a": 1}
+    assert type(cache.copy()) is dict
+
+
+def test_frozen_cache_explicit_write(propcache_module: APIProtocol) -> None:
+    class Config:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.under_cached_property(writable=True)
+        def schema(self) -> str:
+            return "schema"
+
+    config = Config()
+    freeze(config)
+    with pytest.raises(TypeError, match="FrozenCache is immutable"):
+        config.schema = "other"
+    with pytest.raises(TypeError, match="FrozenCache is immutable"):
+        config._cache["schema"] = "other"
+    assert config.schema == "schema"
+    assert config._cache == {}
+
+
+def test_frozen_cache_descriptor_fills(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+
+    class Config:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def mirrored(self) -> str:
+            calls.append("mirrored")
+            return "mirrored"
+
+        @propcache_module.weak_under_cached_property
+        def weak(self) -> set[str]:
+            calls.append("weak")
+            return {"weak"}
+
+        @propcache_module.under_cached_property(cache_exceptions=True)
+        def failing(self) -> str:
+            calls.append("failing")
+            raise ValueError
+
+    config = Config()
+    freeze(config)
+    for _ in range(2):
+        assert config.mirrored == "mirrored"
+        assert config.weak == {"weak"}
+        with pytest.raises(ValueError):
+            config.failing
+    assert "mirrored" not in config.__dict__
+    assert config._cache == {}
+    assert calls == ["mirrored", "weak", "failing"] * 2
+
+
+def test_frozen_cache_from_bounded_cache() -> None:
+    bounded = BoundedCache(maxsize=2)
+    bounded["a"] = 1
+    bounded["b"] = 2
+    assert FrozenCache(bounded) == {"a": 1, "b": 2}
+
+
+def test_frozen_cache_pickle() -> None:
+    cache = FrozenCache({"a": 1}, strict=True)
+    copy = pickle.loads(pickle.dumps(cache))
+    assert type(copy) is FrozenCache
+    assert copy == {"a": 1}
+    assert copy.strict
+
+
+class Settings(CacheFreePickleMixin):
+    def __init__(self) -> None:
+        self._cache: dict[str, Any] = {"other": 1}
+
+    @under_cached_property
+    def value(self) -> int:
+        return 2
+
+
+def test_frozen_cache_free_pickle() -> None:
+    settings = Settings()
+    settings.value
+    freeze(settings)
+    copy = pickle.loads(pickle.dumps(settings))
+    assert type(copy._cache) is FrozenCache
+    assert copy._cache == {"other": 1}
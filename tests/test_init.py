@@ -3,7 +3,7 @@
 import pytest
 
 import propcache
-from propcache import _helpers
+from propcache import _helpers, api
 
 
 def test_api_at_top_level() -> None:
@@ -11,12 +11,68 @@ def test_api_at_top_level() -> None:
     assert propcache.cached_property is not None
     assert propcache.under_cached_property is not None
     assert propcache.cached_property is _helpers.cached_property
+    assert propcache.BoundedCache is api.BoundedCache
+    assert propcache.CacheFreePickleMixin is api.CacheFreePickleMixin
+    assert propcache.CacheSnapshot is api.CacheSnapshot
+    assert propcache.FrozenCache is api.FrozenCache
+    assert propcache.freeze is api.freeze
+    assert propcache.cache_free_state is api.cache_free_state
     assert propcache.under_cached_property is _helpers.under_cached_property
+    assert (
+        propcache.mirrored_under_cached_property
+        is _helpers.mirrored_under_cached_property
+    )
+    assert propcache.inline_cached_properties is _helpers.inline_cached_properties
+    assert propcache.is_not_none is _helpers.is_not_none
+    assert propcache.cached_properties is _helpers.cached_properties
+    assert propcache.cached_getter is _helpers.cached_getter
+    assert propcache.context_cached_property is _helpers.context_cached_property
+    assert propcache.new_context_cache is _helpers.new_context_cache
+    assert propcache.propagate_cache is _helpers.propagate_cache
+    assert propcache.warm is _helpers.warm
+    assert propcache.deferred_cached_property is api.deferred_cached_property
+    assert (
+        propcache.deferred_under_cached_property is api.deferred_under_cached_property
+    )
+    assert propcache.persistent_cached_property is api.persistent_cached_property
+    assert propcache.prefork_warm is api.prefork_warm
+    assert propcache.start_deferred is api.start_deferred
+    assert propcache.side_cached_property is _helpers.side_cached_property
+    assert propcache.thread_cached_property is _helpers.thread_cached_property
+    assert propcache.weak_cached_property is _helpers.weak_cached_property
+    assert propcache.weak_under_cached_property is _helpers.weak_under_cached_property
 
 
 @pytest.mark.parametrize(
     "prop_name",
-    ("cached_property", "under_cached_property"),
+    (
+        "BoundedCache",
+        "CacheFreePickleMixin",
+        "CacheSnapshot",
+        "FrozenCache",
+        "cache_free_state",
+        "cached_getter",
+        "cached_properties",
+        "cached_property",
+        "context_cached_property",
+        "deferred_cached_property",
+        "deferred_under_cached_property",
+        "freeze",
+        "inline_cached_properties",
+        "is_not_none",
+        "mirrored_under_cached_property",
+        "new_context_cache",
+        "persistent_cached_property",
+        "prefork_warm",
+        "propagate_cache",
+        "side_cached_property",
+        "start_deferred",
+        "thread_cached_property",
+        "under_cached_property",
+        "warm",
+        "weak_cached_property",
+        "weak_under_cached_property",
+    ),
 )
 def test_public_api_is_discoverable_in_dir(prop_name: str) -> None:
     """Verify the public API is discoverable programmatically."""
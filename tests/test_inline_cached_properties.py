@@ -0,0 +1,192 @@
+import dis
+import sys
+import sysconfig
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import cached_property
+
+if sys.version_info >= (3, 11):
+    from typing import assert_type
+
+_T_co = TypeVar("_T_co", covariant=True)
+_Cls = TypeVar("_Cls")
+
+
+class APIProtocol(Protocol):
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> cached_property[_T_co]: ...
+
+    def inline_cached_properties(self, cls: type[_Cls]) -> type[_Cls]: ...
+
+    def cached_properties(self, cls: type) -> dict[str, Any]: ...
+
+
+def test_inline_cached_properties(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    @propcache_module.inline_cached_properties
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return 1
+
+    a = A()
+    if sys.version_info >= (3, 11):
+        assert_type(a.prop, int)
+    assert a.prop == 1
+    assert a.prop == 1
+    assert calls == 1
+    assert a.__dict__ == {"prop": 1}
+    assert "prop" not in vars(A)
+
+
+def test_inline_cached_properties_descriptors_kept(
+    propcache_module: APIProtocol,
+) -> None:
+    @propcache_module.inline_cached_properties
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            """Mock property."""
+            return 1
+
+    @propcache_module.inline_cached_properties
+    class B(A):
+        @propcache_module.cached_property
+        def other(self) -> int:
+            return 2
+
+    prop = A.__inline_cached_properties__["prop"]  # type: ignore[attr-defined]
+    if TYPE_CHECKING:
+        assert isinstance(prop, cached_property)
+    else:
+        assert isinstance(prop, propcache_module.cached_property)
+    assert prop.__doc__ == "Mock property."
+    assert propcache_module.cached_properties(A) == {"prop": prop}
+    other = B.__inline_cached_properties__["other"]  # type: ignore[attr-defined]
+    assert propcache_module.cached_properties(B) == {"other": other, "prop": prop}
+    assert B().prop == 1
+
+
+def test_inline_cached_properties_inherited(propcache_module: APIProtocol) -> None:
+    class Base:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            return 1
+
+    with pytest.raises(TypeError, match="'prop' of '.*A', as '.*Base' defines"):
+
+        @propcache_module.inline_cached_properties
+        class A(Base):
+            pass
+
+    # Once removed, the property would be shadowed by the one of the base.
+    with pytest.raises(TypeError, match="'prop' of '.*B', as '.*Base' defines"):
+
+        @propcache_module.inline_cached_properties
+        class B(Base):
+            @propcache_module.cached_property
+            def prop(self) -> int:
+                return 2
+
+    assert Base().prop == 1
+
+
+def test_inline_cached_properties_recompute_after_delete(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    @propcache_module.inline_cached_properties
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+    a = A()
+    assert a.prop == 1
+    del a.prop
+    assert a.prop == 2
+
+
+def test_inline_cached_properties_missing_attribute(
+    propcache_module: APIProtocol,
+) -> None:
+    @propcache_module.inline_cached_properties
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            """Mock property."""
+            raise NotImplementedError
+
+    a = A()
+    with pytest.raises(AttributeError, match="'A' object has no attribute 'missing'"):
+        a.missing  # type: ignore[attr-defined]
+    assert not hasattr(a, "missing")
+
+
+def test_inline_cached_properties_keeps_getattr(
+    propcache_module: APIProtocol,
+) -> None:
+    class Base:
+        def __getattr__(self, name: str) -> str:
+            return f"fallback {name}"
+
+    @propcache_module.inline_cached_properties
+    class A(Base):
+        @propcache_module.cached_property
+        def prop(self) -> str:
+            return "cached"
+
+    @propcache_module.inline_cached_properties
+    class B(A):
+        @propcache_module.cached_property
+        def other(self) -> str:
+            return "other"
+
+    b = B()
+    assert b.prop == "cached"
+    assert b.other == "other"
+    assert b.missing == "fallback missing"
+    assert b.__dict__ == {"prop": "cached", "other": "other"}
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason="Instance attributes of classes with __getattr__ "
+    "are specialized since Python 3.12",
+)
+@pytest.mark.skipif(
+    bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+    reason="Free-threaded builds specialize fewer instructions",
+)
+def test_inline_cached_properties_specialized(
+    propcache_module: APIProtocol,
+) -> None:
+    @propcache_module.inline_cached_properties
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            return 1
+
+    def read(a: A) -> int:
+        return a.prop
+
+    a = A()
+    for _ in range(100):
+        read(a)
+
+    load_attrs = [
+        instr.opname
+        for instr in dis.get_instructions(read, adaptive=True)  # type: ignore[call-arg, unused-ignore]
+        if instr.opname.startswith("LOAD_ATTR")
+    ]
+    assert load_attrs == ["LOAD_ATTR_INSTANCE_VALUE"]
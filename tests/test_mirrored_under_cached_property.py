@@ -0,0 +1,266 @@
+import copy
+import gc
+import pickle
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import (
+    BoundedCache,
+    FrozenCache,
+    freeze,
+    mirrored_under_cached_property,
+)
+
+if sys.version_info >= (3, 11):
+    from typing import assert_type
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def mirrored_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> mirrored_under_cached_property[_T_co]: ...
+
+
+def test_mirrored_under_cached_property(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return 1
+
+    a = A()
+    if sys.version_info >= (3, 11):
+        assert_type(a.prop, int)
+    assert a.prop == 1
+    assert a.prop == 1
+    assert calls == 1
+    assert a._cache == {"prop": 1}
+    assert a.__dict__["prop"] == 1
+
+
+def test_mirrored_under_cached_property_cache_is_authoritative(
+    propcache_module: APIProtocol,
+) -> None:
+    """Test the mirror follows the value in ``_cache``.
+
+    A dropped mirror is restored from ``_cache`` without recomputing, and
+    removing the value from ``_cache`` removes the mirror.
+    """
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+    a = A()
+    assert a.prop == 1
+
+    del a.__dict__["prop"]
+    assert a.prop == 1
+    assert calls == 1
+
+    a._cache.clear()
+    assert "prop" not in a.__dict__
+    assert a.prop == 2
+    assert a._cache == {"prop": 2}
+
+
+def test_mirrored_under_cached_property_check_without_cache(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> None:
+            """Mock property."""
+
+    a = A()
+    with pytest.raises(AttributeError):
+        _ = a.prop  # type: ignore[call-overload]
+
+
+def test_mirrored_under_cached_property_class_docstring(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> None:
+            """Docstring."""
+
+    if TYPE_CHECKING:
+        assert isinstance(A.prop, mirrored_under_cached_property)
+    else:
+        assert isinstance(A.prop, propcache_module.mirrored_under_cached_property)
+    assert "Docstring." == A.prop.__doc__
+    assert A.prop.wrapped(A()) is None
+
+
+def make_class(propcache_module: APIProtocol, calls: list[int]) -> type[Any]:
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> int:
+            calls.append(len(calls) + 1)
+            return len(calls)
+
+    return A
+
+
+def test_mirrored_under_cached_property_invalidated_through_cache(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[int] = []
+    a = make_class(propcache_module, calls)()
+    assert a.prop == 1
+
+    del a._cache["prop"]
+    assert "prop" not in a.__dict__
+    assert a.prop == 2
+
+    a._cache = {}
+    assert "prop" not in a.__dict__
+    assert a.prop == 3
+
+    # A mirror restored from ``_cache`` follows it too.
+    del a.__dict__["prop"]
+    assert a.prop == 3
+    a._cache.pop("prop")
+    assert a.prop == 4
+    assert a._cache == {"prop": 4}
+    assert a.__dict__["prop"] == 4
+
+
+def test_mirrored_under_cached_property_without_weakref(
+    propcache_module: APIProtocol,
+) -> None:
+    class A(int):
+        def __init__(self, value: int) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.mirrored_under_cached_property
+        def prop(self) -> int:
+            return int(self) + 1
+
+    a = A(1)
+    assert a.prop == 2
+    assert a.__dict__["prop"] == 2
+    a._cache.clear()
+    assert "prop" not in a.__dict__
+
+
+def test_mirrored_under_cached_property_frozen_cache(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[int] = []
+    a = make_class(propcache_module, calls)()
+    assert a.prop == 1
+    del a.__dict__["prop"]
+    freeze(a)
+    assert a.prop == 1
+    assert "prop" not in a.__dict__
+    a._cache = FrozenCache()
+    assert a.prop == 2
+    assert a.prop == 3
+    assert "prop" not in a.__dict__
+
+
+class Pickled:
+    def __init__(self) -> None:
+        self._cache: dict[str, int] = {}
+
+    @mirrored_under_cached_property
+    def prop(self) -> int:
+        return 1
+
+
+class PickledWithoutWeakref:
+    __slots__ = ("__dict__",)
+
+    def __init__(self) -> None:
+        self._cache: dict[str, int] = {}
+
+    @mirrored_under_cached_property
+    def prop(self) -> int:
+        return 1
+
+
+@pytest.mark.parametrize("cls", [Pickled, PickledWithoutWeakref])
+def test_mirrored_under_cached_property_pickle(cls: type[Pickled]) -> None:
+    a = cls()
+    assert a.prop == 1
+    a_copy = pickle.loads(pickle.dumps(a))
+    assert a_copy.__dict__["prop"] == 1
+    a_copy._cache.clear()
+    assert "prop" not in a_copy.__dict__
+    assert a.__dict__["prop"] == 1
+
+
+def test_mirrored_under_cached_property_deepcopy(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[int] = []
+    a = make_class(propcache_module, calls)()
+    assert a.prop == 1
+    a_copy = copy.deepcopy(a)
+    assert a_copy.prop == 1
+    a_copy._cache.pop("prop")
+    assert "prop" not in a_copy.__dict__
+    assert a_copy.prop == 2
+    assert a.prop == 1
+    del a._cache["prop"]
+    assert "prop" not in a.__dict__
+    assert a_copy.__dict__["prop"] == 2
+
+
+def test_mirrored_under_cached_property_pickle_key_without_instance(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[int] = []
+    a = make_class(propcache_module, calls)()
+    a.prop
+    [key] = a._cache
+    del a
+    gc.collect()
+    key_copy = pickle.loads(pickle.dumps(key))
+    assert key_copy == "prop"
+    assert type(key_copy) is str
+
+
+def test_mirrored_under_cached_property_bounded_cache(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache = BoundedCache(1)
+
+        @propcache_module.mirrored_under_cached_property
+        def first(self) -> int:
+            return 1
+
+        @propcache_module.mirrored_under_cached_property
+        def second(self) -> int:
+            return 2
+
+    a = A()
+    assert a.first == 1
+    assert a.second == 2
+    assert "first" not in a.__dict__
+    assert a.__dict__["second"] == 2
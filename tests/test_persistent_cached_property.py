@@ -0,0 +1,189 @@
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from propcache import _persistent
+from propcache.api import persistent_cached_property, under_cached_property
+
+
+def close_stores() -> None:
+    _persistent._close_stores()
+    _persistent._stores.clear()
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Iterator[Path]:
+    yield tmp_path / "cache.sqlite"
+    close_stores()
+
+
+def make_index_class(path: Path, calls: list[str], version: str = "") -> type[Any]:
+    class Index:
+        def __init__(self, source: str) -> None:
+            self._cache: dict[str, Any] = {}
+            self.source = source
+
+        @persistent_cached_property(path, key=lambda self: self.source, version=version)
+        def words(self) -> list[str]:
+            """Return the words of the source."""
+            calls.append(self.source)
+            return self.source.split()
+
+    return Index
+
+
+def test_persistent_cached_property(path: Path) -> None:
+    calls: list[str] = []
+    Index = make_index_class(path, calls)
+    assert isinstance(Index.words, under_cached_property)
+    assert Index.words.__doc__ == "Return the words of the source."
+
+    index = Index("a b")
+    assert index.words == ["a", "b"]
+    assert index.words is index.words
+    assert index._cache == {"words": ["a", "b"]}
+    assert Index("a b").words == ["a", "b"]
+    assert Index("c").words == ["c"]
+    assert calls == ["a b", "c"]
+
+
+def test_persistent_cached_property_restart(path: Path) -> None:
+    calls: list[str] = []
+    assert make_index_class(path, calls)("a b").words == ["a", "b"]
+
+    close_stores()
+    assert make_index_class(path, calls)("a b").words == ["a", "b"]
+    assert calls == ["a b"]
+    connection = sqlite3.connect(path)
+    try:
+        rows = connection.execute("SELECT key FROM propcache").fetchall()
+    finally:
+        connection.close()
+    assert rows == [("a b",)]
+
+
+def test_persistent_cached_property_version(path: Path) -> None:
+    calls: list[str] = []
+    assert make_index_class(path, calls)("a b").words == ["a", "b"]
+    assert make_index_class(path, calls, version="2")("a b").words == ["a", "b"]
+    assert make_index_class(path, calls, version="2")("a b").words == ["a", "b"]
+    assert calls == ["a b", "a b"]
+
+
+def test_fingerprint_follows_code() -> None:
+    def first(self: object) -> int:
+        return 1
+
+    def second(self: object) -> int:
+        return 2
+
+    def first_again(self: object) -> int:
+        return 1
+
+    assert _persistent._fingerprint(first, "") != _persistent._fingerprint(second, "")
+    assert _persistent._fingerprint(first, "") == _persistent._fingerprint(
+        first_again, ""
+    )
+    assert _persistent._fingerprint(first, "") != _persistent._fingerprint(first, "1")
+
+
+def test_persistent_cached_property_error(path: Path) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @persistent_cached_property(path, key=lambda self: "a")
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            raise ValueError
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            A().prop
+    assert calls == 2
+
+
+def test_persistent_cached_property_serializer(path: Path) -> None:
+    calls: list[str] = []
+
+    def make_class() -> type[Any]:
+        class Index:
+            def __init__(self, source: str) -> None:
+                self._cache: dict[str, Any] = {}
+                self.source = source
+
+            @persistent_cached_property(
+                path, key=lambda self: self.source, serializer=json
+            )
+            def words(self) -> list[str]:
+                calls.append(self.source)
+                return self.source.split()
+
+        return Index
+
+    assert make_class()("a b").words == ["a", "b"]
+    close_stores()
+    assert make_class()("a b").words == ["a", "b"]
+    assert calls == ["a b"]
+    connection = sqlite3.connect(path)
+    try:
+        rows = connection.execute("SELECT value FROM propcache").fetchall()
+    finally:
+        connection.close()
+    assert rows == [('["a", "b"]',)]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+def test_persistent_cached_property_fork(path: Path) -> None:
+    calls: list[str] = []
+    Index = make_index_class(path, calls)
+    assert Index("a b").words == ["a", "b"]
+    store = _persistent._store(path)
+    connection = store._connection
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        ok = (
+            Index("a b").words == ["a", "b"]
+            and Index("c").words == ["c"]
+            and store._connection is not connection
+        )
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert store._connection is connection
+    assert Index("c").words == ["c"]
+    assert calls == ["a b"]
+
+
+def test_persistent_cached_property_pid_changed(path: Path) -> None:
+    calls: list[str] = []
+    Index = make_index_class(path, calls)
+    Index("a b").words
+    store = _persistent._store(path)
+    connection = store._connection
+    store._pid = -1
+    assert Index("a b").words == ["a", "b"]
+    assert store._connection is not connection
+    assert store._pid == os.getpid()
+    assert calls == ["a b"]
+    assert connection is not None
+    connection.close()
+
+
+def test_persistent_cached_property_closed_at_exit(path: Path) -> None:
+    Index = make_index_class(path, [])
+    Index("a").words
+    connection = _persistent._store(path)._connection
+    assert connection is not None
+    _persistent._close_stores()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
@@ -0,0 +1,114 @@
+"""Tests for the profile-guided build of the C-extensions."""
+
+import os
+import platform
+import sysconfig
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+PACKAGING_DIR = Path(__file__).parents[1] / "packaging"
+EXT_SUFFIX = sysconfig.get_config_var("EXT_SUFFIX")
+INSTRUMENTATION_SYMBOLS = (b"__gcov_", b"__llvm_profile_")
+
+HOT_PYX = """
+def total(long n):
+    cdef long i, result = 0
+    for i in range(n):
+        result += i % 7
+    return result
+"""
+
+TRAINING_SCRIPT = """
+from pkg.hot import total
+
+for _ in range(100):
+    total(1000)
+"""
+
+
+@pytest.fixture
+def pgo(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ModuleType:
+    """Return the PGO build module, run from a project with one extension."""
+    monkeypatch.syspath_prepend(str(PACKAGING_DIR))
+    from pep517_backend import _pgo
+
+    package_dir = tmp_path / "src" / "pkg"
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "hot.pyx").write_text(HOT_PYX)
+    training_script_path = tmp_path / "train.py"
+    training_script_path.write_text(TRAINING_SCRIPT)
+    monkeypatch.setattr(_pgo, "TRAINING_SCRIPT_PATH", training_script_path)
+    monkeypatch.chdir(tmp_path)
+    return _pgo
+
+
+CYTHONIZE_ARGS = ["-i", "-3", "--", "src/pkg/*.pyx"]
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython" or os.name != "posix",
+    reason="PGO builds are only wired up for GCC and Clang under CPython",
+)
+def test_cythonize_with_pgo(pgo: ModuleType) -> None:
+    cythonize = pytest.importorskip("Cython.Build.Cythonize")
+    pgo.cythonize_with_pgo(cythonize.main, CYTHONIZE_ARGS)
+
+    extension_bytes = Path(f"src/pkg/hot{EXT_SUFFIX}").read_bytes()
+    assert not any(symbol in extension_bytes for symbol in INSTRUMENTATION_SYMBOLS)
+
+
+def fake_cythonize(
+    builds: list[bool], instrumented: bool
+) -> Callable[[list[str]], None]:
+    """Return a ``cythonize`` recording whether the module exists already.
+
+    It writes an instrumented module on the first call, and on the next
+    ones too if ``instrumented`` is true.
+    """
+
+    def cythonize(args: list[str]) -> None:
+        extension_path = Path(f"src/pkg/hot{EXT_SUFFIX}")
+        builds.append(extension_path.exists())
+        if builds[1:] and not instrumented:
+            extension_path.write_bytes(b"optimized")
+        else:
+            extension_path.write_bytes(b"__gcov_dump")
+
+    return cythonize
+
+
+def test_cythonize_with_pgo_removes_instrumented_modules(
+    pgo: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builds: list[bool] = []
+    monkeypatch.setattr(pgo, "_run_training_workload", lambda source_dir: None)
+    monkeypatch.setattr(pgo, "_check_profile_collected", lambda profile_dir: None)
+    monkeypatch.setattr(pgo, "_is_clang", lambda: False)
+    pgo.cythonize_with_pgo(fake_cythonize(builds, False), CYTHONIZE_ARGS)
+    # The optimized build does not find the instrumented module.
+    assert builds == [False, False]
+
+
+def test_cythonize_with_pgo_instrumented_result(
+    pgo: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builds: list[bool] = []
+    monkeypatch.setattr(pgo, "_run_training_workload", lambda source_dir: None)
+    monkeypatch.setattr(pgo, "_check_profile_collected", lambda profile_dir: None)
+    monkeypatch.setattr(pgo, "_is_clang", lambda: False)
+    with pytest.raises(RuntimeError, match="still instrumented"):
+        pgo.cythonize_with_pgo(fake_cythonize(builds, True), CYTHONIZE_ARGS)
+
+
+def test_cythonize_with_pgo_without_profile(
+    pgo: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builds: list[bool] = []
+    monkeypatch.setattr(pgo, "_run_training_workload", lambda source_dir: None)
+    with pytest.raises(RuntimeError, match="did not produce any profile data"):
+        pgo.cythonize_with_pgo(fake_cythonize(builds, False), CYTHONIZE_ARGS)
+    assert builds == [False]
@@ -0,0 +1,159 @@
+import pickle
+from typing import Any
+
+import pytest
+
+from propcache.api import (
+    BoundedCache,
+    CacheFreePickleMixin,
+    cache_free_state,
+    cached_property,
+    under_cached_property,
+)
+
+
+class URL(CacheFreePickleMixin):
+    def __init__(self, host: str) -> None:
+        self._cache: dict[str, Any] = {}
+        self.host = host
+
+    @under_cached_property
+    def origin(self) -> str:
+        return f"http://{self.host}"
+
+    @cached_property
+    def labels(self) -> list[str]:
+        return self.host.split(".")
+
+    @cached_property(cache_exceptions=True)
+    def port(self) -> int:
+        raise ValueError
+
+
+class CachedURL(URL, include_cache=True):
+    pass
+
+
+class SlotsURL(CacheFreePickleMixin):
+    __slots__ = ("_cache", "host")
+
+    def __init__(self, host: str) -> None:
+        self._cache = BoundedCache(maxsize=2)
+        self.host = host
+
+    @under_cached_property
+    def origin(self) -> str:
+        return f"http://{self.host}"
+
+
+class Custom:
+    def __init__(self, host: str) -> None:
+        self.host = host
+
+    @cached_property
+    def labels(self) -> list[str]:
+        return self.host.split(".")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Custom.__new__, (Custom,), cache_free_state(self))
+
+
+def fill(url: URL) -> None:
+    url.origin, url.labels
+    with pytest.raises(ValueError):
+        url.port
+
+
+def test_pickle_without_cache() -> None:
+    url = URL("example.com")
+    fill(url)
+    data = pickle.dumps(url)
+
+    restored = pickle.loads(data)
+    assert restored.__dict__ == {"_cache": {}, "host": "example.com"}
+    assert restored.origin == "http://example.com"
+    assert url._cache == {"origin": "http://example.com"}
+
+    cached_url = CachedURL("example.com")
+    fill(cached_url)
+    assert len(data) < len(pickle.dumps(cached_url))
+
+
+def test_pickle_include_cache() -> None:
+    url = CachedURL("example.com")
+    fill(url)
+    restored = pickle.loads(pickle.dumps(url))
+    assert restored._cache == {"origin": "http://example.com"}
+    assert restored.__dict__["labels"] == ["example", "com"]
+    with pytest.raises(ValueError):
+        restored.port
+
+
+def test_pickle_slots_without_cache() -> None:
+    url = SlotsURL("example.com")
+    assert url.origin == "http://example.com"
+    url._cache["other"] = 1
+
+    restored = pickle.loads(pickle.dumps(url))
+    assert restored.host == "example.com"
+    assert isinstance(restored._cache, BoundedCache)
+    assert restored._cache.maxsize == 2
+    assert dict(restored._cache) == {"other": 1}
+    assert url._cache == {"origin": "http://example.com", "other": 1}
+
+
+class PortSlotsURL(SlotsURL):
+    __slots__ = ("__port", "__weakref__")
+
+    def __init__(self, host: str, port: int) -> None:
+        super().__init__(host)
+        self.__port = port
+
+    @property
+    def port(self) -> int:
+        return self.__port
+
+
+def test_pickle_inherited_and_private_slots() -> None:
+    url = PortSlotsURL("example.com", 8080)
+    assert url.origin == "http://example.com"
+
+    assert cache_free_state(url) == (
+        None,
+        {"_PortSlotsURL__port": 8080, "_cache": {}, "host": "example.com"},
+    )
+    restored = pickle.loads(pickle.dumps(url))
+    assert restored.port == 8080
+    assert restored.host == "example.com"
+    assert dict(restored._cache) == {}
+
+
+def test_cache_free_state_in_reduce() -> None:
+    obj = Custom("example.com")
+    assert obj.labels == ["example", "com"]
+    assert cache_free_state(obj) == {"host": "example.com"}
+
+    restored = pickle.loads(pickle.dumps(obj))
+    assert restored.__dict__ == {"host": "example.com"}
+
+
+def _compute_origin(url: "AliasedURL") -> str:
+    return f"http://{url.host}"
+
+
+class AliasedURL(CacheFreePickleMixin):
+    def __init__(self, host: str) -> None:
+        self._cache: dict[str, Any] = {}
+        self.host = host
+
+    origin = under_cached_property(_compute_origin)
+
+
+def test_pickle_aliased_property_without_cache() -> None:
+    url = AliasedURL("example.com")
+    assert url.origin == "http://example.com"
+    assert url._cache == {"_compute_origin": "http://example.com"}
+
+    restored = pickle.loads(pickle.dumps(url))
+    assert restored._cache == {}
+    assert cache_free_state(url) == {"_cache": {}, "host": "example.com"}
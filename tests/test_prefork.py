@@ -0,0 +1,83 @@
+import gc
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from propcache.api import (
+    cached_property,
+    prefork_warm,
+    side_cached_property,
+    under_cached_property,
+    weak_cached_property,
+)
+
+
+class Config:
+    def __init__(self, size: int = 1) -> None:
+        self._cache: dict[str, Any] = {}
+        self.size = size
+
+    @cached_property
+    def rows(self) -> list[list[int]]:
+        return [[i] for i in range(self.size)]
+
+    @under_cached_property
+    def total(self) -> int:
+        return self.size
+
+    @side_cached_property
+    def side(self) -> int:
+        return -self.size
+
+    @weak_cached_property
+    def weak(self) -> set[int]:
+        return {self.size}
+
+
+class Derived(Config):
+    @under_cached_property
+    def total(self) -> int:
+        return 2 * self.size
+
+
+@pytest.fixture
+def unfreeze() -> Iterator[None]:
+    yield
+    if hasattr(gc, "unfreeze"):  # pragma: no branch
+        gc.unfreeze()
+
+
+@pytest.mark.usefixtures("unfreeze")
+def test_prefork_warm() -> None:
+    config, derived = Config(2), Derived(2)
+    prefork_warm([config, derived], freeze=False)
+    assert config.__dict__ == {
+        "_cache": {"total": 2},
+        "size": 2,
+        "rows": [[0], [1]],
+    }
+    assert derived._cache == {"total": 4}
+    assert "weak" not in config.__dict__
+
+
+@pytest.mark.skipif(hasattr(sys, "pypy_version_info"), reason="PyPy has no gc.freeze()")
+@pytest.mark.usefixtures("unfreeze")
+def test_prefork_warm_freeze() -> None:
+    config = Config(2)
+    prefork_warm([config], freeze=False)
+    assert gc.get_freeze_count() == 0
+    assert any(obj is config.rows for obj in gc.get_objects())
+
+    prefork_warm([config])
+    assert gc.get_freeze_count() > 0
+    # The collections skip the frozen objects, which are not listed.
+    assert not any(obj is config.rows for obj in gc.get_objects())
+
+
+def test_prefork_warm_without_gc_freeze(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delattr(gc, "freeze", raising=False)
+    config = Config(2)
+    prefork_warm([config])
+    assert config.rows == [[0], [1]]
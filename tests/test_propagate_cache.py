@@ -0,0 +1,159 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Protocol, TypeVar, overload
+
+from propcache.api import BoundedCache, cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    @overload
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> "cached_property[_T_co]": ...
+
+    @overload
+    def cached_property(
+        self,
+        *,
+        depends_on: Iterable[str] | None = None,
+        cache_exceptions: bool = False,
+    ) -> "cached_property[Any]": ...
+
+    @overload
+    def under_cached_property(
+        self, wrapped: Callable[[Any], _T_co]
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self,
+        *,
+        depends_on: Iterable[str] | None = None,
+        cache_exceptions: bool = False,
+    ) -> "under_cached_property[Any]": ...
+
+    def propagate_cache(
+        self,
+        src: object,
+        dst: object,
+        *,
+        changed: Iterable[str] = (),
+        names: Iterable[str] | None = None,
+    ) -> None: ...
+
+
+def make_url_class(propcache_module: APIProtocol) -> type[Any]:
+    class URL:
+        def __init__(self, host: str, path: str, fragment: str) -> None:
+            self._cache: dict[str, Any] = {}
+            self.host = host
+            self.path = path
+            self.fragment = fragment
+
+        @propcache_module.under_cached_property(depends_on=("host",))
+        def origin(self) -> str:
+            return f"http://{self.host}"
+
+        @propcache_module.cached_property(depends_on=("host", "path"))
+        def base(self) -> str:
+            return f"http://{self.host}{self.path}"
+
+        @propcache_module.under_cached_property
+        def full(self) -> str:
+            return f"http://{self.host}{self.path}#{self.fragment}"
+
+        def with_fragment(self, fragment: str) -> "URL":
+            url = URL(self.host, self.path, fragment)
+            propcache_module.propagate_cache(self, url, changed=("fragment",))
+            return url
+
+    return URL
+
+
+def test_propagate_cache(propcache_module: APIProtocol) -> None:
+    URL = make_url_class(propcache_module)
+    url = URL("example.com", "/path", "a")
+    assert (url.origin, url.base, url.full) == (
+        "http://example.com",
+        "http://example.com/path",
+        "http://example.com/path#a",
+    )
+
+    clone = URL("example.com", "/path", "a")
+    propcache_module.propagate_cache(url, clone)
+    assert clone._cache == url._cache
+    assert clone.__dict__["base"] == "http://example.com/path"
+
+
+def test_propagate_cache_changed(propcache_module: APIProtocol) -> None:
+    URL = make_url_class(propcache_module)
+    url = URL("example.com", "/path", "a")
+    url.origin, url.base, url.full
+
+    derived = url.with_fragment("b")
+    assert derived._cache == {"origin": "http://example.com"}
+    assert derived.__dict__["base"] == "http://example.com/path"
+    assert derived.full == "http://example.com/path#b"
+
+    other = URL("example.org", "/path", "a")
+    propcache_module.propagate_cache(url, other, changed=("host",))
+    assert other._cache == {}
+    assert "base" not in other.__dict__
+
+
+def test_propagate_cache_names(propcache_module: APIProtocol) -> None:
+    URL = make_url_class(propcache_module)
+    url = URL("example.com", "/path", "a")
+    url.origin, url.base, url.full
+
+    other = URL("example.com", "/path", "a")
+    propcache_module.propagate_cache(url, other, names=("base", "full"))
+    assert other._cache == {"full": "http://example.com/path#a"}
+    assert other.__dict__["base"] == "http://example.com/path"
+
+
+def test_propagate_cache_skips_cached_exceptions(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache = BoundedCache(maxsize=4)
+
+        @propcache_module.under_cached_property(cache_exceptions=True)
+        def failing(self) -> int:
+            raise ValueError
+
+        @propcache_module.cached_property(cache_exceptions=True)
+        def failing_dict(self) -> int:
+            raise ValueError
+
+    a, b = A(), A()
+    for name in ("failing", "failing_dict"):
+        try:
+            getattr(a, name)
+        except ValueError:
+            pass
+    propcache_module.propagate_cache(a, b)
+    assert not b._cache
+    assert list(b.__dict__) == ["_cache"]
+
+
+def test_propagate_cache_subclass_override(propcache_module: APIProtocol) -> None:
+    class Base:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property(depends_on=())
+        def prop(self) -> int:
+            return 1
+
+    class Derived(Base):
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            return 2
+
+    a, b = Derived(), Derived()
+    assert a.prop == 2
+    propcache_module.propagate_cache(a, b, changed=("other",))
+    assert b._cache == {}
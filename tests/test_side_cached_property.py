@@ -0,0 +1,172 @@
+import gc
+import sys
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import side_cached_property
+
+if sys.version_info >= (3, 11):
+    from typing import assert_type
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def side_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> side_cached_property[_T_co]: ...
+
+
+def test_side_cached_property(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return 1
+
+    a = A()
+    if sys.version_info >= (3, 11):
+        assert_type(a.prop, int)
+    assert a.prop == 1
+    assert a.prop == 1
+    assert calls == 1
+
+
+def test_side_cached_property_per_instance(propcache_module: APIProtocol) -> None:
+    class A:
+        __slots__ = ("__weakref__", "value")
+
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+        @propcache_module.side_cached_property
+        def prop(self) -> int:
+            return self.value
+
+    a, b = A(1), A(2)
+    assert a.prop == 1
+    assert b.prop == 2
+
+
+def test_side_cached_property_released_with_instance(
+    propcache_module: APIProtocol,
+) -> None:
+    class Value:
+        pass
+
+    class A:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> Value:
+            return Value()
+
+    a = A()
+    value_ref = weakref.ref(a.prop)
+    assert value_ref() is not None
+
+    del a
+    gc.collect()
+    assert value_ref() is None
+
+
+class Resource:
+    """A value recording whether it was finalized."""
+
+    def __init__(self, finalized: list[str]) -> None:
+        self.finalized = finalized
+
+    def __del__(self) -> None:
+        self.finalized.append("finalized")
+
+
+def test_side_cached_property_survives_collection(
+    propcache_module: APIProtocol,
+) -> None:
+    finalized: list[str] = []
+
+    class A:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> Resource:
+            return Resource(finalized)
+
+    a = A()
+    prop = weakref.WeakSet([a.prop])
+    gc.collect()
+    # The collector sees the values of the live instances as reachable.
+    assert list(prop) == [a.prop]
+    assert finalized == []
+    assert gc.get_referrers(a.prop)
+    del a
+    assert finalized == ["finalized"]
+
+
+def test_side_cached_property_delete(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+    a = A()
+    del a.prop
+    assert a.prop == 1
+    del a.prop
+    assert a.prop == 2
+
+
+def test_side_cached_property_assignment(propcache_module: APIProtocol) -> None:
+    class A:
+        __slots__ = ("__weakref__",)
+
+        @propcache_module.side_cached_property
+        def prop(self) -> None:
+            """Mock property."""
+
+    a = A()
+
+    with pytest.raises(AttributeError):
+        a.prop = None
+
+
+def test_side_cached_property_without_weakref(propcache_module: APIProtocol) -> None:
+    class A:
+        __slots__ = ()
+
+        @propcache_module.side_cached_property
+        def prop(self) -> None:
+            """Mock property."""
+
+    a = A()
+
+    with pytest.raises(TypeError):
+        a.prop
+
+
+def test_side_cached_property_class_docstring(propcache_module: APIProtocol) -> None:
+    class A:
+        @propcache_module.side_cached_property
+        def prop(self) -> None:
+            """Docstring."""
+
+    if TYPE_CHECKING:
+        assert isinstance(A.prop, side_cached_property)
+    else:
+        assert isinstance(A.prop, propcache_module.side_cached_property)
+    assert "Docstring." == A.prop.__doc__
+    assert A.prop.wrapped(A()) is None
@@ -0,0 +1,110 @@
+import multiprocessing
+import pickle
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from propcache.api import (
+    CacheSnapshot,
+    cached_property,
+    under_cached_property,
+    weak_cached_property,
+)
+
+CALLS: list[str] = []
+
+
+class Config:
+    def __init__(self, name: str) -> None:
+        self._cache: dict[str, Any] = {}
+        self.name = name
+
+    @under_cached_property
+    def parsed(self) -> list[str]:
+        CALLS.append("parsed")
+        return self.name.split("-")
+
+    @cached_property
+    def upper(self) -> str:
+        CALLS.append("upper")
+        return self.name.upper()
+
+    @weak_cached_property
+    def weak(self) -> set[str]:
+        return {self.name}
+
+
+@pytest.fixture
+def snapshot() -> Iterator[CacheSnapshot]:
+    config = Config("a-b")
+    config.parsed, config.upper, config.weak
+    snapshot = CacheSnapshot.create({"a-b": config, "empty": Config("c")})
+    yield snapshot
+    snapshot.close()
+    snapshot.unlink()
+
+
+def restore_in_worker(snapshot: CacheSnapshot) -> tuple[list[str], list[str], str]:
+    config = Config("a-b")
+    assert snapshot.restore("a-b", config)
+    result = config.parsed, config.upper
+    snapshot.close()
+    return result[0], CALLS, result[1]
+
+
+def test_snapshot_restore(snapshot: CacheSnapshot) -> None:
+    CALLS.clear()
+    attached = CacheSnapshot.attach(snapshot.name)
+    assert len(attached) == 2
+    assert "a-b" in attached
+    assert "missing" not in attached
+
+    config = Config("a-b")
+    assert attached.restore("a-b", config)
+    assert config._cache == {"parsed": ["a", "b"]}
+    assert config.__dict__["upper"] == "A-B"
+    assert "weak" not in config.__dict__
+    assert config.parsed == ["a", "b"]
+    assert config.upper == "A-B"
+    assert CALLS == []
+    attached.close()
+
+
+def test_snapshot_keeps_cached_values(snapshot: CacheSnapshot) -> None:
+    config = Config("a-b")
+    config._cache["parsed"] = ["kept"]
+    assert snapshot.restore("a-b", config)
+    assert config.parsed == ["kept"]
+    assert config.upper == "A-B"
+
+
+def test_snapshot_missing_and_empty(snapshot: CacheSnapshot) -> None:
+    config = Config("c")
+    assert not snapshot.restore("missing", config)
+    assert snapshot.restore("empty", config)
+    assert config.__dict__ == {"_cache": {}, "name": "c"}
+
+
+def test_snapshot_in_spawned_process(snapshot: CacheSnapshot) -> None:
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        parsed, calls, upper = pool.apply(restore_in_worker, (snapshot,))
+    assert (parsed, calls, upper) == (["a", "b"], [], "A-B")
+
+
+def test_snapshot_pickles_by_name(snapshot: CacheSnapshot) -> None:
+    attached = pickle.loads(pickle.dumps(snapshot))
+    assert attached.name == snapshot.name
+    with attached:
+        assert len(attached) == 2
+
+
+def test_snapshot_unlinked_by_owner() -> None:
+    with CacheSnapshot.create({"c": Config("c")}) as snapshot:
+        with CacheSnapshot.attach(snapshot.name) as attached:
+            assert len(attached) == 1
+        # Leaving the block of an attached snapshot only closes it.
+        with CacheSnapshot.attach(snapshot.name) as attached:
+            assert len(attached) == 1
+    with pytest.raises(FileNotFoundError):
+        CacheSnapshot.attach(snapshot.name)
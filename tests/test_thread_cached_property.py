@@ -0,0 +1,196 @@
+import copy
+import gc
+import pickle
+import threading
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import CacheFreePickleMixin, thread_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def thread_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> thread_cached_property[_T_co]: ...
+
+
+class Buffer:
+    """A value that must not be shared between threads."""
+
+
+def make_class(propcache_module: APIProtocol, calls: list[str]) -> type[Any]:
+    class Parser:
+        @propcache_module.thread_cached_property
+        def buffer(self) -> Buffer:
+            """Return the buffer of the current thread."""
+            calls.append(threading.current_thread().name)
+            return Buffer()
+
+    return Parser
+
+
+def run_in_thread(name: str, func: Callable[[], Any]) -> Any:
+    """Call ``func`` in a new thread named ``name`` and return its result."""
+    results = []
+    thread = threading.Thread(target=lambda: results.append(func()), name=name)
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+def test_thread_cached_property(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Parser = make_class(propcache_module, calls)
+    if TYPE_CHECKING:
+        assert isinstance(Parser.buffer, thread_cached_property)
+    else:
+        assert isinstance(Parser.buffer, propcache_module.thread_cached_property)
+    assert Parser.buffer.__doc__ == "Return the buffer of the current thread."
+
+    parser = Parser()
+    buffer = parser.buffer
+    assert parser.buffer is buffer
+    first, second = run_in_thread("first", lambda: (parser.buffer, parser.buffer))
+    assert first is second
+    assert first is not buffer
+    assert run_in_thread("second", lambda: parser.buffer) is not buffer
+    assert parser.buffer is buffer
+    assert calls == ["MainThread", "first", "second"]
+
+
+def test_thread_cached_property_concurrent(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    barrier = threading.Barrier(4)
+    buffers: dict[str, set[int]] = {}
+
+    def read() -> None:
+        barrier.wait()
+        name = threading.current_thread().name
+        buffers[name] = {id(parser.buffer) for _ in range(1000)}
+
+    threads = [threading.Thread(target=read, name=str(i)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(calls) == ["0", "1", "2", "3"]
+    assert all(len(ids) == 1 for ids in buffers.values())
+
+
+def test_thread_cached_property_released_on_thread_exit(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    ref = run_in_thread("worker", lambda: weakref.ref(parser.buffer))
+    gc.collect()
+    assert ref() is None
+
+
+def test_thread_cached_property_released_with_instance(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    ref = weakref.ref(parser.buffer)
+    del parser
+    gc.collect()
+    assert ref() is None
+
+
+def test_thread_cached_property_delete(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    del parser.buffer
+    buffer = parser.buffer
+    other = run_in_thread("other", lambda: parser.buffer)
+    del parser.buffer
+    assert parser.buffer is not buffer
+    assert calls == ["MainThread", "other", "MainThread"]
+    assert run_in_thread("other", lambda: parser.buffer) is not other
+
+
+def test_thread_cached_property_read_only(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    with pytest.raises(AttributeError, match="read-only"):
+        parser.buffer = Buffer()
+
+
+def test_thread_cached_property_copy(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    buffer = parser.buffer
+    shallow_copy = copy.copy(parser)
+    assert isinstance(shallow_copy.buffer, Buffer)
+    assert shallow_copy.buffer is not buffer
+    del shallow_copy.buffer
+    assert parser.buffer is buffer
+    parser_copy = copy.deepcopy(parser)
+    assert isinstance(parser_copy.buffer, Buffer)
+    assert parser_copy.buffer is not buffer
+    assert parser.buffer is buffer
+    assert calls == ["MainThread", "MainThread", "MainThread"]
+
+
+def test_thread_cached_property_copy_before_read(
+    propcache_module: APIProtocol,
+) -> None:
+    calls: list[str] = []
+    parser = make_class(propcache_module, calls)()
+    buffer = parser.buffer
+    shallow_copy = copy.copy(parser)
+    # Deleting from a copy that never read the value leaves the original's.
+    del shallow_copy.buffer
+    assert parser.buffer is buffer
+    assert calls == ["MainThread"]
+
+
+class Reader(CacheFreePickleMixin):
+    @thread_cached_property
+    def buffer(self) -> Buffer:
+        return Buffer()
+
+
+def test_thread_cached_property_pickle() -> None:
+    reader = Reader()
+    buffer = reader.buffer
+    reader_copy = pickle.loads(pickle.dumps(reader))
+    assert reader_copy.__dict__ == {}
+    assert reader_copy.buffer is not buffer
+
+
+class Cursor:
+    @thread_cached_property
+    def buffer(self) -> Buffer:
+        return Buffer()
+
+
+def test_thread_cached_property_pickle_values_left_out() -> None:
+    cursor = Cursor()
+    buffer = cursor.buffer
+    cursor_copy = pickle.loads(pickle.dumps(cursor))
+    assert cursor_copy.buffer is not buffer
+
+
+def test_thread_cached_property_copy_without_weakref(
+    propcache_module: APIProtocol,
+) -> None:
+    class Parser:
+        __slots__ = ("__dict__",)
+
+        @propcache_module.thread_cached_property
+        def buffer(self) -> Buffer:
+            return Buffer()
+
+    parser = Parser()
+    buffer = parser.buffer
+    assert parser.buffer is buffer
+    assert copy.copy(parser).buffer is not buffer
+    assert parser.buffer is buffer
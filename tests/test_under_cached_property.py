@@ -1,7 +1,7 @@
 import gc
 import sys
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeVar, overload
 
 import pytest
 
@@ -16,9 +16,15 @@ _T_co = TypeVar("_T_co", covariant=True)
 
 
 class APIProtocol(Protocol):
+    @overload
     def under_cached_property(
         self, func: Callable[[Any], _T_co]
-    ) -> under_cached_property[_T_co]: ...
+    ) -> "under_cached_property[_T_co]": ...
+
+    @overload
+    def under_cached_property(
+        self, *, writable: bool
+    ) -> "under_cached_property[Any]": ...
 
 
 def test_under_cached_property(propcache_module: APIProtocol) -> None:
@@ -86,6 +92,52 @@ def test_under_cached_property_assignment(propcache_module: APIProtocol) -> None
         a.prop = 123  # type: ignore[assignment]
 
 
+def test_under_cached_property_deletion(propcache_module: APIProtocol) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> None:
+            """Mock property."""
+
+    a = A()
+
+    with pytest.raises(AttributeError):
+        del a.prop
+
+
+def test_under_cached_property_writable(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        __slots__ = ("_cache",)
+
+        @propcache_module.under_cached_property(writable=True)
+        def prop(self) -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        def __init__(self, prop: int | None = None) -> None:
+            self._cache: dict[str, int] = {}
+            if prop is not None:
+                self.prop = prop
+
+    a = A(10)
+    assert a._cache == {"prop": 10}
+    assert a.prop == 10
+    assert calls == 0
+
+    del a.prop
+    assert a._cache == {}
+    del a.prop
+    assert a.prop == 1
+    a.prop = 5
+    assert a.prop == 5
+    assert calls == 1
+
+
 def test_under_cached_property_without_cache(propcache_module: APIProtocol) -> None:
     class A:
         def __init__(self) -> None:
@@ -250,3 +302,58 @@ def test_under_cached_property_no_refcount_leak(propcache_module: APIProtocol) -
     # - original in `result`
     # - new one in `result4`
     assert count_sentinels() == initial_sentinel_count + 2
+
+
+def test_under_cached_property_slots(propcache_module: APIProtocol) -> None:
+    """Test the cache is found in a slot, also after the class changes."""
+
+    class A:
+        __slots__ = ("_cache",)
+
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            return 1
+
+    class B(A):
+        __slots__ = ("other",)
+
+    a = A()
+    assert a.prop == 1
+    assert a._cache == {"prop": 1}
+    b = B()
+    assert b.prop == 1
+    assert b._cache == {"prop": 1}
+
+    del a._cache
+    with pytest.raises(AttributeError):
+        _ = a.prop
+
+    a = A()
+    b = B()
+    replacement_cache = {"prop": 2}
+    setattr(A, "_cache", property(lambda self: replacement_cache))
+    assert a.prop == 2
+    assert b.prop == 2
+
+
+def test_under_cached_property_slots_and_dict(propcache_module: APIProtocol) -> None:
+    """Test the cache is found for slotted and dict-backed owners alike."""
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, int] = {}
+
+        @propcache_module.under_cached_property
+        def prop(self) -> int:
+            return 1
+
+    class B(A):
+        __slots__ = ("_cache",)
+
+    for cls in (B, A, B, A):
+        inst = cls()
+        assert inst.prop == 1
+        assert inst._cache == {"prop": 1}
@@ -0,0 +1,124 @@
+import gc
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import cached_property, under_cached_property
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> cached_property[_T_co]: ...
+
+    def under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> under_cached_property[_T_co]: ...
+
+    def warm(
+        self,
+        inst: object,
+        names: Iterable[str] | None = None,
+        *,
+        executor: Executor | None = None,
+    ) -> None: ...
+
+
+def make_class(propcache_module: APIProtocol, calls: list[str]) -> type[Any]:
+    class Base:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.under_cached_property
+        def under(self) -> str:
+            calls.append("under")
+            return threading.current_thread().name
+
+        @propcache_module.cached_property
+        def base(self) -> str:
+            calls.append("base")
+            return threading.current_thread().name
+
+    class A(Base):
+        @propcache_module.cached_property
+        def base(self) -> str:
+            calls.append("overridden")
+            return threading.current_thread().name
+
+        @propcache_module.cached_property
+        def other(self) -> str:
+            calls.append("other")
+            return threading.current_thread().name
+
+    return A
+
+
+def test_warm(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    A = make_class(propcache_module, calls)
+    a = A()
+    a.other
+    propcache_module.warm(a)
+    assert sorted(calls) == ["other", "overridden", "under"]
+    assert set(a._cache) == {"under"}
+    assert {"base", "other"} <= set(a.__dict__)
+
+    propcache_module.warm(a)
+    propcache_module.warm(A())
+    assert len(calls) == 6
+
+
+def test_warm_names(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    a = make_class(propcache_module, calls)()
+    propcache_module.warm(a, ["under", "missing"])
+    assert calls == ["under"]
+    assert "base" not in a.__dict__
+
+
+def test_warm_executor(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    a = make_class(propcache_module, calls)()
+    a.other
+    with ThreadPoolExecutor(2, thread_name_prefix="warm") as executor:
+        propcache_module.warm(a, executor=executor)
+    assert sorted(calls) == ["other", "overridden", "under"]
+    assert a.under.startswith("warm")
+    assert a.base.startswith("warm")
+    assert not a.other.startswith("warm")
+
+
+def test_warm_error(propcache_module: APIProtocol) -> None:
+    class A:
+        @propcache_module.cached_property
+        def prop(self) -> int:
+            raise ValueError
+
+    with pytest.raises(ValueError):
+        propcache_module.warm(A())
+    with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError):
+        propcache_module.warm(A(), executor=executor)
+
+
+def test_warm_class_collected(propcache_module: APIProtocol) -> None:
+    calls: list[str] = []
+    Base = make_class(propcache_module, calls)
+
+    class A(Base):  # type: ignore[valid-type, misc]
+        @propcache_module.cached_property
+        def other(self) -> str:
+            return f"sub {super().other}"
+
+    a = A()
+    propcache_module.warm(a)
+    assert a.other == "sub MainThread"
+    class_ref = weakref.ref(A)
+    del A, a
+    gc.collect()
+    assert class_ref() is None
@@ -0,0 +1,137 @@
+import gc
+import sys
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import weak_cached_property
+
+if sys.version_info >= (3, 11):
+    from typing import assert_type
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def weak_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> weak_cached_property[_T_co]: ...
+
+
+class Value:
+    """A value supporting weak references."""
+
+
+def test_weak_cached_property(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> Value:
+            nonlocal calls
+            calls += 1
+            return Value()
+
+    a = A()
+    value = a.prop
+    if sys.version_info >= (3, 11):
+        assert_type(a.prop, Value)
+    assert a.prop is value
+    assert calls == 1
+    assert isinstance(a.__dict__["prop"], weakref.ref)
+
+
+def test_weak_cached_property_recompute_when_collected(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> Value:
+            nonlocal calls
+            calls += 1
+            return Value()
+
+    a = A()
+    value_ref = weakref.ref(a.prop)
+    gc.collect()
+    assert value_ref() is None
+
+    assert a.prop is not None
+    assert calls == 2
+
+
+def test_weak_cached_property_strong_fallback(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> int:
+            return 1
+
+    a = A()
+    assert a.prop == 1
+    assert a.__dict__ == {"prop": 1}
+
+
+def test_weak_cached_property_assignment(propcache_module: APIProtocol) -> None:
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> Value:
+            raise NotImplementedError
+
+    a = A()
+    value = Value()
+    a.prop = value
+    assert a.prop is value
+    assert isinstance(a.__dict__["prop"], weakref.ref)
+
+
+def test_weak_cached_property_delete(propcache_module: APIProtocol) -> None:
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> int:
+            return 1
+
+    a = A()
+    with pytest.raises(AttributeError):
+        del a.prop
+
+    assert a.prop == 1
+    del a.prop
+    assert "prop" not in a.__dict__
+
+
+def test_weak_cached_property_without_set_name(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        pass
+
+    def prop(self: A) -> int:
+        """Mock property."""
+        return 1
+
+    descriptor = propcache_module.weak_cached_property(prop)
+
+    with pytest.raises(TypeError, match="without calling __set_name__"):
+        descriptor.__get__(A(), A)
+
+
+def test_weak_cached_property_class_docstring(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        @propcache_module.weak_cached_property
+        def prop(self) -> None:
+            """Docstring."""
+
+    if TYPE_CHECKING:
+        assert isinstance(A.prop, weak_cached_property)
+    else:
+        assert isinstance(A.prop, propcache_module.weak_cached_property)
+    assert "Docstring." == A.prop.__doc__
+    assert A.prop.func(A()) is None
@@ -0,0 +1,146 @@
+import gc
+import sys
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import pytest
+
+from propcache.api import weak_under_cached_property
+
+if sys.version_info >= (3, 11):
+    from typing import assert_type
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+
+class APIProtocol(Protocol):
+    def weak_under_cached_property(
+        self, func: Callable[[Any], _T_co]
+    ) -> weak_under_cached_property[_T_co]: ...
+
+
+class Value:
+    """A value supporting weak references."""
+
+
+def test_weak_under_cached_property(propcache_module: APIProtocol) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> Value:
+            nonlocal calls
+            calls += 1
+            return Value()
+
+    a = A()
+    value = a.prop
+    if sys.version_info >= (3, 11):
+        assert_type(a.prop, Value)
+    assert a.prop is value
+    assert calls == 1
+    assert isinstance(a._cache["prop"], weakref.ref)
+
+
+def test_weak_under_cached_property_recompute_when_collected(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> Value:
+            nonlocal calls
+            calls += 1
+            return Value()
+
+    a = A()
+    value_ref = weakref.ref(a.prop)
+    gc.collect()
+    assert value_ref() is None
+
+    assert a.prop is not None
+    assert calls == 2
+
+
+def test_weak_under_cached_property_strong_fallback(
+    propcache_module: APIProtocol,
+) -> None:
+    calls = 0
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> tuple[int, ...]:
+            nonlocal calls
+            calls += 1
+            return tuple(range(10))
+
+    a = A()
+    assert a.prop == tuple(range(10))
+    gc.collect()
+    assert a.prop == tuple(range(10))
+    assert calls == 1
+    assert a._cache == {"prop": tuple(range(10))}
+
+
+def test_weak_under_cached_property_weakref_value(
+    propcache_module: APIProtocol,
+) -> None:
+    """Test a cached weak reference is returned as it is."""
+    value = Value()
+    value_ref = weakref.ref(value)
+
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> "weakref.ref[Value]":
+            return value_ref
+
+    a = A()
+    assert a.prop is value_ref
+    assert a.prop is value_ref
+
+
+def test_weak_under_cached_property_assignment(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        def __init__(self) -> None:
+            self._cache: dict[str, Any] = {}
+
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> None:
+            """Mock property."""
+
+    a = A()
+
+    with pytest.raises(AttributeError):
+        a.prop = None
+
+
+def test_weak_under_cached_property_class_docstring(
+    propcache_module: APIProtocol,
+) -> None:
+    class A:
+        @propcache_module.weak_under_cached_property
+        def prop(self) -> None:
+            """Docstring."""
+
+    if TYPE_CHECKING:
+        assert isinstance(A.prop, weak_under_cached_property)
+    else:
+        assert isinstance(A.prop, propcache_module.weak_under_cached_property)
+    assert "Docstring." == A.prop.__doc__
+    assert A.prop.wrapped(A()) is None